@@ -0,0 +1,356 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Benchmarks — Scaled Thermal Unit-Commitment Cases
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Generators of the scaled DESSEM cases used by the benchmark drivers of
+this directory, and the measurements they share. Every case is derived
+from ``examples/DESSEM/trabalho01_caso02.yaml`` (thermal-only, 24 h) with
+a seeded random generator, so a driver run with the same arguments
+rebuilds the same instances.
+
+Functions
+---------
+load_case(path)
+    Read a case file.
+write_case(root, directory, name)
+    Write a case file and return its path.
+scaled_uc_case(units, horizon, seed, su_sd)
+    Random fleet of ``units`` thermal units over ``horizon`` hours.
+with_pwl_costs(root, segments, c, convex)
+    Replace the linear costs of a case with piecewise-linear curves.
+identical_fleet_case(types, copies, horizon, flexible)
+    Fleet of identical copies of caso02 units.
+model_stats(m)
+    Active rows, linear nonzeros and integer variables of a model.
+relaxation_bound(m, solver, options)
+    Objective of the continuous relaxation of a model.
+timed_solve(m, solver, options)
+    Solve a model and return the wall time and termination condition.
+
+Notes
+-----
+- The drivers import the installed package (``pip install -e .``) and
+  are run from the repository root, e.g.
+  ``python benchmarks/bench_uc_formulation.py``.
+- Quadratic costs are dropped (``c = 0``) unless a driver needs them, so
+  the cases are MILPs that HiGHS solves.
+
+References
+----------
+[1] CEPEL, DESSEM. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+import copy
+import math
+import os
+import random
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+from pyomo.environ import Constraint, TransformationFactory, Var, value
+from pyomo.repn.standard_repn import generate_standard_repn
+
+from NaivePyDESSEM.SolverSession import get_solver_session
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE_CASE = os.path.join(ROOT, "examples", "DESSEM", "trabalho01_caso02.yaml")
+
+
+def load_case(path: str = BASE_CASE) -> Dict[str, Any]:
+    """
+    Read a case file.
+
+    Parameters
+    ----------
+    path : str, optional
+        Case file. Default is the DESSEM trabalho01 caso02 example.
+
+    Returns
+    -------
+    dict
+        Parsed case.
+    """
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def write_case(root: Dict[str, Any], directory: str, name: str) -> str:
+    """
+    Write a case file and return its path.
+
+    Parameters
+    ----------
+    root : dict
+        Case to write.
+    directory : str
+        Output directory, created if missing.
+    name : str
+        File name without extension.
+
+    Returns
+    -------
+    str
+        Path of the written ``.yaml`` file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(root, f, sort_keys=False, allow_unicode=True)
+    return path
+
+
+def _daily_profile(horizon: int, low: float, high: float) -> list:
+    """
+    Hourly load profile between ``low`` and ``high`` (peak mid-afternoon),
+    with the weekdays above the weekend.
+    """
+    demand = []
+    for t in range(horizon):
+        hour, day = t % 24, t // 24
+        shape = 0.5 - 0.5 * math.cos(2.0 * math.pi * (hour - 3) / 24.0)
+        weekday = 1.0 if day % 7 < 5 else 0.85
+        demand.append(round((low + (high - low) * shape) * weekday, 1))
+    return demand
+
+
+def scaled_uc_case(units: int = 12,
+                   horizon: int = 168,
+                   seed: int = 0,
+                   su_sd: bool = False) -> Dict[str, Any]:
+    """
+    Random fleet of ``units`` thermal units over ``horizon`` hours.
+
+    The units take the capacities of the caso02 units and draw the
+    minimum output (30-50 % of ``Pmax``), ramps, start-up and no-load
+    costs, linear costs, minimum up/down times (3-24 h) and initial state.
+    The demand follows a daily profile between 25 % and 65 % of the fleet
+    capacity.
+
+    Parameters
+    ----------
+    units : int, optional
+        Number of thermal units. Default is 12.
+    horizon : int, optional
+        Number of hourly periods. Default is 168.
+    seed : int, optional
+        Seed of the random generator. Default is 0.
+    su_sd : bool, optional
+        Give every unit start-up/shut-down ramp limits
+        ``SU = SD = Pmin + 0.3 (Pmax - Pmin)``. Default is False
+        (``Pmax``).
+
+    Returns
+    -------
+    dict
+        Case ready for :func:`write_case`.
+    """
+    rng = random.Random(seed)
+    root = load_case()
+    root["meta"].update({"name": f"UC-{units}x{horizon}-seed{seed}",
+                         "horizon": horizon,
+                         "Solver": "highs",
+                         "Solver_Options": {}})
+    templates = list(root["thermal"]["units"].values())
+
+    fleet = {}
+    for i in range(units):
+        Pmax = float(templates[i % len(templates)]["Pmax"])
+        Pmin = round(Pmax * rng.uniform(0.3, 0.5), 1)
+        t_up, t_down = rng.randint(3, 24), rng.randint(3, 24)
+        online = rng.random() < 0.5
+        unit = {"Pmin": Pmin,
+                "Pmax": Pmax,
+                "RU": round(Pmax * rng.uniform(0.3, 0.6), 1),
+                "RD": round(Pmax * rng.uniform(0.3, 0.6), 1),
+                "a": round(rng.uniform(200.0, 1000.0), 1),
+                "b": round(rng.uniform(15.0, 37.0), 2),
+                "c": 0.0,
+                "SC": round(rng.uniform(500.0, 8000.0), 1),
+                "t_up": t_up,
+                "t_down": t_down,
+                "init_status_h": t_up if online else -t_down,
+                "u0": int(online),
+                "p0": Pmin if online else 0.0}
+        if su_sd:
+            unit["SU"] = unit["SD"] = round(Pmin + 0.3 * (Pmax - Pmin), 1)
+        fleet[f"UT_{i + 1}"] = unit
+    root["thermal"]["units"] = fleet
+
+    capacity = sum(u["Pmax"] for u in fleet.values())
+    root["meta"]["demand"] = _daily_profile(horizon, 0.25 * capacity, 0.65 * capacity)
+    return root
+
+
+def with_pwl_costs(root: Dict[str, Any],
+                   segments: int = 3,
+                   c: float = 5e-4,
+                   convex: bool = True) -> Dict[str, Any]:
+    """
+    Replace the linear costs of a case with piecewise-linear curves.
+
+    Each unit gets ``thermal.cost_model: pwl`` and the curve of
+    ``b p + c p²`` sampled at ``0``, ``Pmin`` and ``segments`` equal steps
+    up to ``Pmax``. A non-convex curve has the cost of its second-to-last
+    breakpoint raised by 30 % of the last step.
+
+    Parameters
+    ----------
+    root : dict
+        Case, modified in place.
+    segments : int, optional
+        Segments between ``Pmin`` and ``Pmax``. Default is 3.
+    c : float, optional
+        Quadratic coefficient of the sampled curve. Default is 5e-4.
+    convex : bool, optional
+        Keep the sampled (convex) curves. Default is True.
+
+    Returns
+    -------
+    dict
+        The modified case.
+    """
+    root["thermal"]["cost_model"] = "pwl"
+    for unit in root["thermal"]["units"].values():
+        Pmin, Pmax, b = unit["Pmin"], unit["Pmax"], unit["b"]
+        step = (Pmax - Pmin) / segments
+        breaks = [0.0] + [round(Pmin + k * step, 3) for k in range(segments + 1)]
+        costs = [round(b * x + c * x * x, 3) for x in breaks]
+        if not convex:
+            costs[-2] = round(costs[-2] + 0.3 * (costs[-1] - costs[-2]), 3)
+        unit["pw_breaks"], unit["pw_costs"] = breaks, costs
+    return root
+
+
+def identical_fleet_case(types: Tuple[str, ...] = ("UT_1", "UT_3", "UT_5", "UT_6", "UT_8"),
+                         copies: int = 4,
+                         horizon: int = 24,
+                         flexible: bool = False) -> Dict[str, Any]:
+    """
+    Fleet of identical copies of caso02 units.
+
+    Every unit of ``types`` is repeated ``copies`` times with ``c = 0``.
+    The demand follows a daily profile between 30 % and 80 % of the fleet
+    capacity, 5 % higher on every other day.
+
+    Parameters
+    ----------
+    types : tuple of str, optional
+        caso02 units to copy.
+    copies : int, optional
+        Copies of each unit. Default is 4.
+    horizon : int, optional
+        Number of hourly periods. Default is 24.
+    flexible : bool, optional
+        Drop the minimum up/down times and the ramp limits of the copies
+        (``t_up = t_down = 1``, ``RU = RD = Pmax``), so that their groups
+        can be ordered period by period. Default is False.
+
+    Returns
+    -------
+    dict
+        Case ready for :func:`write_case`.
+    """
+    root = load_case()
+    root["meta"].update({"name": f"Identical-{len(types)}x{copies}x{horizon}",
+                         "horizon": horizon,
+                         "Solver": "highs",
+                         "Solver_Options": {}})
+    templates = root["thermal"]["units"]
+
+    fleet = {}
+    for name in types:
+        unit = dict(templates[name], c=0.0)
+        if flexible:
+            unit.update({"t_up": 1, "t_down": 1, "RU": unit["Pmax"], "RD": unit["Pmax"],
+                         "init_status_h": 1 if unit["u0"] else -1})
+        for i in range(copies):
+            fleet[f"{name}_{i + 1}"] = dict(unit)
+    root["thermal"]["units"] = fleet
+
+    capacity = sum(u["Pmax"] for u in fleet.values())
+    demand = _daily_profile(horizon, 0.3 * capacity, 0.8 * capacity)
+    root["meta"]["demand"] = [round(d * (1.05 if (t // 24) % 2 else 1.0), 1)
+                              for t, d in enumerate(demand)]
+    return root
+
+
+def model_stats(m) -> Tuple[int, int, int]:
+    """
+    Active rows, linear nonzeros and integer variables of a model.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Built model.
+
+    Returns
+    -------
+    tuple of int
+        ``(rows, nnz, ints)``.
+    """
+    rows = nnz = 0
+    for constraint in m.component_data_objects(Constraint, active=True):
+        rows += 1
+        nnz += len(generate_standard_repn(constraint.body, quadratic=False).linear_vars)
+    ints = sum(1 for v in m.component_data_objects(Var) if v.is_integer())
+    return rows, nnz, ints
+
+
+def relaxation_bound(m, solver: str = "highs",
+                     options: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Objective of the continuous relaxation of a model.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Built model; it is cloned, not modified.
+    solver : str, optional
+        Solver name. Default is ``"highs"``.
+    options : dict, optional
+        Solver options.
+
+    Returns
+    -------
+    float
+        Optimal objective of the relaxation.
+    """
+    relaxed = m.clone()
+    TransformationFactory("core.relax_integer_vars").apply_to(relaxed)
+    get_solver_session(solver, options or {}).solve(relaxed)
+    return float(value(relaxed.OBJ))
+
+
+def timed_solve(m, solver: str = "highs",
+                options: Optional[Dict[str, Any]] = None) -> Tuple[float, str]:
+    """
+    Solve a model and return the wall time and termination condition.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Built model, loaded with the solution.
+    solver : str, optional
+        Solver name. Default is ``"highs"``.
+    options : dict, optional
+        Solver options.
+
+    Returns
+    -------
+    tuple
+        ``(seconds, termination_condition)``.
+    """
+    session = get_solver_session(solver, copy.deepcopy(options or {}))
+    clock = time.perf_counter()
+    res = session.solve(m)
+    return time.perf_counter() - clock, str(res.solver.termination_condition)
@@ -20,6 +20,7 @@ Features:
 - Solver selection and configuration via YAML metadata.
 - Support for MINLP solvers such as MindtPy with strategy and time limits.
 - Termination condition validation to ensure feasibility or optimality.
+- In-memory, tmpfs or file solver I/O (``Solver_Options.io_mode``), with the I/O time of the solve.
 
 References
 ----------
@@ -28,13 +29,14 @@ References
 """
 
 
-from pyomo.opt import SolverFactory, TerminationCondition
+from pyomo.opt import TerminationCondition
 from pyomo.common.errors import ApplicationError
 from pyomo.environ import ConcreteModel, Suffix, value
 from pyomo.contrib.latex_printer import latex_printer
 from typing import Any, Tuple, Dict
 from colorama import Fore, Style, init as colorama_init
 from .Builder import build_model_from_file
+from .SolverSession import get_solver_session
 from .Reporting import *
 from .ModelCheck import *
 from .ModelFormatters import *
@@ -78,26 +80,11 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     model.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
     # print(latex_printer(model))
     # exit()
-    # Create solver instance
-    opt = SolverFactory(solver_str)
-
-    if not opt.available():
-        raise RuntimeError(
-            f"Solver '{solver_str}' is not available on this system.")
+    # pooled solver handle (see SolverSession)
+    session = get_solver_session(solver_str, options)
 
     try:
-        if solver_str.lower() == 'mindtpy':
-            res = opt.solve(
-                model,
-                mip_solver=options.get('mip_solver', 'glpk'),
-                nlp_solver=options.get('nlp_solver', 'cyipopt'),
-                strategy=options.get('strategy', 'OA'),
-                tee=False,
-                suffixes=["dual"]
-            )
-        else:
-            res = opt.solve(model, tee=False,
-                            suffixes=["dual"])
+        res = session.solve(model, duals=True)
 
         # Check termination condition
         term_cond = res.solver.termination_condition
@@ -108,6 +95,8 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     except ApplicationError as e:
         raise RuntimeError(f"Solver execution failed: {e}")
 
+    print(f"  Solver I/O:   {Fore.GREEN}{session.io_summary()}")
+
     dispatch_summary(model)
     generator_dispatch_summary(model)
     storage_dispatch_summary(model)
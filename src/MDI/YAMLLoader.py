@@ -50,4 +50,4 @@ References
 [2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
 """
 
-from NaivePyDESSEM.YAMLLoader import yaml_loader
\ No newline at end of file
+from NaivePyDESSEM.YAMLLoader import yaml_loader, case_fingerprint
\ No newline at end of file
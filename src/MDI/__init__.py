@@ -64,6 +64,9 @@ Builder
     generating the energy balance constraints, and defining the
     cost-minimizing objective function.
 
+SolverSession
+    Re-export of the shared solver session layer of NaivePyDESSEM.
+
 Solver  
     Manages solver configuration and execution (e.g., GLPK, IPOPT, MindtPy),
     with optional reporting, sensitivity analysis, and feasibility diagnostics.
@@ -110,4 +113,5 @@ from .ModelFormatters import *
 from .Reporting import *
 from .YAMLLoader import *
 from .Builder import *
+from .SolverSession import *
 from .Solver import *
@@ -55,28 +55,34 @@ from typing import Any, Dict, List, Tuple
 from pyomo.environ import ConcreteModel, Objective, Constraint, minimize
 
 from NaivePyDECOMP.HydraulicGenerator.HydraulicDataTypes import HydraulicData, HydraulicUnit
-from NaivePyDECOMP.HydraulicGenerator.HydraulicGeneratorBuilder import add_hydro_problem
+from NaivePyDECOMP.HydraulicGenerator.HydraulicGeneratorBuilder import add_hydro_problem, build_FPHs
+from NaivePyDECOMP.HydraulicGenerator.HydraulicVars import hydraulyc_add_sets_and_params, hydralic_add_variables_g
 from NaivePyDECOMP.HydraulicGenerator.HydraulicEquations import add_hydraulic_cost_expression
 
 from NaivePyDECOMP.ThermalGenerator.ThermalDataTypes import ThermalData, ThermalUnit
 from NaivePyDECOMP.ThermalGenerator.ThermalGeneratorBuilder import add_thermal_problem
+from NaivePyDECOMP.ThermalGenerator.ThermalVars import thermal_add_sets_and_params, thermal_add_variables_uc
 from NaivePyDECOMP.ThermalGenerator.ThermalEquations import add_thermal_cost_expression
 
 from NaivePyDECOMP.RenewableGenerator.RenewableDataTypes import RenewableData, RenewableUnit
 from NaivePyDECOMP.RenewableGenerator.RenewableGeneratorBuilder import add_renewable_problem
+from NaivePyDECOMP.RenewableGenerator.RenewableVars import renewable_add_sets_and_params, renewable_add_variables
 from NaivePyDECOMP.RenewableGenerator.RenewableEquations import add_renewable_cost_expression
 
 from NaivePyDECOMP.Storage.StorageDataTypes import StorageData, StorageUnit
 from NaivePyDECOMP.Storage.StorageBuilder import add_storage_problem
+from NaivePyDECOMP.Storage.StorageVars import storage_add_sets_and_params, storage_add_variables
 from NaivePyDECOMP.Storage.StorageEquations import add_storage_cost_expression
 
 from NaivePyDECOMP.ConnectionBar.ConnectionBarDataTypes import ConnectionBarData, ConnectionBarUnit
 from NaivePyDECOMP.ConnectionBar.ConnectionBarBuilder import add_connection_bar_problem
+from NaivePyDECOMP.ConnectionBar.ConnectionBarVars import connection_bar_add_sets_and_params, connection_bar_add_variables
 from NaivePyDECOMP.ConnectionBar.ConnectionBarEquations import add_connection_bar_cost_expression
 from NaivePyDECOMP.ConnectionBar.ConnectionBarConstraints import add_connection_bar_balance_constraints
 
 from NaivePyDECOMP.TransmissionLine.TransmissionLineDataTypes import TransmissionLineData, TransmissionLineUnit
 from NaivePyDECOMP.TransmissionLine.TransmissionLineBuilder import add_transmission_line_problem
+from NaivePyDECOMP.TransmissionLine.TransmissionLineVars import transmission_line_add_sets_and_params, transmission_line_add_variables
 from NaivePyDECOMP.TransmissionLine.TransmissionLineEquations import add_transmission_line_cost_expression
 
 from .YAMLLoader import yaml_loader
@@ -281,6 +287,25 @@ def build_balance_and_objective_from_yaml(model: ConcreteModel, yaml_data: Dict[
 
     add_connection_bar_balance_constraints(model)
 
+    return build_objective_from_yaml(model, yaml_data)
+
+
+def build_objective_from_yaml(model: ConcreteModel, yaml_data: Dict[str, Any]) -> ConcreteModel:
+    """
+    Construct the total cost objective of the system.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        A Pyomo model with required sets and variables already declared.
+    yaml_data : dict
+        Parsed YAML dictionary with subsections for each technology.
+
+    Returns
+    -------
+    ConcreteModel
+        The input model with the objective function (``model.OBJ``) added.
+    """
     # --------------------------
     # OBJECTIVE FUNCTION
     # --------------------------
@@ -428,3 +453,55 @@ def build_model_from_data(root: Dict) -> Tuple[ConcreteModel, Dict]:
     m = build_balance_and_objective_from_yaml(m, root)
 
     return m, root
+
+
+def build_result_model_from_data(root: Dict) -> ConcreteModel:
+    """
+    Build the multi-period sets, parameters, variables and objective of a
+    case, without any constraint.
+
+    Decomposed solutions (PDDD, SDDP) are written into the variables of this
+    model for reporting and export, so the operational constraints of the
+    monolithic model, which dominate its construction time, are skipped.
+
+    Parameters
+    ----------
+    root : dict
+        Case already validated and completed by
+        :func:`~NaivePyDECOMP.BuilderPDDD.build_pddd_data_from_file` (with
+        its ``bars`` section).
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        Model holding sets, parameters, variables and ``OBJ``.
+    """
+    m = ConcreteModel()
+    m.p_base = float(root["meta"].get("p_base", 1.0))
+
+    connection_bar_add_sets_and_params(m, _mk_connection_bar_data(root))
+    connection_bar_add_variables(m)
+
+    if "lines" in root and root["lines"] is not None and not m.unique_bar:
+        transmission_line_add_sets_and_params(m, _mk_transmission_line_data(root))
+        transmission_line_add_variables(m)
+
+    if "hydro" in root and root["hydro"] is not None:
+        hydro_data = _mk_hydraulic_data(root)
+        build_FPHs(m, hydro_data)
+        hydraulyc_add_sets_and_params(m, hydro_data)
+        hydralic_add_variables_g(m)
+
+    if "thermal" in root and root["thermal"] is not None:
+        thermal_add_sets_and_params(m, _mk_thermal_data(root))
+        thermal_add_variables_uc(m)
+
+    if "renewable" in root and root["renewable"] is not None:
+        renewable_add_sets_and_params(m, _mk_renewable_data(root))
+        renewable_add_variables(m)
+
+    if "storage" in root and root["storage"] is not None:
+        storage_add_sets_and_params(m, _mk_storage_data(root))
+        storage_add_variables(m)
+
+    return build_objective_from_yaml(m, root)
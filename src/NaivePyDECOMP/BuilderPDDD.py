@@ -51,7 +51,7 @@ References
 from __future__ import annotations
 
 import copy
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from pyomo.environ import (
     ConcreteModel,
     Objective,
@@ -59,6 +59,8 @@ from pyomo.environ import (
     Constraint,
     Expression,
     NonNegativeReals,
+    Param,
+    Set,
     Var,
     Suffix,
     minimize
@@ -94,6 +96,7 @@ from NaivePyDECOMP.TransmissionLine.TransmissionLineBuilder import add_transmiss
 from NaivePyDECOMP.TransmissionLine.TransmissionLineEquations import add_transmission_line_cost_expression
 
 from .YAMLLoader import yaml_loader
+from .ModelCheck import has_hydro_model
 
 from .Builder import (
     _mk_hydraulic_data,
@@ -147,7 +150,9 @@ def build_pddd_balance_and_objective_from_yaml(yaml_data: Dict[str, Any],
     yaml_data : dict
         Parsed YAML dictionary with subsections for each technology.
     stage: int
-        PDDD Stage
+        PDDD Stage. The stage covers the periods given by
+        :func:`pddd_stage_periods` (``meta.PDDD_Options.stage_length``
+        consecutive periods of the horizon, one by default).
 
     Returns
     -------
@@ -163,6 +168,13 @@ def build_pddd_balance_and_objective_from_yaml(yaml_data: Dict[str, Any],
 
     model.p_base = float(yaml_data["meta"].get("p_base", 1.0))    
 
+    model.pddd_stage = stage
+
+    # horizon periods (0-based) covered by the stage
+    periods = pddd_stage_periods(yaml_data)[stage]
+    model.pddd_periods = tuple(periods)
+    first, n_periods = periods.start, len(periods)
+
     model.dual = Suffix(direction=Suffix.IMPORT)
 
     # first of all, the bars
@@ -171,19 +183,22 @@ def build_pddd_balance_and_objective_from_yaml(yaml_data: Dict[str, Any],
         bar_data = _mk_connection_bar_data(yaml_data)
         model = add_connection_bar_subproblem(m=model,
                                               data=bar_data,
-                                              stage=stage)
+                                              stage=first,
+                                              n_periods=n_periods)
 
     if "lines" in yaml_data and yaml_data["lines"] is not None:
         bar_data = _mk_transmission_line_data(yaml_data)
         model = add_transmission_line_subproblem(m=model,
                                                  data=bar_data,
-                                                 stage=stage)
+                                                 stage=first,
+                                                 n_periods=n_periods)
 
     if "hydro" in yaml_data and yaml_data["hydro"] is not None:
         hydro_data = _mk_hydraulic_data(yaml_data)
         model = add_hydro_subproblem(m=model,
                                      data=hydro_data,
-                                     stage=stage)
+                                     stage=first,
+                                     n_periods=n_periods)
         has_valid_units = True
 
     if "thermal" in yaml_data and yaml_data["thermal"] is not None:
@@ -191,21 +206,24 @@ def build_pddd_balance_and_objective_from_yaml(yaml_data: Dict[str, Any],
         thermal_data = _mk_thermal_data(yaml_data)
         model = add_thermal_subproblem(m=model,
                                        data=thermal_data,
-                                       stage=stage)
+                                       stage=first,
+                                       n_periods=n_periods)
         has_valid_units = True
 
     if "renewable" in yaml_data and yaml_data["renewable"] is not None:
         renewable_data = _mk_renewable_data(yaml_data)
         model = add_renewable_subproblem(m=model,
                                          data=renewable_data,
-                                         stage=stage)
+                                         stage=first,
+                                         n_periods=n_periods)
         has_valid_units = True
 
     if "storage" in yaml_data and yaml_data["storage"] is not None:
         storage_data = _mk_storage_data(yaml_data)
         model = add_storage_subproblem(m=model,
                                        data=storage_data,
-                                       stage=stage)
+                                       stage=first,
+                                       n_periods=n_periods)
         has_valid_units = True
 
     if not has_valid_units:
@@ -219,16 +237,12 @@ def build_pddd_balance_and_objective_from_yaml(yaml_data: Dict[str, Any],
     add_connection_bar_balance_constraints(model)
 
     model.cuts = ConstraintList()
+    model.cut_rows = {}
 
     # --------------------------
     # BENDERS RESTRICTIONS
     # --------------------------
-    for cut in cuts:
-        if cut['stage'] == stage:
-            cut_list: List[Any] = []
-            for uhe, coef in cut['coefs'].items():
-                cut_list.append(coef * model.hydro_V[uhe, 1])
-            model.cuts.add(model.alpha >= sum(cut_list) + cut['rhs'])
+    add_pddd_cuts(model, cuts, stage)
 
     # --------------------------
     # OBJECTIVE FUNCTION
@@ -253,10 +267,252 @@ def build_pddd_balance_and_objective_from_yaml(yaml_data: Dict[str, Any],
 
     cost_terms.append(model.alpha)
 
+    # --------------------------
+    # FORWARD PASS REGULARIZATION
+    # --------------------------
+    pddd_options = yaml_data["meta"].get("PDDD_Options", {}) or {}
+    regularization = pddd_options.get("regularization")
+    if regularization:
+        add_pddd_regularization(model, regularization.get("type", "l1"))
+        cost_terms.append(model.reg_penalty)
+
     model.OBJ = Objective(expr=sum(cost_terms), sense=minimize)
     return model
 
 
+def pddd_stage_periods(yaml_data: Dict[str, Any]) -> List[range]:
+    """
+    Split the horizon of a case into PDDD stages.
+
+    Each stage covers ``meta.PDDD_Options.stage_length`` consecutive
+    periods (default 1); the last stage takes the remaining periods when
+    the horizon is not a multiple of the stage length. Stages are coupled
+    only through the state (volumes and storage energies) at their
+    boundaries.
+
+    Parameters
+    ----------
+    yaml_data : dict
+        Parsed case.
+
+    Returns
+    -------
+    list of range
+        0-based horizon periods of every stage.
+
+    Raises
+    ------
+    ValueError
+        If the stage length is not a positive integer.
+    """
+    horizon = int(yaml_data["meta"].get("horizon", 1))
+    pddd_options = yaml_data["meta"].get("PDDD_Options", {}) or {}
+    stage_length = int(pddd_options.get("stage_length", 1))
+    if stage_length < 1:
+        raise ValueError("PDDD_Options.stage_length must be a positive integer.")
+    return [range(first, min(first + stage_length, horizon))
+            for first in range(0, horizon, stage_length)]
+
+
+def _state_variable(model: ConcreteModel, unit: str) -> Any:
+    """Final state variable of ``unit``: hydro volume or storage energy."""
+    last = model.T.last()
+    if has_hydro_model(model) and unit in model.HG:
+        return model.hydro_V[unit, last]
+    return model.storage_E[unit, last]
+
+
+def add_pddd_cuts(model: ConcreteModel,
+                  cuts: List[Any],
+                  stage: int) -> ConcreteModel:
+    """
+    Synchronize the Benders cuts of a stage model with a cut selection.
+
+    Each cut ``alpha >= rhs + sum(coefs[u] * x[u])`` is written over the
+    final state of the stage: the volume ``hydro_V[u, T]`` of hydro units
+    and the energy ``storage_E[u, T]`` of storage units at the last period
+    ``T`` of the stage.
+
+    ``cuts`` is the complete set of cuts the model must enforce. Cuts not
+    yet in the model are added, cuts already in it are (re)activated and
+    cuts left out of ``cuts`` are deactivated, so a stage model can be kept
+    alive between iterations while the cut selection changes. Each cut is
+    identified by its ``id`` key (see
+    :class:`~NaivePyDECOMP.PDDDCutPool.CutPool`) or, when absent, by its
+    position in ``cuts``; the mapping is kept in ``model.cut_rows``.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Stage model built by :func:`build_pddd_balance_and_objective_from_yaml`.
+    cuts : list of dict
+        Cuts with keys ``stage``, ``rhs``, ``coefs`` and optionally ``id``.
+        Only those of ``stage`` are considered.
+    stage : int
+        PDDD stage of the model (0-based).
+
+    Returns
+    -------
+    ConcreteModel
+        The same model with ``model.cuts`` matching the selection.
+    """
+    selected = set()
+    for position, cut in enumerate(cuts):
+        if cut['stage'] != stage:
+            continue
+        key = cut.get('id', position)
+        selected.add(key)
+        if key in model.cut_rows:
+            if not model.cut_rows[key].active:
+                model.cut_rows[key].activate()
+            continue
+        cut_list: List[Any] = []
+        for unit, coef in cut['coefs'].items():
+            cut_list.append(coef * _state_variable(model, unit))
+        model.cut_rows[key] = model.cuts.add(
+            model.alpha >= sum(cut_list) + cut['rhs'])
+    for key, row in model.cut_rows.items():
+        if key not in selected and row.active:
+            row.deactivate()
+    return model
+
+
+def add_pddd_regularization(model: ConcreteModel,
+                            regularization_type: str = "l1") -> ConcreteModel:
+    """
+    Add a proximal term around a trial state to the stage objective.
+
+    The term penalizes the distance between the final state of the stage
+    (see :func:`add_pddd_cuts`) and a center ``model.reg_center``:
+
+    - ``l1``: ``reg_weight * sum(|x[u] - reg_center[u]|)``, written with
+      the deviation variables ``reg_dev_pos`` and ``reg_dev_neg`` so the
+      stage problem remains an LP;
+    - ``quadratic``: ``reg_weight * sum((x[u] - reg_center[u])**2)``,
+      which requires a QP-capable solver.
+
+    The weight and the center are mutable parameters (see
+    :func:`update_pddd_regularization`); with ``reg_weight = 0`` the stage
+    problem, its optimal value and its duals are those of the plain stage.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Stage model under construction.
+    regularization_type : str, optional
+        ``l1`` (default) or ``quadratic``.
+
+    Returns
+    -------
+    ConcreteModel
+        The same model with ``model.reg_penalty`` (to be added to the
+        objective).
+
+    Raises
+    ------
+    ValueError
+        If the regularization type is unknown.
+    """
+    units = []
+    if has_hydro_model(model):
+        units += list(model.HG)
+    if hasattr(model, "SU"):
+        units += list(model.SU)
+    model.pddd_state = Set(initialize=units, ordered=True)
+    model.reg_center = Param(model.pddd_state, initialize=0.0, mutable=True)
+    model.reg_weight = Param(initialize=0.0, mutable=True)
+
+    if regularization_type == "l1":
+        model.reg_dev_pos = Var(model.pddd_state, domain=NonNegativeReals)
+        model.reg_dev_neg = Var(model.pddd_state, domain=NonNegativeReals)
+        model.regularization_constraint = Constraint(
+            model.pddd_state,
+            rule=lambda m, u: _state_variable(m, u) - m.reg_center[u]
+            == m.reg_dev_pos[u] - m.reg_dev_neg[u])
+        model.reg_penalty = Expression(
+            expr=model.reg_weight * sum(model.reg_dev_pos[u] + model.reg_dev_neg[u]
+                                        for u in model.pddd_state))
+    elif regularization_type == "quadratic":
+        model.reg_penalty = Expression(
+            expr=model.reg_weight * sum((_state_variable(model, u) - model.reg_center[u])**2
+                                        for u in model.pddd_state))
+    else:
+        raise ValueError(f"Unknown regularization type '{regularization_type}'. "
+                         "Use 'l1' or 'quadratic'.")
+    return model
+
+
+def update_pddd_regularization(model: ConcreteModel,
+                               center: Optional[Dict[str, float]] = None,
+                               weight: float = 0.0) -> ConcreteModel:
+    """
+    Re-center and re-weight the proximal term of a stage model.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Stage model built by :func:`build_pddd_balance_and_objective_from_yaml`.
+        Models without regularization are returned unchanged.
+    center : dict, optional
+        State (unit name → value) the final state is attracted to. When
+        ``None``, the term is switched off.
+    weight : float, optional
+        Weight of the proximal term (default is 0, plain stage problem).
+
+    Returns
+    -------
+    ConcreteModel
+        The same model with ``reg_center`` and ``reg_weight`` updated.
+    """
+    if not hasattr(model, "reg_weight"):
+        return model
+    if center is None:
+        model.reg_weight = 0.0
+        return model
+    for unit in model.pddd_state:
+        model.reg_center[unit] = float(center[unit])
+    model.reg_weight = float(weight)
+    return model
+
+
+def update_pddd_stage_state(model: ConcreteModel,
+                            stage_hydros: Dict,
+                            stage_storage: Dict) -> ConcreteModel:
+    """
+    Re-target a stage model to a new initial state.
+
+    Copies the initial volumes (``Vini``) and the natural inflows of the
+    periods of the model stage (``afluencia[t]`` for ``t`` in
+    ``model.pddd_periods``) of the hydro units and the initial
+    energies (``Eini``) of the storage units into the mutable parameters
+    ``model.hydro_Vini``, ``model.hydro_inflow`` and ``model.storage_Eini``.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Stage model built by :func:`build_pddd_balance_and_objective_from_yaml`.
+    stage_hydros : dict
+        The ``hydro`` section of the case with the current ``Vini`` and
+        ``afluencia`` values.
+    stage_storage : dict or None
+        The ``storage`` section of the case with the current ``Eini``
+        values, or ``None`` when the case has no storage.
+
+    Returns
+    -------
+    ConcreteModel
+        The same model with its state parameters updated.
+    """
+    for uhe, unit in stage_hydros['units'].items():
+        model.hydro_Vini[uhe] = float(unit['Vini'])
+        for t, period in enumerate(model.pddd_periods, start=1):
+            model.hydro_inflow[uhe, t] = float(unit['afluencia'][period])
+    if stage_storage is not None and hasattr(model, 'storage_Eini'):
+        for sunit, unit in stage_storage['units'].items():
+            model.storage_Eini[sunit] = float(unit['Eini'])
+    return model
+
+
 def build_pddd_data_from_file(path: str) -> Dict:
     """
     Load master data from YAML/JSON and build subsystem models.
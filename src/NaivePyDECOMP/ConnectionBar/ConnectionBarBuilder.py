@@ -77,7 +77,8 @@ from NaivePyDESSEM.ConnectionBar.ConnectionBarBuilder import (
 
 def add_connection_bar_subproblem(m: ConcreteModel,
                                   data: ConnectionBarData,
-                                  stage: int) -> ConcreteModel:
+                                  stage: int,
+                                  n_periods: int = 1) -> ConcreteModel:
     """
     Add a connection-bar subproblem structure to an existing Pyomo model.
 
@@ -95,9 +96,13 @@ def add_connection_bar_subproblem(m: ConcreteModel,
         Input data structure containing bar-level information such as
         demand profiles, slack status, and other nodal parameters.
     stage : int
-        Index of the planning stage for which this subproblem is created.
-        The function internally restricts the horizon to one stage to
-        enable decomposition or stage-wise simulation.
+        Index of the first period of the planning stage for which this
+        subproblem is created. The function internally restricts the
+        horizon to the ``n_periods`` periods of the stage to enable
+        decomposition or stage-wise simulation.
+    n_periods : int, optional
+        Number of consecutive periods covered by the subproblem, starting
+        at period ``stage`` (default is 1).
 
     Returns
     -------
@@ -127,10 +132,11 @@ def add_connection_bar_subproblem(m: ConcreteModel,
     """
     # data copy
     subproblem_data = copy.deepcopy(data)
-    subproblem_data.horizon = 1
+    subproblem_data.horizon = n_periods
     # demand
     for name in subproblem_data.units.keys():
-        subproblem_data.units[name].demand = [data.units[name].demand[stage]]
+        subproblem_data.units[name].demand = \
+            data.units[name].demand[stage:stage + n_periods]
     # sets & params
     connection_bar_add_sets_and_params(m, subproblem_data)
     # variables
@@ -195,7 +195,8 @@ def add_hydro_problem(m: ConcreteModel,
 
 def add_hydro_subproblem(m: ConcreteModel,
                          data: HydraulicData,
-                         stage: int) -> ConcreteModel:
+                         stage: int,
+                         n_periods: int = 1) -> ConcreteModel:
     """
     Assemble a hydropower dispatch problem in Pyomo.
 
@@ -213,9 +214,11 @@ def add_hydro_subproblem(m: ConcreteModel,
         Input data object containing planning horizon, demand mapping,
         unit definitions, inflows, storage bounds, and productivity
         coefficients.
-    include_objective : bool, optional
-        If True, add the system-wide demand balance and deficit-penalizing
-        objective function (default is False).
+    stage : int
+        First period (0-based) of the subproblem, informed for data copying.
+    n_periods : int, optional
+        Number of consecutive periods covered by the subproblem, starting
+        at period ``stage`` (default is 1).
 
     Returns
     -------
@@ -226,14 +229,26 @@ def add_hydro_subproblem(m: ConcreteModel,
     """
     # data copy
     subproblem_data = copy.deepcopy(data)
-    subproblem_data.horizon = 1
+    subproblem_data.horizon = n_periods
     for name in subproblem_data.units.keys():
-        subproblem_data.units[name].afluencia = [
-            data.units[name].afluencia[stage]]
+        subproblem_data.units[name].afluencia = \
+            data.units[name].afluencia[stage:stage + n_periods]
 
     build_FPHs(m, subproblem_data)
 
     hydraulyc_add_sets_and_params(m, subproblem_data)
+    # the initial volume is the stage state and the natural inflow its
+    # uncertain input: keeping both mutable lets a persistent stage model be
+    # re-targeted (new state or new inflow scenario) without being rebuilt
+    vini = m.hydro_Vini
+    del m.hydro_Vini
+    m.hydro_Vini = Param(m.HG, initialize=vini, mutable=True)
+    m.hydro_inflow = Param(m.HG, m.T,
+                           initialize={(h, t): m.hydro_afluencia[h][t - 1]
+                                       for h in m.HG for t in m.T},
+                           mutable=True)
+    m.hydro_afluencia = {h: [m.hydro_inflow[h, t] for t in m.T]
+                         for h in m.HG}
     hydralic_add_variables_g(m)
 
     add_hydro_generation_constraint(m)
@@ -0,0 +1,835 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: Sparse Matrix Model Builder
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Matrix backend of the monolithic DECOMP-like model. The LP (or MILP, when
+storage units are present) of :func:`~NaivePyDECOMP.Builder.build_model_from_data`
+is assembled directly from the subsystem dataclasses (``HydraulicData``,
+``ThermalData``, ``RenewableData``, ``StorageData``, ``ConnectionBarData``,
+``TransmissionLineData``) as sparse arrays::
+
+    min  c'x
+    s.t. row_lower <= A x <= row_upper
+         col_lower <= x <= col_upper,  x[j] integer where integrality[j]
+
+and handed to HiGHS through its matrix API (highspy), without building any
+Pyomo expression. Every block is filled with vectorized NumPy operations
+over the horizon, so the construction time grows with the number of
+nonzeros only.
+
+Layout:
+
+- each variable family (``hydro_Q``, ``thermal_p``, ``D``, ...) is a
+  contiguous range of columns, unit by unit and period by period
+  (column ``offset + i * T + (t - 1)`` for the ``i``-th unit);
+- the coupling constraints keep the orientation of the Pyomo rules
+  (``lhs - rhs`` on the left, constants on the right), so the duals have
+  the same signs as ``model.dual``;
+- the single-variable constraints of the Pyomo model (flow, volume,
+  generation, energy, charge, line flow and angle limits, slack angle) are
+  column bounds.
+
+Classes
+-------
+VariableFamily
+    Column range of one variable family.
+ConstraintBlock
+    Row range of one constraint family.
+MatrixModel
+    Sparse LP/MILP of a case.
+MatrixSolution
+    Primal and dual solution of a :class:`MatrixModel`.
+MatrixResults
+    Monolithic solution laid out like the multi-period model.
+
+Functions
+---------
+build_matrix_model_from_data(root)
+    Assemble the sparse model of a parsed case.
+build_matrix_model_from_file(path)
+    Assemble the sparse model of a case file.
+solve_matrix_model(mm, options)
+    Solve a sparse model with HiGHS.
+build_matrix_results(mm, solution, root)
+    Map a solution to the attributes of the Pyomo model.
+check_matrix_equivalence(path)
+    Compare the matrix backend with the Pyomo model of a case.
+
+Notes
+-----
+- Only HiGHS is supported (``highspy``, see the ``solvers`` extra); the
+  generic ``meta.Solver_Options`` keys are passed to it.
+- MILPs are solved, then their integer columns are fixed at the optimum
+  and the LP is solved again to obtain the duals (``CMO``).
+- ``CMO[t]`` is the dual of the balance of the first bar of period ``t``,
+  as in the PDDD stage records.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Huangfu, Q.; Hall, J. A. J. Parallelizing the dual revised simplex
+    method. Mathematical Programming Computation, 2018.
+[3] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import copy
+import time
+
+import numpy as np
+from scipy import sparse
+
+from pyomo.environ import Constraint, value
+from pyomo.opt import TerminationCondition
+
+from .Builder import (
+    _mk_hydraulic_data,
+    _mk_thermal_data,
+    _validate_hydro,
+    _validate_thermal,
+    build_model_from_data
+)
+from .PDDDResults import PDDDResults, SeriesFamily
+from .SolverSession import get_solver_session, normalize_solver_options
+from .YAMLLoader import yaml_loader
+
+from NaivePyDESSEM.Builder import (
+    _validate_meta,
+    _validate_demand,
+    _validate_renewable,
+    _validate_storage,
+    _validate_connection_bars,
+    _validate_transmission_lines,
+    _mk_renewable_data,
+    _mk_storage_data,
+    _mk_connection_bar_data,
+    _mk_transmission_line_data
+)
+
+# spillage penalty of the hydro cost expression
+SPILLAGE_COST = 0.3
+
+
+@dataclass
+class VariableFamily:
+    """
+    Columns of one variable family.
+
+    Parameters
+    ----------
+    offset : int
+        First column of the family.
+    units : Tuple[str, ...]
+        Unit (or bar, line) names, in column-block order.
+    horizon : int
+        Number of periods.
+    """
+    offset: int
+    units: Tuple[str, ...]
+    horizon: int
+    _rows: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rows = {unit: i for i, unit in enumerate(self.units)}
+
+    @property
+    def size(self) -> int:
+        """Number of columns of the family."""
+        return len(self.units) * self.horizon
+
+    def columns(self, unit: str) -> np.ndarray:
+        """Columns of ``unit`` for periods ``1..T``."""
+        start = self.offset + self._rows[unit] * self.horizon
+        return np.arange(start, start + self.horizon)
+
+
+@dataclass
+class ConstraintBlock:
+    """
+    Rows of one constraint family.
+
+    Parameters
+    ----------
+    offset : int
+        First row of the block.
+    keys : Tuple[Tuple[str, int], ...]
+        ``(unit, t)`` key of every row, in row order.
+    """
+    offset: int
+    keys: Tuple[Tuple[str, int], ...]
+
+
+@dataclass
+class MatrixModel:
+    """
+    Sparse LP/MILP of a case.
+
+    Parameters
+    ----------
+    horizon : int
+        Number of periods.
+    families : Dict[str, VariableFamily]
+        Variable families, named after the Pyomo variables.
+    blocks : Dict[str, ConstraintBlock]
+        Constraint families, named after the Pyomo constraints.
+    A : scipy.sparse.csc_matrix
+        Constraint matrix (rows × columns).
+    row_lower, row_upper : np.ndarray
+        Row bounds (equal for equality rows).
+    c : np.ndarray
+        Objective coefficients.
+    col_lower, col_upper : np.ndarray
+        Column bounds.
+    integrality : np.ndarray
+        ``True`` for integer columns.
+    """
+    horizon: int
+    families: Dict[str, VariableFamily]
+    blocks: Dict[str, ConstraintBlock]
+    A: sparse.csc_matrix
+    row_lower: np.ndarray
+    row_upper: np.ndarray
+    c: np.ndarray
+    col_lower: np.ndarray
+    col_upper: np.ndarray
+    integrality: np.ndarray
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows."""
+        return self.A.shape[0]
+
+    @property
+    def n_cols(self) -> int:
+        """Number of columns."""
+        return self.A.shape[1]
+
+    @property
+    def is_mip(self) -> bool:
+        """Whether the model has integer columns."""
+        return bool(self.integrality.any())
+
+
+@dataclass
+class MatrixSolution:
+    """
+    Solution of a :class:`MatrixModel`.
+
+    Parameters
+    ----------
+    status : str
+        HiGHS model status.
+    objective : float
+        Objective value.
+    x : np.ndarray
+        Column values.
+    row_dual : np.ndarray or None
+        Row duals (``None`` when HiGHS returns none).
+    solve_time : float
+        Wall time of the HiGHS runs (s).
+    """
+    status: str
+    objective: float
+    x: np.ndarray
+    row_dual: Optional[np.ndarray]
+    solve_time: float = 0.0
+
+
+class MatrixResults(PDDDResults):
+    """
+    Monolithic solution of the matrix backend laid out like the
+    multi-period model.
+
+    Holds the attributes of :class:`~NaivePyDECOMP.PDDDResults.PDDDResults`
+    read by :mod:`~NaivePyDECOMP.Reporting` and
+    :func:`~NaivePyDECOMP.DataFrames.build_dispatch_dataframe`, except the
+    future cost ones (``alpha``, ``FC``, ``CMA``), which the monolithic
+    model does not have.
+
+    Parameters
+    ----------
+    horizon : int
+        Number of periods of the case.
+    """
+
+
+class _MatrixAssembler:
+    """Accumulates columns, rows and nonzeros of a :class:`MatrixModel`."""
+
+    def __init__(self, horizon: int) -> None:
+        self.T = horizon
+        self.families: Dict[str, VariableFamily] = {}
+        self.blocks: Dict[str, ConstraintBlock] = {}
+        self.n_cols = 0
+        self.n_rows = 0
+        self._col_lower: List[np.ndarray] = []
+        self._col_upper: List[np.ndarray] = []
+        self._cost: List[np.ndarray] = []
+        self._integer: List[np.ndarray] = []
+        self._row_lower: List[np.ndarray] = []
+        self._row_upper: List[np.ndarray] = []
+        self._rows: List[np.ndarray] = []
+        self._cols: List[np.ndarray] = []
+        self._vals: List[np.ndarray] = []
+
+    def add_family(self,
+                   name: str,
+                   units: Tuple[str, ...],
+                   lower: Any = 0.0,
+                   upper: Any = np.inf,
+                   cost: Any = 0.0,
+                   integer: bool = False) -> VariableFamily:
+        """Add a family; bounds and costs broadcast to (units × T)."""
+        family = VariableFamily(self.n_cols, tuple(units), self.T)
+        shape = (len(family.units), self.T)
+        self._col_lower.append(np.broadcast_to(np.asarray(lower, dtype=float), shape).ravel())
+        self._col_upper.append(np.broadcast_to(np.asarray(upper, dtype=float), shape).ravel())
+        self._cost.append(np.broadcast_to(np.asarray(cost, dtype=float), shape).ravel())
+        self._integer.append(np.full(family.size, integer))
+        self.families[name] = family
+        self.n_cols += family.size
+        return family
+
+    def add_rows(self,
+                 name: str,
+                 keys: List[Tuple[str, int]],
+                 lower: np.ndarray,
+                 upper: np.ndarray) -> int:
+        """Add a block of rows; returns its first row."""
+        offset = self.n_rows
+        self.blocks[name] = ConstraintBlock(offset, tuple(keys))
+        self._row_lower.append(np.asarray(lower, dtype=float))
+        self._row_upper.append(np.asarray(upper, dtype=float))
+        self.n_rows += len(keys)
+        return offset
+
+    def add_entries(self, rows: np.ndarray, cols: np.ndarray, vals: Any) -> None:
+        """Add nonzeros (``vals`` broadcast to the length of ``rows``)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        self._rows.append(rows)
+        self._cols.append(np.asarray(cols, dtype=np.int64))
+        self._vals.append(np.broadcast_to(np.asarray(vals, dtype=float), rows.shape).ravel())
+
+    def model(self) -> MatrixModel:
+        """Build the :class:`MatrixModel`."""
+        def cat(arrays, dtype=float):
+            return np.concatenate(arrays) if arrays else np.zeros(0, dtype=dtype)
+
+        A = sparse.coo_matrix((cat(self._vals),
+                               (cat(self._rows, np.int64), cat(self._cols, np.int64))),
+                              shape=(self.n_rows, self.n_cols)).tocsc()
+        A.sum_duplicates()
+        return MatrixModel(horizon=self.T,
+                           families=self.families,
+                           blocks=self.blocks,
+                           A=A,
+                           row_lower=cat(self._row_lower),
+                           row_upper=cat(self._row_upper),
+                           c=cat(self._cost),
+                           col_lower=cat(self._col_lower),
+                           col_upper=cat(self._col_upper),
+                           integrality=cat(self._integer, bool))
+
+
+def _bar_rows(asm: _MatrixAssembler,
+              bars: Tuple[str, ...],
+              terms: Dict[str, List[Tuple[np.ndarray, float]]],
+              demand: Dict[str, np.ndarray],
+              deficit: VariableFamily) -> None:
+    """
+    Add the balance rows of the bars that receive at least one term
+    (ordered period by period, bars in order of first term).
+    """
+    balance_bars = [b for b in terms]
+    n = len(balance_bars)
+    keys = [(b, t) for t in range(1, asm.T + 1) for b in balance_bars]
+    rhs = np.array([demand[b][t - 1] for b, t in keys], dtype=float)
+    offset = asm.add_rows('Balance', keys, rhs, rhs)
+    periods = np.arange(asm.T)
+    for k, b in enumerate(balance_bars):
+        rows = offset + periods * n + k
+        for cols, coef in terms[b]:
+            asm.add_entries(rows, cols, coef)
+        asm.add_entries(rows, deficit.columns(b), 1.0)
+
+
+def build_matrix_model_from_data(root: Dict) -> MatrixModel:
+    """
+    Assemble the sparse model of a parsed case.
+
+    Validates the case as :func:`~NaivePyDECOMP.Builder.build_model_from_data`
+    (adding the default bar of ``meta`` when ``bars`` is absent) and builds
+    the same formulation as a :class:`MatrixModel`.
+
+    Parameters
+    ----------
+    root : dict
+        Parsed case (see :func:`~NaivePyDECOMP.YAMLLoader.yaml_loader`).
+
+    Returns
+    -------
+    MatrixModel
+
+    Raises
+    ------
+    ValueError
+        On structural or validation errors in the case, or when a unit or
+        line refers to an unknown bar.
+    """
+    if "meta" not in root:
+        raise ValueError("File must contain 'meta' sections.")
+
+    _validate_meta(root["meta"])
+    T = int(root["meta"]["horizon"])
+    p_base = float(root["meta"].get("p_base", 1.0))
+
+    if "bars" not in root:
+        _validate_demand(root["meta"]["demand"], T)
+        root["bars"] = {"units": {"{BAR_{1}}": {"slack": True,
+                                                "Cdef": float(root["meta"]["Cdef"]),
+                                                "demand": [float(x) for x in root["meta"]["demand"]]}}}
+
+    asm = _MatrixAssembler(T)
+    periods = np.arange(T)
+    # balance terms of every bar: (columns, coefficient)
+    terms: Dict[str, List[Tuple[np.ndarray, float]]] = {}
+
+    def add_term(bar: str, cols: np.ndarray, coef: float) -> None:
+        if bar not in bar_data.units:
+            raise ValueError(f"Unknown bar '{bar}'.")
+        terms.setdefault(bar, []).append((cols, coef))
+
+    _validate_connection_bars(root["bars"], T)
+    bar_data = _mk_connection_bar_data(root)
+    bars = tuple(bar_data.units.keys())
+    unique_bar = len(bars) == 1
+    deficit = asm.add_family('D', bars,
+                             cost=np.array([[bar_data.units[b].Cdef] for b in bars]))
+    theta = None
+    if not unique_bar:
+        slack = np.array([[bar_data.units[b].slack] for b in bars])
+        theta = asm.add_family('theta', bars,
+                               lower=np.where(slack, 0.0, -np.pi),
+                               upper=np.where(slack, 0.0, np.pi))
+
+    has_valid_units = False
+    hydro_family: Dict[str, VariableFamily] = {}
+    if "hydro" in root and root["hydro"] is not None:
+        _validate_hydro(root["hydro"], T)
+        data = _mk_hydraulic_data(root)
+        units = tuple(data.units.keys())
+        Q = asm.add_family('hydro_Q', units,
+                           lower=[[max(data.units[h].Qmin, 0.0)] for h in units],
+                           upper=[[data.units[h].Qmax] for h in units])
+        V = asm.add_family('hydro_V', units,
+                           lower=[[max(data.units[h].Vmin, 0.0)] for h in units],
+                           upper=[[data.units[h].Vmax] for h in units])
+        S = asm.add_family('hydro_S', units, cost=SPILLAGE_COST)
+        G = asm.add_family('hydro_G', units)
+        hydro_family.update(Q=Q, V=V, S=S, G=G)
+
+        # generation: G - p Q == 0
+        keys = [(h, t) for h in units for t in range(1, T + 1)]
+        offset = asm.add_rows('hydro_generation_constraint', keys,
+                              np.zeros(len(keys)), np.zeros(len(keys)))
+        for i, h in enumerate(units):
+            rows = offset + i * T + periods
+            asm.add_entries(rows, G.columns(h), 1.0)
+            asm.add_entries(rows, Q.columns(h), -data.units[h].p)
+
+        # continuity: V[t] - V[t-1] + Q + S - upstream (Q + S) == inflow (+ Vini)
+        rhs = np.array([data.units[h].afluencia[t - 1] +
+                        (data.units[h].Vini if t == 1 else 0.0)
+                        for h, t in keys], dtype=float)
+        offset = asm.add_rows('hydro_volume_balance_constraint', keys, rhs, rhs)
+        for i, h in enumerate(units):
+            unit = data.units[h]
+            rows = offset + i * T + periods
+            asm.add_entries(rows, V.columns(h), 1.0)
+            asm.add_entries(rows[1:], V.columns(h)[:-1], -1.0)
+            asm.add_entries(rows, Q.columns(h), 1.0)
+            asm.add_entries(rows, S.columns(h), 1.0)
+            if unit.compute_total_inflow:
+                for upstream in unit.upstreams or []:
+                    asm.add_entries(rows, Q.columns(upstream), -1.0)
+                    asm.add_entries(rows, S.columns(upstream), -1.0)
+        for h in units:
+            add_term(data.units[h].bar, G.columns(h), 1.0)
+        has_valid_units = True
+
+    if "thermal" in root and root["thermal"] is not None:
+        _validate_thermal(root["thermal"])
+        data = _mk_thermal_data(root)
+        units = tuple(data.units.keys())
+        P = asm.add_family('thermal_p', units,
+                           lower=[[max(data.units[g].Gmin, 0.0)] for g in units],
+                           upper=[[data.units[g].Gmax] for g in units],
+                           cost=[[data.units[g].Cost] for g in units])
+        for g in units:
+            add_term(data.units[g].bar, P.columns(g), 1.0)
+        has_valid_units = True
+
+    if "renewable" in root and root["renewable"] is not None:
+        _validate_renewable(root["renewable"], T)
+        data = _mk_renewable_data(root)
+        units = tuple(data.units.keys())
+        R = asm.add_family('renewable_gen', units,
+                           upper=[data.units[r].gbar[:T] for r in units])
+        for r in units:
+            add_term(data.units[r].bar, R.columns(r), 1.0)
+        has_valid_units = True
+
+    if "storage" in root and root["storage"] is not None:
+        _validate_storage(root["storage"])
+        data = _mk_storage_data(root)
+        units = tuple(data.units.keys())
+        dt = data.delta_t
+        E = asm.add_family('storage_E', units,
+                           lower=[[max(data.units[s].Emin, 0.0)] for s in units],
+                           upper=[[data.units[s].Emax] for s in units])
+        CH = asm.add_family('storage_ch', units,
+                            upper=[[data.units[s].Pch_max] for s in units])
+        DIS = asm.add_family('storage_dis', units,
+                             upper=[[data.units[s].Pdis_max] for s in units])
+        MODE = asm.add_family('storage_mode', units, upper=1.0, integer=True)
+
+        keys = [(s, t) for s in units for t in range(1, T + 1)]
+        # energy: E[t] - E[t-1] - eta_c dt ch + dt / eta_d dis == Eini (t = 1)
+        rhs = np.array([data.units[s].Eini if t == 1 else 0.0 for s, t in keys])
+        offset = asm.add_rows('storage_energy_balance_constraint', keys, rhs, rhs)
+        for i, s in enumerate(units):
+            unit = data.units[s]
+            rows = offset + i * T + periods
+            asm.add_entries(rows, E.columns(s), 1.0)
+            asm.add_entries(rows[1:], E.columns(s)[:-1], -1.0)
+            asm.add_entries(rows, CH.columns(s), -unit.eta_c * dt)
+            asm.add_entries(rows, DIS.columns(s), dt / unit.eta_d)
+
+        # no simultaneous charge and discharge (M = Emax)
+        M = np.array([data.units[s].Emax for s, _ in keys])
+        offset = asm.add_rows('storage_no_simul_charge_constraint', keys,
+                              np.full(len(keys), -np.inf), np.zeros(len(keys)))
+        for i, s in enumerate(units):
+            rows = offset + i * T + periods
+            asm.add_entries(rows, CH.columns(s), 1.0)
+            asm.add_entries(rows, MODE.columns(s), -data.units[s].Emax)
+        offset = asm.add_rows('storage_no_simul_discharge_constraint', keys,
+                              np.full(len(keys), -np.inf), M)
+        for i, s in enumerate(units):
+            rows = offset + i * T + periods
+            asm.add_entries(rows, DIS.columns(s), 1.0)
+            asm.add_entries(rows, MODE.columns(s), data.units[s].Emax)
+
+        for s in units:
+            add_term(data.units[s].bar, DIS.columns(s), 1.0)
+            add_term(data.units[s].bar, CH.columns(s), -1.0)
+        has_valid_units = True
+
+    if "lines" in root and root["lines"] is not None:
+        _validate_transmission_lines(root["lines"])
+        if not unique_bar:
+            data = _mk_transmission_line_data(root)
+            lines = tuple(data.units.keys())
+            F = asm.add_family('lines_flow', lines,
+                               lower=[[-data.units[l].pmax] for l in lines],
+                               upper=[[data.units[l].pmax] for l in lines])
+            dc = [l for l in lines if data.units[l].model == "dc"]
+            keys = [(l, t) for l in dc for t in range(1, T + 1)]
+            # DC flow: flow - p_base b (theta_i - theta_j) == 0
+            offset = asm.add_rows('FlowDefinitionConstraint', keys,
+                                  np.zeros(len(keys)), np.zeros(len(keys)))
+            for k, l in enumerate(dc):
+                unit = data.units[l]
+                i, j = unit.endpoints
+                rows = offset + k * T + periods
+                asm.add_entries(rows, F.columns(l), 1.0)
+                asm.add_entries(rows, theta.columns(i), -p_base * unit.b)
+                asm.add_entries(rows, theta.columns(j), p_base * unit.b)
+            for l in lines:
+                i, j = data.units[l].endpoints
+                add_term(i, F.columns(l), -1.0)
+                add_term(j, F.columns(l), 1.0)
+
+    if not has_valid_units:
+        raise ValueError("No buildable sections found. Provide at least one of "
+                         "{hydro, thermal, renewable, storage}.")
+
+    demand = {b: np.asarray(bar_data.units[b].demand, dtype=float) for b in bars}
+    _bar_rows(asm, bars, terms, demand, deficit)
+    return asm.model()
+
+
+def build_matrix_model_from_file(path: str) -> Tuple[MatrixModel, Dict]:
+    """
+    Assemble the sparse model of a case file.
+
+    Parameters
+    ----------
+    path : str
+        YAML/JSON case (same format as
+        :func:`~NaivePyDECOMP.Builder.build_model_from_file`).
+
+    Returns
+    -------
+    Tuple[MatrixModel, Dict]
+        The sparse model and the parsed case.
+    """
+    root = yaml_loader(path)
+    return build_matrix_model_from_data(root), root
+
+
+def _run_highs(mm: MatrixModel,
+               options: Dict[str, Any],
+               col_lower: np.ndarray,
+               col_upper: np.ndarray,
+               integrality: np.ndarray) -> Any:
+    """Pass the model to a new HiGHS instance and run it."""
+    try:
+        import highspy
+    except ImportError as e:
+        raise RuntimeError("The matrix backend requires highspy "
+                           "(pip install highspy).") from e
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = mm.n_cols
+    lp.num_row_ = mm.n_rows
+    lp.col_cost_ = mm.c
+    lp.col_lower_ = col_lower
+    lp.col_upper_ = col_upper
+    lp.row_lower_ = mm.row_lower
+    lp.row_upper_ = mm.row_upper
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = mm.A.indptr
+    lp.a_matrix_.index_ = mm.A.indices
+    lp.a_matrix_.value_ = mm.A.data
+    if integrality.any():
+        lp.integrality_ = [highspy.HighsVarType.kInteger if integer
+                           else highspy.HighsVarType.kContinuous
+                           for integer in integrality]
+
+    h = highspy.Highs()
+    h.setOptionValue('output_flag', False)
+    for name, option in normalize_solver_options('highs', options).items():
+        h.setOptionValue(name, option)
+    h.passModel(lp)
+    h.run()
+    return h
+
+
+def solve_matrix_model(mm: MatrixModel,
+                       options: Optional[Dict[str, Any]] = None) -> MatrixSolution:
+    """
+    Solve a sparse model with HiGHS.
+
+    Parameters
+    ----------
+    mm : MatrixModel
+        Model to solve.
+    options : dict, optional
+        ``meta.Solver_Options`` (see
+        :func:`~NaivePyDESSEM.SolverSession.normalize_solver_options`).
+
+    Returns
+    -------
+    MatrixSolution
+
+    Raises
+    ------
+    RuntimeError
+        If highspy is not installed or the model is not solved to
+        optimality.
+    """
+    options = options or {}
+    clock = time.perf_counter()
+    h = _run_highs(mm, options, mm.col_lower, mm.col_upper, mm.integrality)
+    status = h.modelStatusToString(h.getModelStatus())
+    if status != 'Optimal':
+        raise RuntimeError(f"Solve terminated with condition: {status}")
+    x = np.array(h.getSolution().col_value)
+    objective = float(h.getInfo().objective_function_value)
+
+    if mm.is_mip:
+        # duals of the LP with the integer columns fixed at the optimum
+        fixed = np.round(x[mm.integrality])
+        col_lower = mm.col_lower.copy()
+        col_upper = mm.col_upper.copy()
+        col_lower[mm.integrality] = fixed
+        col_upper[mm.integrality] = fixed
+        h = _run_highs(mm, options, col_lower, col_upper,
+                       np.zeros(mm.n_cols, dtype=bool))
+
+    solution = h.getSolution()
+    row_dual = np.array(solution.row_dual) if solution.dual_valid else None
+    return MatrixSolution(status=status,
+                          objective=objective,
+                          x=x,
+                          row_dual=row_dual,
+                          solve_time=time.perf_counter() - clock)
+
+
+def build_matrix_results(mm: MatrixModel,
+                         solution: MatrixSolution,
+                         root: Dict) -> MatrixResults:
+    """
+    Map a matrix solution to the attributes of the Pyomo model.
+
+    Parameters
+    ----------
+    mm : MatrixModel
+        Solved model.
+    solution : MatrixSolution
+        Its solution.
+    root : dict
+        Parsed case, completed by :func:`build_matrix_model_from_data`.
+
+    Returns
+    -------
+    MatrixResults
+        Results ready for :mod:`~NaivePyDECOMP.Reporting` and
+        :func:`~NaivePyDECOMP.DataFrames.build_dispatch_dataframe`.
+    """
+    T = mm.horizon
+    results = MatrixResults(T)
+    results.OBJ = solution.objective
+
+    def family(name: str) -> SeriesFamily:
+        f = mm.families[name]
+        return SeriesFamily(f.units,
+                            solution.x[f.offset:f.offset + f.size].reshape(len(f.units), T))
+
+    balance = mm.blocks['Balance']
+    n_bars = len(balance.keys) // T
+    if solution.row_dual is not None:
+        results.CMO = {t: float(solution.row_dual[balance.offset + (t - 1) * n_bars])
+                       for t in results.T}
+    else:
+        results.CMO = {t: 0.0 for t in results.T}
+
+    bar_data = _mk_connection_bar_data(root)
+    bars = mm.families['D'].units
+    results.CB = bars
+    results.SB = tuple(b for b, u in bar_data.units.items() if u.slack)
+    results.Cdef = {b: bar_data.units[b].Cdef for b in bars}
+    results.d = SeriesFamily(bars, np.array([bar_data.units[b].demand[:T]
+                                             for b in bars], dtype=float))
+    results.unique_bar = len(bars) == 1
+    results.D = family('D')
+    if not results.unique_bar:
+        results.theta = family('theta')
+
+    if 'lines_flow' in mm.families:
+        line_data = _mk_transmission_line_data(root)
+        lines = mm.families['lines_flow'].units
+        results.LT = lines
+        results.lines_transmission_model = {l: line_data.units[l].model for l in lines}
+        results.lines_b = {l: line_data.units[l].b for l in lines}
+        results.lines_pmax = {l: line_data.units[l].pmax for l in lines}
+        results.lines_endpoints = {l: line_data.units[l].endpoints for l in lines}
+        results.lines_flow = family('lines_flow')
+
+    if 'hydro_Q' in mm.families:
+        results.HG = mm.families['hydro_Q'].units
+        for name in ('hydro_Q', 'hydro_V', 'hydro_S', 'hydro_G'):
+            setattr(results, name, family(name))
+
+    if 'thermal_p' in mm.families:
+        thermal_data = _mk_thermal_data(root)
+        results.TG = mm.families['thermal_p'].units
+        results.thermal_Cost = {g: thermal_data.units[g].Cost for g in results.TG}
+        results.thermal_p = family('thermal_p')
+
+    if 'renewable_gen' in mm.families:
+        results.RU = mm.families['renewable_gen'].units
+        results.renewable_gen = family('renewable_gen')
+
+    if 'storage_E' in mm.families:
+        results.SU = mm.families['storage_E'].units
+        for name in ('storage_E', 'storage_ch', 'storage_dis'):
+            setattr(results, name, family(name))
+
+    return results
+
+
+def check_matrix_equivalence(path: str, tol: float = 1e-6) -> Dict[str, Any]:
+    """
+    Compare the matrix backend with the Pyomo model of a case.
+
+    Both models are built and solved (the Pyomo one with ``meta.Solver``).
+    The matrix optimum is then written into the Pyomo variables and every
+    active Pyomo constraint is evaluated: the two formulations are
+    equivalent when the matrix optimum is feasible for the Pyomo model and
+    both objectives agree.
+
+    Parameters
+    ----------
+    path : str
+        Case file.
+    tol : float, optional
+        Relative tolerance of the objective comparison. Default is 1e-6.
+
+    Returns
+    -------
+    dict
+        ``equivalent`` (bool), ``objective_pyomo``, ``objective_matrix``,
+        ``objective_gap`` (relative), ``max_violation`` (largest violation
+        of a Pyomo constraint by the matrix optimum), ``rows``/``cols`` of
+        both models and their build times from the parsed case
+        (``build_pyomo``, ``build_matrix``, in seconds).
+    """
+    root = yaml_loader(path)
+    clock = time.perf_counter()
+    mm = build_matrix_model_from_data(copy.deepcopy(root))
+    build_matrix = time.perf_counter() - clock
+
+    clock = time.perf_counter()
+    model, case = build_model_from_data(root)
+    build_pyomo = time.perf_counter() - clock
+
+    session = get_solver_session(case['meta']['Solver'],
+                                 case['meta'].get('Solver_Options', {}))
+    res = session.solve(model)
+    if res.solver.termination_condition not in [TerminationCondition.optimal,
+                                                TerminationCondition.feasible]:
+        raise RuntimeError("Solve terminated with condition: "
+                           f"{res.solver.termination_condition}")
+    objective_pyomo = float(value(model.OBJ))
+
+    solution = solve_matrix_model(mm, case['meta'].get('Solver_Options', {}))
+    for name, f in mm.families.items():
+        var = getattr(model, name)
+        values = solution.x[f.offset:f.offset + f.size].reshape(len(f.units), mm.horizon)
+        for i, unit in enumerate(f.units):
+            for t in range(1, mm.horizon + 1):
+                var[unit, t].set_value(float(values[i, t - 1]), skip_validation=True)
+
+    max_violation = 0.0
+    for constraint in model.component_data_objects(Constraint, active=True):
+        body = value(constraint.body)
+        if constraint.has_lb():
+            max_violation = max(max_violation, value(constraint.lower) - body)
+        if constraint.has_ub():
+            max_violation = max(max_violation, body - value(constraint.upper))
+
+    objective_matrix = float(value(model.OBJ))
+    gap = abs(objective_matrix - objective_pyomo) / max(abs(objective_pyomo), 1.0)
+    rows = sum(1 for _ in model.component_data_objects(Constraint, active=True))
+    return {'equivalent': bool(gap <= tol and max_violation <= 1e-6 * max(1.0, abs(objective_pyomo))),
+            'objective_pyomo': objective_pyomo,
+            'objective_matrix': objective_matrix,
+            'objective_gap': gap,
+            'max_violation': max_violation,
+            'rows_pyomo': rows,
+            'cols_pyomo': model.nvariables(),
+            'rows_matrix': mm.n_rows,
+            'cols_matrix': mm.n_cols,
+            'build_pyomo': build_pyomo,
+            'build_matrix': build_matrix}
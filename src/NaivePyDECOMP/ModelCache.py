@@ -0,0 +1,517 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: Compiled Model Cache
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+On-disk cache of the sparse models of the matrix backend
+(:mod:`~NaivePyDECOMP.MatrixBuilder`), so that re-running an unchanged case
+(regression runs, report regeneration) skips parsing, validation and
+assembly and hands the cached matrices straight to the solver.
+
+Every entry is one ``.npz`` file holding the arrays of a
+:class:`~NaivePyDECOMP.MatrixBuilder.MatrixModel` (CSC matrix, bounds,
+costs, integrality, column and row layout) and the normalized case, named
+after its key::
+
+    key = sha256(CACHE_FORMAT, package version, builder code,
+                 case_fingerprint(case))
+
+so a new release of the package, a new layout of the entries or an edit
+of ``MatrixBuilder.py``/``ModelCache.py`` (e.g. in an editable checkout,
+where the version does not change) never reads an old entry. Each case file additionally gets a small ``.src``
+record keyed by the digest of its bytes, pointing to the entry: a file
+whose text did not change is served without even being parsed. Two files
+with the same normalized content share one entry.
+
+Eviction runs after every store: entries not used for ``max_age_days`` are
+removed, then the least recently used ones until the cache fits in
+``max_size_mb``. A hit refreshes the modification time of the entry.
+
+Classes
+-------
+ModelCache
+    Directory of compiled models with size and age limits.
+
+Functions
+---------
+default_cache_dir()
+    Default cache directory.
+package_version()
+    Installed version of the package.
+code_digest()
+    Digest of the sources that compile and store the models.
+cache_key(case)
+    Key of the compiled model of a parsed case.
+source_digest(path)
+    Digest of the text of a case file.
+matrix_model_arrays(mm, case)
+    Flatten a model and its case into NumPy arrays.
+restore_matrix_model(data)
+    Rebuild a model and its case from the arrays.
+
+Notes
+-----
+- The cache directory is ``$NAIVEPY_CACHE_DIR``, else
+  ``$XDG_CACHE_HOME/naivepy/models``, else ``~/.cache/naivepy/models``.
+- Files are written atomically (temporary file and ``os.replace``), so
+  concurrent runs of the same case never read a truncated entry.
+- The ``.src`` digest covers the text of the case file only; external
+  files referenced by the case are not part of it.
+- Only the matrix backend is cached: a serialized Pyomo model could not
+  map the solution back to its components.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+from scipy import sparse
+
+from .MatrixBuilder import ConstraintBlock, MatrixModel, VariableFamily
+from .YAMLLoader import case_fingerprint
+
+# bumped whenever the layout of the entries changes
+CACHE_FORMAT = 1
+
+PACKAGE_NAME = 'naivepydessem'
+
+
+def default_cache_dir() -> str:
+    """
+    Default cache directory.
+
+    Returns
+    -------
+    str
+        ``$NAIVEPY_CACHE_DIR``, else ``$XDG_CACHE_HOME/naivepy/models``,
+        else ``~/.cache/naivepy/models``.
+    """
+    if os.environ.get('NAIVEPY_CACHE_DIR'):
+        return os.environ['NAIVEPY_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'),
+                                                           '.cache')
+    return os.path.join(base, 'naivepy', 'models')
+
+
+def package_version() -> str:
+    """
+    Installed version of the package (``'unknown'`` when not installed).
+    """
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover - Python < 3.8
+        return 'unknown'
+    try:
+        return version(PACKAGE_NAME)
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+@functools.lru_cache(maxsize=None)
+def code_digest() -> str:
+    """
+    Digest of the sources that compile and store the models.
+
+    Returns
+    -------
+    str
+        SHA-256 of ``MatrixBuilder.py`` and ``ModelCache.py``, so that
+        editing either one invalidates the entries even when the package
+        version stays the same.
+    """
+    h = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ('MatrixBuilder.py', 'ModelCache.py'):
+        with open(os.path.join(here, name), 'rb') as stream:
+            h.update(stream.read())
+    return h.hexdigest()
+
+
+def _digest(*parts: bytes) -> str:
+    """SHA-256 of the cache format, the package version, the builder
+    code and ``parts``."""
+    h = hashlib.sha256(f"{CACHE_FORMAT}:{package_version()}:{code_digest()}:"
+                       .encode('utf-8'))
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()
+
+
+def cache_key(case: Dict[str, Any]) -> str:
+    """
+    Key of the compiled model of a case.
+
+    Parameters
+    ----------
+    case : dict
+        Case parsed by :func:`~NaivePyDECOMP.YAMLLoader.yaml_loader`.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the cache format, the package version, the
+        builder code (:func:`code_digest`) and
+        :func:`~NaivePyDESSEM.YAMLLoader.case_fingerprint` of the case.
+    """
+    return _digest(case_fingerprint(case).encode('ascii'))
+
+
+def source_digest(path: str) -> str:
+    """
+    Digest of the text of a case file.
+
+    Parameters
+    ----------
+    path : str
+        Case file.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the cache format, the package version, the
+        builder code and the bytes of the file.
+    """
+    with open(path, 'rb') as stream:
+        return _digest(stream.read())
+
+
+def _text_array(payload: Any) -> np.ndarray:
+    """JSON payload as a byte array (no pickling needed to read it back)."""
+    return np.frombuffer(json.dumps(payload, separators=(',', ':')).encode('utf-8'),
+                         dtype=np.uint8)
+
+
+def _text_value(array: np.ndarray) -> Any:
+    """Inverse of :func:`_text_array`."""
+    return json.loads(array.tobytes().decode('utf-8'))
+
+
+def matrix_model_arrays(mm: MatrixModel, case: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Flatten a sparse model and its case into NumPy arrays.
+
+    Parameters
+    ----------
+    mm : MatrixModel
+        Compiled model.
+    case : dict
+        Case completed by
+        :func:`~NaivePyDECOMP.MatrixBuilder.build_matrix_model_from_data`.
+
+    Returns
+    -------
+    dict
+        CSC arrays (``data``, ``indices``, ``indptr``, ``shape``), bounds,
+        costs, ``integrality``, the column and row layout and the case.
+    """
+    A = sparse.csc_matrix(mm.A)
+    return {
+        'horizon': np.array(mm.horizon, dtype=int),
+        'data': A.data,
+        'indices': A.indices,
+        'indptr': A.indptr,
+        'shape': np.array(A.shape, dtype=np.int64),
+        'row_lower': mm.row_lower,
+        'row_upper': mm.row_upper,
+        'c': mm.c,
+        'col_lower': mm.col_lower,
+        'col_upper': mm.col_upper,
+        'integrality': mm.integrality,
+        'families': _text_array({name: [f.offset, list(f.units)]
+                                 for name, f in mm.families.items()}),
+        'blocks': _text_array({name: [b.offset, [list(k) for k in b.keys]]
+                               for name, b in mm.blocks.items()}),
+        'case': _text_array(case)
+    }
+
+
+def restore_matrix_model(data) -> Tuple[MatrixModel, Dict[str, Any]]:
+    """
+    Rebuild a sparse model and its case from :func:`matrix_model_arrays`.
+
+    Parameters
+    ----------
+    data : mapping
+        Arrays as returned by :func:`matrix_model_arrays` (or an open
+        ``.npz``).
+
+    Returns
+    -------
+    mm : MatrixModel
+    case : dict
+    """
+    horizon = int(data['horizon'])
+    families = {name: VariableFamily(int(offset), tuple(units), horizon)
+                for name, (offset, units) in _text_value(data['families']).items()}
+    blocks = {name: ConstraintBlock(int(offset), tuple((k[0], int(k[1])) for k in keys))
+              for name, (offset, keys) in _text_value(data['blocks']).items()}
+    A = sparse.csc_matrix((data['data'], data['indices'], data['indptr']),
+                          shape=tuple(int(n) for n in data['shape']))
+    mm = MatrixModel(horizon=horizon,
+                     families=families,
+                     blocks=blocks,
+                     A=A,
+                     row_lower=np.asarray(data['row_lower'], dtype=float),
+                     row_upper=np.asarray(data['row_upper'], dtype=float),
+                     c=np.asarray(data['c'], dtype=float),
+                     col_lower=np.asarray(data['col_lower'], dtype=float),
+                     col_upper=np.asarray(data['col_upper'], dtype=float),
+                     integrality=np.asarray(data['integrality'], dtype=bool))
+    return mm, _text_value(data['case'])
+
+
+def _atomic_write(path: str, write) -> None:
+    """Write ``path`` through a temporary file replaced with ``os.replace``."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.cache-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as stream:
+            write(stream)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@dataclass
+class ModelCache:
+    """
+    Directory of compiled models.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Cache directory (default :func:`default_cache_dir`).
+    max_size_mb : float, optional
+        Size limit of the entries (default 1024 MB).
+    max_age_days : float, optional
+        Entries unused for longer are evicted (default 30 days).
+    """
+    directory: Optional[str] = None
+    max_size_mb: float = 1024.0
+    max_age_days: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.directory is None:
+            self.directory = default_cache_dir()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _source_path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.src")
+
+    def _read(self, key: str) -> Optional[Tuple[MatrixModel, Dict[str, Any]]]:
+        """Load an entry and refresh its time, or ``None`` when unreadable."""
+        path = self._entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                entry = restore_matrix_model(data)
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    def load_file(self, path: str) -> Optional[Tuple[MatrixModel, Dict[str, Any]]]:
+        """
+        Compiled model of an unchanged case file, without parsing it.
+
+        Parameters
+        ----------
+        path : str
+            Case file.
+
+        Returns
+        -------
+        (MatrixModel, dict) or None
+            The model and its completed case, or ``None`` on a miss.
+        """
+        try:
+            with open(self._source_path(source_digest(path)), 'r',
+                      encoding='utf-8') as stream:
+                key = json.load(stream)['key']
+        except (OSError, ValueError, KeyError):
+            return None
+        return self._read(key)
+
+    def load(self, case: Dict[str, Any]) -> Optional[Tuple[MatrixModel, Dict[str, Any]]]:
+        """
+        Compiled model of a parsed case.
+
+        Parameters
+        ----------
+        case : dict
+            Case parsed by :func:`~NaivePyDECOMP.YAMLLoader.yaml_loader`.
+
+        Returns
+        -------
+        (MatrixModel, dict) or None
+            The model and its completed case, or ``None`` on a miss.
+        """
+        return self._read(cache_key(case))
+
+    def store(self,
+              key: str,
+              mm: MatrixModel,
+              case: Dict[str, Any],
+              source: Optional[str] = None) -> None:
+        """
+        Store a compiled model, then evict old and excess entries.
+
+        Parameters
+        ----------
+        key : str
+            :func:`cache_key` of the case as parsed, before the builder
+            completed it.
+        mm : MatrixModel
+            Compiled model.
+        case : dict
+            Completed case, returned with the model on a hit.
+        source : str, optional
+            Case file; when given, its text is recorded so the next run of
+            the unchanged file skips parsing.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        arrays = matrix_model_arrays(mm, case)
+        _atomic_write(self._entry_path(key), lambda stream: np.savez(stream, **arrays))
+        if source is not None:
+            self.link(source, key)
+        self.evict(keep=key)
+
+    def link(self, source: str, key: str) -> None:
+        """
+        Record that the current text of a case file compiles to ``key``.
+
+        Parameters
+        ----------
+        source : str
+            Case file.
+        key : str
+            Key of a stored entry.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        record = json.dumps({'key': key, 'file': os.path.abspath(source)})
+        _atomic_write(self._source_path(source_digest(source)),
+                      lambda stream: stream.write(record.encode('utf-8')))
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """``(mtime, size, path)`` of every entry, least recently used first."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            if not name.endswith('.npz'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def _drop_stale_sources(self) -> None:
+        """Remove the ``.src`` records whose entry is gone."""
+        for name in os.listdir(self.directory):
+            if not name.endswith('.src'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as stream:
+                    key = json.load(stream)['key']
+                stale = not os.path.exists(self._entry_path(key))
+            except (OSError, ValueError, KeyError):
+                stale = True
+            if stale:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Remove the entries older than ``max_age_days``, then the least
+        recently used ones until the cache fits in ``max_size_mb``.
+
+        Parameters
+        ----------
+        keep : str, optional
+            Key never evicted (the entry just stored).
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        entries = self._entries()
+        if not entries:
+            return 0
+        kept = self._entry_path(keep) if keep is not None else None
+        limit = self.max_size_mb * 1024 ** 2
+        oldest = time.time() - self.max_age_days * 86400.0
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if path == kept or (mtime >= oldest and total <= limit):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            self._drop_stale_sources()
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry and source record.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        entries = self._entries()
+        for _, _, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if os.path.isdir(self.directory):
+            self._drop_stale_sources()
+        return len(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Number of entries and total size of the cache.
+
+        Returns
+        -------
+        dict
+            ``directory``, ``entries`` and ``size_mb``.
+        """
+        entries = self._entries()
+        return {'directory': self.directory,
+                'entries': len(entries),
+                'size_mb': sum(size for _, size, _ in entries) / 1024 ** 2}
@@ -31,7 +31,7 @@ References
 """
 
 from pyomo.environ import ConcreteModel, value
-from typing import Any, Tuple, Dict
+from typing import Any, Tuple, Dict, Optional
 from colorama import Fore, Style
 from NaivePyDESSEM.ModelFormatters import (
     format_renewable_model,
@@ -55,7 +55,7 @@ def print_welcome_banner():
     print(f"{Fore.BLUE}Author: {Fore.WHITE}{Style.BRIGHT}Augusto Mathias Adams {Fore.BLUE}<augusto.adams@ufpr.br>")
 
 
-def print_welcome_message(model: ConcreteModel, case: Dict) -> None:
+def print_welcome_message(model: Optional[ConcreteModel], case: Dict) -> None:
     """
     Display the full welcome message and solver configuration.
 
@@ -64,8 +64,10 @@ def print_welcome_message(model: ConcreteModel, case: Dict) -> None:
 
     Parameters
     ----------
-    model : ConcreteModel
-        The Pyomo model instance.
+    model : ConcreteModel or None
+        The Pyomo model instance. The message is built from ``case`` only,
+        so decomposed solvers pass ``None`` instead of building the
+        monolithic model.
     case : dict
         Configuration dictionary loaded from YAML or JSON input.
     """
@@ -0,0 +1,200 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Checkpoints
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Periodic snapshots of a running PDDD so that a crashed, failed or killed
+run can continue from its last completed iteration instead of starting
+from scratch. A checkpoint holds:
+
+- the cut pool (cuts, trial points, activity and case fingerprint);
+- the current trial trajectory (initial volumes and energies of every
+  stage);
+- the bound history (ZINF, ZSUP);
+- the number of completed iterations.
+
+Files are written atomically: the snapshot goes to a temporary file in the
+same directory, which then replaces the previous checkpoint with
+``os.replace``, so a crash during the write never leaves a truncated
+checkpoint behind.
+
+Functions
+---------
+checkpoint_due(iteration, last_time, every, seconds)
+    Whether a checkpoint should be written after ``iteration``.
+save_pddd_checkpoint(path, pool, iteration, ZINF, ZSUP, stage_hydros, stage_storage)
+    Atomically write a checkpoint.
+load_pddd_checkpoint(path, pool, stage_hydros, stage_storage)
+    Restore a checkpoint into a fresh pool and the per-stage state.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from typing import Any, Dict, List, Optional
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from .PDDDCutPool import CutPool, cut_pool_arrays, restore_cut_pool
+
+
+def checkpoint_due(iteration: int,
+                   last_time: float,
+                   every: Optional[int],
+                   seconds: Optional[float]) -> bool:
+    """
+    Decide whether a checkpoint is due.
+
+    Parameters
+    ----------
+    iteration : int
+        Number of completed iterations.
+    last_time : float
+        ``time.monotonic()`` of the previous checkpoint (or of the start).
+    every : int or None
+        Write every ``every`` iterations.
+    seconds : float or None
+        Write when ``seconds`` have elapsed since ``last_time``.
+
+    Returns
+    -------
+    bool
+    """
+    if every and iteration % every == 0:
+        return True
+    if seconds and time.monotonic() - last_time >= seconds:
+        return True
+    return False
+
+
+def save_pddd_checkpoint(path: str,
+                         pool: CutPool,
+                         iteration: int,
+                         ZINF: List[float],
+                         ZSUP: List[float],
+                         stage_hydros: List[Dict],
+                         stage_storage: List[Any]) -> None:
+    """
+    Atomically write a PDDD checkpoint to a ``.npz`` file.
+
+    Parameters
+    ----------
+    path : str
+        Checkpoint file.
+    pool : CutPool
+        Cut pool of the run.
+    iteration : int
+        Number of completed iterations.
+    ZINF, ZSUP : list of float
+        Bound history.
+    stage_hydros : list of dict
+        Hydro section of every stage (trial initial volumes).
+    stage_storage : list of dict or None
+        Storage section of every stage (trial initial energies).
+    """
+    arrays = cut_pool_arrays(pool)
+    arrays['iteration'] = np.array(iteration, dtype=int)
+    arrays['rejected'] = np.array(pool.rejected, dtype=int)
+    arrays['ZINF'] = np.asarray(ZINF, dtype=float)
+    arrays['ZSUP'] = np.asarray(ZSUP, dtype=float)
+    hydro_units = list(stage_hydros[0]['units'].keys())
+    arrays['hydro_units'] = np.array(hydro_units, dtype=str)
+    arrays['trial_V'] = np.array([[float(stage['units'][uhe]['Vini'])
+                                   for uhe in hydro_units]
+                                  for stage in stage_hydros]).reshape(len(stage_hydros),
+                                                                      len(hydro_units))
+    if stage_storage and stage_storage[0] is not None:
+        sunits = list(stage_storage[0]['units'].keys())
+        arrays['storage_units'] = np.array(sunits, dtype=str)
+        arrays['trial_E'] = np.array([[float(stage['units'][s]['Eini'])
+                                       for s in sunits]
+                                      for stage in stage_storage])
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.checkpoint-', suffix='.tmp',
+                                    dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as stream:
+            np.savez_compressed(stream, **arrays)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_pddd_checkpoint(path: str,
+                         pool: CutPool,
+                         stage_hydros: List[Dict],
+                         stage_storage: List[Any]) -> Dict[str, Any]:
+    """
+    Restore a PDDD checkpoint.
+
+    The cuts are added to ``pool`` (which must be empty) and the trial
+    initial volumes/energies are written back into ``stage_hydros`` and
+    ``stage_storage``.
+
+    Parameters
+    ----------
+    path : str
+        Checkpoint file written by :func:`save_pddd_checkpoint`.
+    pool : CutPool
+        Empty pool of the resumed run, created with the fingerprint of the
+        current case.
+    stage_hydros : list of dict
+        Hydro section of every stage, updated in place.
+    stage_storage : list of dict or None
+        Storage section of every stage, updated in place.
+
+    Returns
+    -------
+    dict
+        ``iteration`` (completed iterations), ``ZINF`` and ``ZSUP`` (bound
+        history as lists).
+
+    Raises
+    ------
+    ValueError
+        If the checkpoint belongs to a different case or horizon.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        if str(data['fingerprint']) != pool.fingerprint:
+            raise ValueError(
+                f"Checkpoint '{path}' was written for a different case.")
+        if len(data['trial_V']) != len(stage_hydros):
+            raise ValueError(
+                f"Checkpoint '{path}' has {len(data['trial_V'])} stages, "
+                f"expected {len(stage_hydros)}.")
+
+        units = [str(unit) for unit in data['hydro_units']]
+        restore_cut_pool(data, pool, source=path)
+        pool.rejected = int(data['rejected'])
+        pool.iteration = int(data['iteration'])
+
+        for stage, volumes in zip(stage_hydros, data['trial_V']):
+            for uhe, volume in zip(units, volumes.tolist()):
+                stage['units'][uhe]['Vini'] = volume
+        if 'trial_E' in data:
+            sunits = [str(unit) for unit in data['storage_units']]
+            for stage, energies in zip(stage_storage, data['trial_E']):
+                for sunit, energy in zip(sunits, energies.tolist()):
+                    stage['units'][sunit]['Eini'] = energy
+
+        return {'iteration': int(data['iteration']),
+                'ZINF': data['ZINF'].tolist(),
+                'ZSUP': data['ZSUP'].tolist()}
@@ -0,0 +1,194 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Convergence Control
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Options that shape the convergence of a PDDD run, both read from
+``meta.PDDD_Options``:
+
+- ``regularization``: regularized forward pass. Each forward-pass stage
+  adds a proximal term (L1 or quadratic) that attracts its final state to
+  the final state of the same stage in the previous iteration, so the
+  trial trajectory no longer jumps between extreme points of the cut
+  approximation. The weight decays geometrically, so the plain forward
+  pass is recovered after a few iterations::
+
+      regularization:
+        type: l1          # or quadratic (QP-capable solver)
+        weight: 10.0      # weight of the first regularized iteration
+        decay: 0.5        # weight[k + 1] = decay * weight[k]
+        min_weight: 0.01  # below this value the term is switched off
+
+- ``stopping``: adaptive stopping rule, on top of the absolute tolerance
+  ``tol`` of :func:`~NaivePyDECOMP.SolverPDDD.solve_pddd`::
+
+      stopping:
+        rel_gap: 1.0e-4      # |ZSUP - ZINF| <= rel_gap * |ZSUP|
+        stall_iterations: 10 # ZINF improved less than stall_tol ...
+        stall_tol: 1.0e-6    # ... (relative) in the last 10 iterations
+
+Classes
+-------
+RegularizationSchedule
+    Type and weight schedule of the regularized forward pass.
+StoppingRule
+    Gap and stall based stopping rule.
+
+Notes
+-----
+- Only the forward pass is regularized: the backward pass (and hence
+  every cut) and the lower bound ZINF come from plain stage problems.
+- ZSUP excludes the proximal terms: it is the cost of the (regularized)
+  trial policy, still a valid upper bound of the deterministic problem.
+
+References
+----------
+[1] Asamov, T.; Powell, W. B. Regularized Decomposition of High-Dimensional
+    Multistage Stochastic Programs with Markov Uncertainty. SIAM J.
+    Optimization, 2018.
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .SolverSession import solver_accepts_qp
+
+
+@dataclass
+class RegularizationSchedule:
+    """
+    Weight schedule of the regularized forward pass.
+
+    Parameters
+    ----------
+    type : str
+        ``l1`` or ``quadratic``.
+    weight : float
+        Weight of the first regularized iteration.
+    decay : float
+        Geometric decay of the weight between iterations.
+    min_weight : float
+        Weights below this value switch the regularization off.
+    """
+    type: str = 'l1'
+    weight: float = 1.0
+    decay: float = 0.5
+    min_weight: float = 1e-6
+
+    @classmethod
+    def from_options(cls, options: Optional[Dict[str, Any]],
+                     solver: Optional[str] = None) -> Optional['RegularizationSchedule']:
+        """
+        Build a schedule from ``meta.PDDD_Options.regularization``.
+
+        Returns ``None`` when the option is absent or empty. ``solver``
+        (``meta.Solver``) is checked against the ``quadratic`` type.
+
+        Raises
+        ------
+        ValueError
+            If the type is unknown, the weights are not positive or the
+            type is ``quadratic`` and ``solver`` cannot take quadratic
+            objectives (e.g. HiGHS, glpk, cbc).
+        """
+        if not options:
+            return None
+        schedule = cls(type=str(options.get('type', cls.type)),
+                       weight=float(options.get('weight', cls.weight)),
+                       decay=float(options.get('decay', cls.decay)),
+                       min_weight=float(options.get('min_weight', cls.min_weight)))
+        if schedule.type not in ('l1', 'quadratic'):
+            raise ValueError(f"Unknown regularization type '{schedule.type}'. "
+                             "Use 'l1' or 'quadratic'.")
+        if schedule.type == 'quadratic' and solver is not None \
+                and not solver_accepts_qp(solver):
+            raise ValueError(f"regularization.type 'quadratic' needs a QP solver "
+                             f"(gurobi, cplex, xpress, ...); '{solver}' cannot "
+                             "take quadratic objectives. Use type 'l1'.")
+        if schedule.weight <= 0 or not 0 <= schedule.decay <= 1:
+            raise ValueError("regularization.weight must be positive and "
+                             "regularization.decay must lie in [0, 1].")
+        return schedule
+
+    def weight_at(self, iteration: int) -> float:
+        """
+        Weight of the forward pass of ``iteration`` (0-based).
+
+        The first iteration has no previous trajectory and is never
+        regularized; the weight then decays from ``weight`` and drops to
+        0 once it falls below ``min_weight``.
+        """
+        if iteration < 1:
+            return 0.0
+        weight = self.weight * self.decay ** (iteration - 1)
+        return weight if weight >= self.min_weight else 0.0
+
+
+@dataclass
+class StoppingRule:
+    """
+    Stopping rule of a PDDD run.
+
+    Parameters
+    ----------
+    tol : float
+        Absolute tolerance on ``|ZSUP - ZINF|``.
+    rel_gap : float, optional
+        Relative tolerance on ``|ZSUP - ZINF| / |ZSUP|``.
+    stall_iterations : int, optional
+        Window (iterations) of the stall test on ZINF.
+    stall_tol : float
+        Relative improvement of ZINF over the window below which the run
+        is considered stalled.
+    """
+    tol: float = 0.01
+    rel_gap: Optional[float] = None
+    stall_iterations: Optional[int] = None
+    stall_tol: float = 1e-6
+
+    @classmethod
+    def from_options(cls, tol: float,
+                     options: Optional[Dict[str, Any]]) -> 'StoppingRule':
+        """Build a rule from ``tol`` and ``meta.PDDD_Options.stopping``."""
+        options = options or {}
+        rel_gap = options.get('rel_gap')
+        stall_iterations = options.get('stall_iterations')
+        return cls(tol=float(tol),
+                   rel_gap=None if rel_gap is None else float(rel_gap),
+                   stall_iterations=None if stall_iterations is None else int(stall_iterations),
+                   stall_tol=float(options.get('stall_tol', cls.stall_tol)))
+
+    def check(self, ZINF: List[float], ZSUP: List[float]) -> Optional[str]:
+        """
+        Test the bound history.
+
+        Parameters
+        ----------
+        ZINF, ZSUP : list of float
+            Bounds of every iteration so far.
+
+        Returns
+        -------
+        str or None
+            Reason to stop (``gap``, ``relative gap`` or ``stall``), or
+            ``None`` to keep iterating.
+        """
+        gap = abs(ZSUP[-1] - ZINF[-1])
+        if gap <= self.tol:
+            return 'gap'
+        if self.rel_gap is not None and gap <= self.rel_gap * max(abs(ZSUP[-1]), 1e-12):
+            return 'relative gap'
+        n = self.stall_iterations
+        if n and len(ZINF) > n:
+            improvement = ZINF[-1] - ZINF[-1 - n]
+            if improvement <= self.stall_tol * max(abs(ZINF[-1]), 1.0):
+                return 'stall'
+        return None
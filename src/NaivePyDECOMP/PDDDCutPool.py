@@ -0,0 +1,509 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Cut Pool
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Storage and selection of the Benders cuts generated by the PDDD/SDDP
+solvers. The cuts of each stage are kept as a dense NumPy matrix (one row
+per cut, one column per state unit: hydro volumes and storage energies)
+plus an intercept vector, so the pool can reject duplicates and rank cuts
+with a few matrix products instead of Python loops over dictionaries.
+
+Only the selected cuts of a stage are loaded into its model:
+
+- ``all``: every stored cut (the classic PDDD behaviour);
+- ``level1``: Level-1 dominance — a cut is kept if it is the highest one at
+  one or more of the trial points visited so far;
+- ``last_k``: a cut is kept if it was binding at a forward pass point (or
+  was created) in one of the last ``k`` iterations.
+
+Classes
+-------
+CutPool
+    Per-stage cut matrices, deduplication, selection and statistics.
+
+Functions
+---------
+cut_pool_arrays(pool), restore_cut_pool(data, pool)
+    Flatten a pool into NumPy arrays and add such arrays back to a pool.
+save_cut_pool(pool, path)
+    Write the cuts, trial points, unit names and case fingerprint of a pool
+    to a compressed ``.npz`` file.
+load_cut_pool(path, pool)
+    Add the cuts of a ``.npz`` file to a pool (warm start).
+
+Notes
+-----
+- Cuts enter and leave the pool as dictionaries with keys ``id``,
+  ``stage``, ``rhs`` and ``coefs`` (unit name → coefficient), the format
+  consumed by :func:`NaivePyDECOMP.BuilderPDDD.add_pddd_cuts`.
+- Cuts are never removed from the pool: a cut left out by the selection
+  may be loaded again later.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] de Matos, V. L.; Philpott, A. B.; Finardi, E. C. Improving the
+    performance of Stochastic Dual Dynamic Programming. Journal of
+    Computational and Applied Mathematics, 290, 2015.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .PDDDFutureCost import FutureCostFunction
+
+CUT_SELECTION_STRATEGIES = ('all', 'level1', 'last_k')
+
+
+@dataclass
+class CutPool:
+    """
+    Benders cuts of every PDDD stage.
+
+    Parameters
+    ----------
+    units : Tuple[str, ...]
+        Names of the state units (hydro volumes and storage energies),
+        fixing the column order of the matrices.
+    tol : float, optional
+        Relative tolerance used to detect duplicate cuts, ties in the
+        dominance test and binding cuts (default is 1e-6).
+    strategy : str, optional
+        Selection strategy: ``all``, ``level1`` or ``last_k``.
+    last_k : int, optional
+        Window (in iterations) of the ``last_k`` strategy (default is 5).
+    fingerprint : str, optional
+        Fingerprint of the case the cuts belong to (see
+        :func:`NaivePyDESSEM.YAMLLoader.case_fingerprint`).
+    """
+    units: Tuple[str, ...]
+    tol: float = 1e-6
+    strategy: str = 'all'
+    last_k: int = 5
+    fingerprint: str = ''
+    rejected: int = 0
+    iteration: int = 0
+    _A: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _b: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _trial: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _points: Dict[int, List[np.ndarray]] = field(default_factory=dict, repr=False)
+    _level1: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _ids: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _last_active: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _size: Dict[int, int] = field(default_factory=dict, repr=False)
+    _next_id: int = field(default=0, repr=False)
+
+    def __post_init__(self):
+        self.units = tuple(self.units)
+        if self.strategy not in CUT_SELECTION_STRATEGIES:
+            raise ValueError(
+                f"Unknown cut selection strategy '{self.strategy}'. "
+                f"Use one of: {', '.join(CUT_SELECTION_STRATEGIES)}")
+
+    # ------------------------------------------------------------------
+    # storage
+    # ------------------------------------------------------------------
+
+    def _vector(self, values: Dict[str, float]) -> np.ndarray:
+        return np.array([float(values.get(unit, 0.0)) for unit in self.units])
+
+    def _reserve(self, stage: int) -> None:
+        """Grow the arrays of ``stage`` (capacity doubling)."""
+        nh = len(self.units)
+        if stage not in self._A:
+            self._A[stage] = np.zeros((8, nh))
+            self._b[stage] = np.zeros(8)
+            self._trial[stage] = np.full((8, nh), np.nan)
+            self._ids[stage] = np.zeros(8, dtype=int)
+            self._last_active[stage] = np.zeros(8, dtype=int)
+            self._size[stage] = 0
+        elif self._size[stage] == len(self._b[stage]):
+            grow = len(self._b[stage])
+            self._A[stage] = np.vstack([self._A[stage], np.zeros((grow, nh))])
+            self._b[stage] = np.concatenate([self._b[stage], np.zeros(grow)])
+            self._trial[stage] = np.vstack([self._trial[stage],
+                                            np.full((grow, nh), np.nan)])
+            self._ids[stage] = np.concatenate([self._ids[stage],
+                                               np.zeros(grow, dtype=int)])
+            self._last_active[stage] = np.concatenate(
+                [self._last_active[stage], np.zeros(grow, dtype=int)])
+
+    def matrix(self, stage: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coefficients and intercepts of the cuts of a stage.
+
+        Returns
+        -------
+        A : np.ndarray
+            ``(n_cuts, n_state)`` coefficient matrix (a view, do not modify).
+        b : np.ndarray
+            ``(n_cuts,)`` intercept vector (a view, do not modify).
+        """
+        n = self._size.get(stage, 0)
+        if n == 0:
+            return np.zeros((0, len(self.units))), np.zeros(0)
+        return self._A[stage][:n], self._b[stage][:n]
+
+    def future_cost(self, stage: int) -> FutureCostFunction:
+        """
+        Future cost function of ``stage`` built from all of its stored cuts.
+
+        Returns
+        -------
+        FutureCostFunction
+            Evaluator over a copy of the cut matrix of the stage.
+        """
+        A, b = self.matrix(stage)
+        return FutureCostFunction(units=self.units, A=A.copy(), b=b.copy())
+
+    def trial_points(self, stage: int) -> np.ndarray:
+        """
+        Volumes at which each cut of ``stage`` was generated.
+
+        Returns
+        -------
+        np.ndarray
+            ``(n_cuts, n_state)`` array aligned with :meth:`matrix`; rows of
+            cuts added without a trial point are NaN.
+        """
+        n = self._size.get(stage, 0)
+        if n == 0:
+            return np.zeros((0, len(self.units)))
+        return self._trial[stage][:n]
+
+    def stages(self) -> List[int]:
+        """Stages with at least one cut, in increasing order."""
+        return sorted(stage for stage, n in self._size.items() if n > 0)
+
+    def is_duplicate(self, stage: int, coefs: np.ndarray, rhs: float) -> bool:
+        """Whether a cut equal to ``(coefs, rhs)`` within ``tol`` is stored."""
+        A, b = self.matrix(stage)
+        if len(b) == 0:
+            return False
+        same_coefs = np.all(np.abs(A - coefs) <= self.tol * np.maximum(1.0, np.abs(coefs)),
+                            axis=1)
+        same_rhs = np.abs(b - rhs) <= self.tol * max(1.0, abs(rhs))
+        return bool(np.any(same_coefs & same_rhs))
+
+    def add(self,
+            cut: Dict,
+            trial: Optional[Dict[str, float]] = None) -> bool:
+        """
+        Store a new cut unless it duplicates a stored one.
+
+        Parameters
+        ----------
+        cut : dict
+            Cut with keys ``stage``, ``rhs`` and ``coefs``.
+        trial : dict, optional
+            Volumes (unit name → hm³) at which the cut was generated. The
+            point is recorded for the Level-1 dominance test even when the
+            cut itself is a duplicate.
+
+        Returns
+        -------
+        bool
+            ``True`` if the cut was stored, ``False`` if it was rejected as
+            a duplicate.
+        """
+        stage = int(cut['stage'])
+        coefs = self._vector(cut['coefs'])
+        rhs = float(cut['rhs'])
+
+        if trial is not None:
+            self._points.setdefault(stage, []).append(self._vector(trial))
+            self._level1.pop(stage, None)
+
+        if self.is_duplicate(stage, coefs, rhs):
+            self.rejected += 1
+            return False
+
+        self._reserve(stage)
+        n = self._size[stage]
+        self._A[stage][n] = coefs
+        self._b[stage][n] = rhs
+        if trial is not None:
+            self._trial[stage][n] = self._points[stage][-1]
+        self._level1.pop(stage, None)
+        self._ids[stage][n] = self._next_id
+        self._last_active[stage][n] = self.iteration
+        self._size[stage] = n + 1
+        self._next_id += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # selection
+    # ------------------------------------------------------------------
+
+    def mark_active(self, stage: int, volumes: np.ndarray) -> None:
+        """
+        Record the cuts of ``stage`` binding at a forward pass point.
+
+        Parameters
+        ----------
+        stage : int
+            Stage whose future cost is evaluated.
+        volumes : np.ndarray
+            Final volumes of the stage, in the order of ``units``.
+        """
+        A, b = self.matrix(stage)
+        if len(b) == 0:
+            return
+        values = A @ volumes + b
+        top = values.max()
+        binding = values >= top - self.tol * max(1.0, abs(top))
+        self._last_active[stage][:len(b)][binding] = self.iteration
+
+    def level1_mask(self, stage: int) -> np.ndarray:
+        """
+        Cuts of ``stage`` that are the highest at some trial point.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask over the cuts of the stage. When no trial point
+            was recorded, every cut is kept.
+        """
+        A, b = self.matrix(stage)
+        if len(b) == 0:
+            return np.zeros(0, dtype=bool)
+        if not self._points.get(stage):
+            return np.ones(len(b), dtype=bool)
+        if stage not in self._level1:
+            values = np.array(self._points[stage]) @ A.T + b
+            top = values.max(axis=1, keepdims=True)
+            ties = values >= top - self.tol * np.maximum(1.0, np.abs(top))
+            self._level1[stage] = ties.any(axis=0)
+        return self._level1[stage]
+
+    def selection_mask(self, stage: int) -> np.ndarray:
+        """Boolean mask of the cuts of ``stage`` loaded into its model."""
+        n = self._size.get(stage, 0)
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+        if self.strategy == 'level1':
+            return self.level1_mask(stage)
+        if self.strategy == 'last_k':
+            return self._last_active[stage][:n] > self.iteration - self.last_k
+        return np.ones(n, dtype=bool)
+
+    def _as_dicts(self, stage: int, mask: np.ndarray) -> List[Dict]:
+        A, b = self.matrix(stage)
+        ids = self._ids[stage][:len(b)] if len(b) else np.zeros(0, dtype=int)
+        return [{"id": int(ids[i]),
+                 "stage": stage,
+                 "rhs": float(b[i]),
+                 "coefs": dict(zip(self.units, A[i].tolist()))}
+                for i in np.flatnonzero(mask)]
+
+    def select(self, stage: Optional[int] = None) -> List[Dict]:
+        """
+        Cuts to load into the stage models, in insertion order.
+
+        Parameters
+        ----------
+        stage : int, optional
+            Stage of the cuts. When ``None``, the selected cuts of every
+            stage are returned.
+
+        Returns
+        -------
+        List[Dict]
+            Selected cuts, in the format of
+            :func:`NaivePyDECOMP.BuilderPDDD.add_pddd_cuts`.
+        """
+        stages = self.stages() if stage is None else [stage]
+        selected: List[Dict] = []
+        for s in stages:
+            selected.extend(self._as_dicts(s, self.selection_mask(s)))
+        return selected
+
+    def cuts(self, stage: Optional[int] = None) -> List[Dict]:
+        """Every stored cut (of ``stage``, or of all stages when ``None``)."""
+        stages = self.stages() if stage is None else [stage]
+        stored: List[Dict] = []
+        for s in stages:
+            n = self._size.get(s, 0)
+            if n:
+                stored.extend(self._as_dicts(s, np.ones(n, dtype=bool)))
+        return stored
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Pool statistics.
+
+        Returns
+        -------
+        dict
+            ``total`` stored cuts, ``active`` cuts selected for the models,
+            ``dominated`` cuts (not Level-1 optimal at any trial point) and
+            ``rejected`` duplicates.
+        """
+        stages = self.stages()
+        return {
+            'total': sum(self._size[s] for s in stages),
+            'active': sum(int(self.selection_mask(s).sum()) for s in stages),
+            'dominated': sum(int((~self.level1_mask(s)).sum()) for s in stages),
+            'rejected': self.rejected
+        }
+
+    def __len__(self) -> int:
+        return sum(self._size.values())
+
+
+def format_cut_pool_stats(pool: CutPool) -> str:
+    """One-line summary of :meth:`CutPool.stats` for the iteration log."""
+    stats = pool.stats()
+    return (f"Cut pool ({pool.strategy}): total={stats['total']}, "
+            f"active={stats['active']}, dominated={stats['dominated']}, "
+            f"rejected={stats['rejected']}")
+
+
+def cut_pool_arrays(pool: CutPool) -> Dict[str, np.ndarray]:
+    """
+    Flatten a pool into NumPy arrays (the content of a cut file).
+
+    Parameters
+    ----------
+    pool : CutPool
+        Pool to flatten.
+
+    Returns
+    -------
+    dict
+        ``units`` (column order), ``stage``, ``rhs``, ``coefs``, ``trial``
+        and ``last_active`` of every cut, the other recorded trial points
+        (``point_stage``, ``points``) and the case ``fingerprint``.
+    """
+    stages = pool.stages()
+    nh = len(pool.units)
+
+    def _stack(arrays, empty):
+        return np.concatenate(arrays) if arrays else empty
+
+    point_stages = sorted(s for s, points in pool._points.items() if points)
+
+    return {
+        'units': np.array(pool.units, dtype=str),
+        'stage': _stack([np.full(pool._size[s], s, dtype=int) for s in stages],
+                        np.zeros(0, dtype=int)),
+        'rhs': _stack([pool.matrix(s)[1] for s in stages], np.zeros(0)),
+        'coefs': _stack([pool.matrix(s)[0] for s in stages], np.zeros((0, nh))),
+        'trial': _stack([pool.trial_points(s) for s in stages], np.zeros((0, nh))),
+        'last_active': _stack([pool._last_active[s][:pool._size[s]] for s in stages],
+                              np.zeros(0, dtype=int)),
+        'point_stage': np.array([s for s in point_stages for _ in pool._points[s]],
+                                dtype=int),
+        'points': _stack([np.array(pool._points[s]) for s in point_stages],
+                         np.zeros((0, nh))),
+        'fingerprint': np.array(pool.fingerprint, dtype=str)
+    }
+
+
+def restore_cut_pool(data, pool: CutPool, source: str = '') -> str:
+    """
+    Add the cuts held in the arrays of :func:`cut_pool_arrays` to a pool.
+
+    Columns are matched by unit name, so the order of the units may differ
+    between the arrays and the pool. Duplicates of cuts already in the pool
+    are rejected as usual.
+
+    Parameters
+    ----------
+    data : mapping
+        Arrays as returned by :func:`cut_pool_arrays` (or an open ``.npz``).
+    pool : CutPool
+        Pool receiving the cuts.
+    source : str, optional
+        Name of the origin of the arrays, used in error messages.
+
+    Returns
+    -------
+    str
+        Case fingerprint stored with the cuts.
+
+    Raises
+    ------
+    ValueError
+        If the arrays and the pool do not have the same state units
+        (hydro volumes and storage energies).
+    """
+    units = tuple(str(unit) for unit in data['units'])
+    if set(units) != set(pool.units):
+        raise ValueError(
+            f"Cut file '{source}' has state units {sorted(units)}, "
+            f"expected {sorted(pool.units)}.")
+    last_active = data['last_active'] if 'last_active' in data else None
+    for k, (stage, rhs, coefs, trial) in enumerate(zip(data['stage'], data['rhs'],
+                                                       data['coefs'], data['trial'])):
+        stage = int(stage)
+        stored = pool.add({"stage": stage,
+                           "rhs": float(rhs),
+                           "coefs": dict(zip(units, coefs.tolist()))})
+        if stored:
+            # the trial point itself is restored with the other points
+            n = pool._size[stage] - 1
+            pool._trial[stage][n] = pool._vector(dict(zip(units, trial.tolist())))
+            if last_active is not None:
+                pool._last_active[stage][n] = int(last_active[k])
+    for stage, point in zip(data['point_stage'], data['points']):
+        pool._points.setdefault(int(stage), []).append(
+            pool._vector(dict(zip(units, point.tolist()))))
+        pool._level1.pop(int(stage), None)
+    return str(data['fingerprint'])
+
+
+def save_cut_pool(pool: CutPool, path: str) -> None:
+    """
+    Save the cuts of a pool to a compressed NumPy ``.npz`` file.
+
+    The file holds the arrays of :func:`cut_pool_arrays`: the unit names
+    (column order), the stage, intercept, coefficients and trial point of
+    every cut, the other recorded trial points and the case fingerprint.
+
+    Parameters
+    ----------
+    pool : CutPool
+        Pool to save.
+    path : str
+        Output file (``.npz``).
+    """
+    np.savez_compressed(path, **cut_pool_arrays(pool))
+
+
+def load_cut_pool(path: str, pool: CutPool) -> str:
+    """
+    Add the cuts saved by :func:`save_cut_pool` to a pool.
+
+    Parameters
+    ----------
+    path : str
+        Input file (``.npz``).
+    pool : CutPool
+        Pool receiving the cuts (see :func:`restore_cut_pool`).
+
+    Returns
+    -------
+    str
+        Case fingerprint stored in the file. Cuts computed for a different
+        case are still valid approximations only if the change does not
+        lower the future costs; compare it with ``pool.fingerprint``.
+
+    Raises
+    ------
+    ValueError
+        If the file and the pool do not have the same state units
+        (hydro volumes and storage energies).
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return restore_cut_pool(data, pool, source=path)
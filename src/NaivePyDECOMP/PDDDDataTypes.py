@@ -0,0 +1,188 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Stage Result — Data Structures
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Compact records used by the PDDD (Deterministic Dual Dynamic Programming)
+solver to carry the outcome of each stage solve between the forward pass,
+the backward pass and the final result assembly.
+
+A record stores only numbers: the unit names of each family (which fix the
+position of every unit in the arrays) and one NumPy array per variable
+family. No Pyomo component is referenced, so records are cheap to keep in
+memory, to copy and to send to other processes.
+
+Classes
+-------
+StageResult
+    Primal values, duals and costs of a single stage solve.
+
+Notes
+-----
+- Every array is aligned with the matching tuple of names and, for the
+  time-indexed families, with the periods of the stage (``periods``),
+  e.g. ``V[i, j]`` is the volume of ``hydro_units[i]`` at the end of
+  period ``periods[j]``.
+- The PDDD state is the concatenation of the hydro volumes and the storage
+  energies (``state_units``) at the end of the last period of the stage;
+  the Benders cuts are built over it.
+- Families absent from the case are stored as empty tuples/arrays.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+def _empty() -> np.ndarray:
+    return np.zeros(0)
+
+
+def _empty_series() -> np.ndarray:
+    return np.zeros((0, 1))
+
+
+@dataclass
+class StageResult:
+    """
+    Outcome of a single PDDD stage solve.
+
+    Parameters
+    ----------
+    stage : int
+        Stage index (0-based).
+    total_cost : float
+        Objective value of the stage, including the future cost ``alpha``.
+    alpha : float
+        Value of the future cost (cost-to-go) variable.
+    cmo : np.ndarray
+        Dual of the first bar balance constraint of each period (marginal
+        operation cost).
+    periods : Tuple[int, ...]
+        Horizon periods (1-based) covered by the stage.
+    hydro_units : Tuple[str, ...]
+        Names of the hydro units, in array order.
+    Vini : np.ndarray
+        Initial volumes used in the stage (hm³).
+    V, Q, S, G : np.ndarray
+        Final volume, turbined flow, spillage and generation of each hydro
+        unit in each period (units × periods).
+    cma : np.ndarray
+        Duals of the hydro volume balance constraints (water values), units
+        × periods.
+    thermal_units : Tuple[str, ...]
+        Names of the thermal units, in array order.
+    thermal_p : np.ndarray
+        Thermal generation (units × periods).
+    renewable_units : Tuple[str, ...]
+        Names of the renewable units, in array order.
+    renewable_gen : np.ndarray
+        Renewable generation (units × periods).
+    storage_units : Tuple[str, ...]
+        Names of the storage units, in array order.
+    Eini : np.ndarray
+        Initial energies used in the stage (MWh).
+    storage_E, storage_ch, storage_dis : np.ndarray
+        Final energy, charge and discharge of each storage unit in each
+        period (units × periods).
+    cme : np.ndarray
+        Duals of the storage energy balance constraints (marginal values of
+        the stored energy), units × periods.
+    bars : Tuple[str, ...]
+        Names of the connection bars, in array order.
+    D : np.ndarray
+        Deficit at each bar (bars × periods).
+    theta : np.ndarray
+        Voltage angle at each bar (empty for single-bar cases).
+    lines : Tuple[str, ...]
+        Names of the transmission lines, in array order.
+    lines_flow : np.ndarray
+        Power flow of each line (lines × periods).
+    regularization : float
+        Value of the proximal term of a regularized forward pass, included
+        in ``total_cost`` (0 for plain stage problems).
+    perf : Dict[str, Any]
+        Phase timings (s), cut count, LP size and solver iterations of the
+        solve (see :mod:`~NaivePyDECOMP.PDDDTrace`).
+    """
+    stage: int
+    total_cost: float
+    alpha: float
+    cmo: np.ndarray
+    periods: Tuple[int, ...] = ()
+    hydro_units: Tuple[str, ...] = ()
+    Vini: np.ndarray = field(default_factory=_empty)
+    V: np.ndarray = field(default_factory=_empty_series)
+    Q: np.ndarray = field(default_factory=_empty_series)
+    S: np.ndarray = field(default_factory=_empty_series)
+    G: np.ndarray = field(default_factory=_empty_series)
+    cma: np.ndarray = field(default_factory=_empty_series)
+    thermal_units: Tuple[str, ...] = ()
+    thermal_p: np.ndarray = field(default_factory=_empty_series)
+    renewable_units: Tuple[str, ...] = ()
+    renewable_gen: np.ndarray = field(default_factory=_empty_series)
+    storage_units: Tuple[str, ...] = ()
+    Eini: np.ndarray = field(default_factory=_empty)
+    storage_E: np.ndarray = field(default_factory=_empty_series)
+    storage_ch: np.ndarray = field(default_factory=_empty_series)
+    storage_dis: np.ndarray = field(default_factory=_empty_series)
+    cme: np.ndarray = field(default_factory=_empty_series)
+    bars: Tuple[str, ...] = ()
+    D: np.ndarray = field(default_factory=_empty_series)
+    theta: np.ndarray = field(default_factory=_empty_series)
+    lines: Tuple[str, ...] = ()
+    lines_flow: np.ndarray = field(default_factory=_empty_series)
+    regularization: float = 0.0
+    perf: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def f_volume(self) -> Dict[str, float]:
+        """Final volume of each hydro unit, keyed by unit name."""
+        return dict(zip(self.hydro_units, self.V[:, -1].tolist()))
+
+    @property
+    def f_energy(self) -> Dict[str, float]:
+        """Final energy of each storage unit, keyed by unit name."""
+        return dict(zip(self.storage_units, self.storage_E[:, -1].tolist()))
+
+    @property
+    def state_units(self) -> Tuple[str, ...]:
+        """Names of the state variables: hydro units, then storage units."""
+        return self.hydro_units + self.storage_units
+
+    @property
+    def state_initial(self) -> np.ndarray:
+        """Initial state (volumes, then energies), aligned with ``state_units``."""
+        return np.concatenate([self.Vini, self.Eini])
+
+    @property
+    def state(self) -> np.ndarray:
+        """Final state (volumes, then energies), aligned with ``state_units``."""
+        return np.concatenate([self.V[:, -1], self.storage_E[:, -1]])
+
+    @property
+    def state_duals(self) -> np.ndarray:
+        """Marginal values of the initial state (``cma``, then ``cme``).
+
+        The initial state enters only the balance constraints of the first
+        period of the stage, whose duals are its marginal values.
+        """
+        return np.concatenate([self.cma[:, 0], self.cme[:, 0]])
+
+    @property
+    def f_state(self) -> Dict[str, float]:
+        """Final state keyed by unit name (trial point of the next stage)."""
+        return dict(zip(self.state_units, self.state.tolist()))
@@ -0,0 +1,197 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Future Cost Function Evaluator
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Vectorized evaluation of the piecewise-linear Future Cost Function (FCF)
+built from the Benders cuts of a PDDD stage:
+
+    FCF(v) = max(lower_bound, max_k (A[k] @ v + b[k]))
+
+The cuts are kept as an ``(n_cuts, n_state)`` matrix ``A`` and an
+intercept vector ``b``, so a whole batch of state vectors (e.g. a
+100 x 100 grid over two reservoirs) is evaluated with matrix products.
+
+Classes
+-------
+FutureCostFunction
+    Cut matrix of one stage and its batch evaluators.
+
+Notes
+-----
+- ``lower_bound`` mirrors the domain of the cost-to-go variable of the
+  stage models (``alpha >= 0``).
+- Large batches are evaluated in chunks to bound the memory of the
+  ``(n_points, n_cuts)`` intermediate matrix.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# maximum number of entries of the (points x cuts) matrix evaluated at once
+CHUNK_ENTRIES = 1 << 22
+
+
+@dataclass
+class FutureCostFunction:
+    """
+    Piecewise-linear future cost function of a PDDD stage.
+
+    Parameters
+    ----------
+    units : Tuple[str, ...]
+        Names of the state units (hydro volumes and storage energies),
+        fixing the column order of ``A`` and of the evaluation points.
+    A : np.ndarray
+        ``(n_cuts, n_state)`` cut coefficients (water and energy values).
+    b : np.ndarray
+        ``(n_cuts,)`` cut intercepts.
+    lower_bound : float, optional
+        Value of the function when no cut is above it (default is 0.0).
+    """
+    units: Tuple[str, ...]
+    A: np.ndarray
+    b: np.ndarray
+    lower_bound: float = 0.0
+
+    @classmethod
+    def from_cuts(cls,
+                  cuts: List[Dict],
+                  stage: int,
+                  units: Optional[Sequence[str]] = None) -> 'FutureCostFunction':
+        """
+        Build the function of ``stage`` from a list of cut dictionaries.
+
+        Parameters
+        ----------
+        cuts : list of dict
+            Cuts with keys ``stage``, ``rhs`` and ``coefs``.
+        stage : int
+            Stage whose cuts are used (0-based).
+        units : sequence of str, optional
+            Column order. When ``None``, the units of the first cut of the
+            stage are used.
+
+        Returns
+        -------
+        FutureCostFunction
+        """
+        stage_cuts = [cut for cut in cuts if cut['stage'] == stage]
+        if units is None:
+            units = tuple(stage_cuts[0]['coefs'].keys()) if stage_cuts else ()
+        units = tuple(units)
+        A = np.array([[float(cut['coefs'].get(unit, 0.0)) for unit in units]
+                      for cut in stage_cuts]).reshape(len(stage_cuts), len(units))
+        b = np.array([float(cut['rhs']) for cut in stage_cuts])
+        return cls(units=units, A=A, b=b)
+
+    @property
+    def n_cuts(self) -> int:
+        """Number of cuts."""
+        return len(self.b)
+
+    def points(self, volumes) -> np.ndarray:
+        """
+        Normalize evaluation points to a ``(n_points, n_state)`` array.
+
+        ``volumes`` may be a dict (unit name → volume), a 1-D vector or a
+        2-D array with one point per row.
+        """
+        if isinstance(volumes, dict):
+            volumes = [float(volumes[unit]) for unit in self.units]
+        return np.atleast_2d(np.asarray(volumes, dtype=float))
+
+    def cut_values(self, volumes) -> np.ndarray:
+        """
+        Value of every cut at every point.
+
+        Returns
+        -------
+        np.ndarray
+            ``(n_points, n_cuts)`` matrix ``V @ A.T + b``.
+        """
+        return self.points(volumes) @ self.A.T + self.b
+
+    def __call__(self, volumes) -> np.ndarray:
+        """
+        Evaluate the function at a batch of points.
+
+        Parameters
+        ----------
+        volumes : dict, array_like
+            One point (dict or 1-D vector) or a ``(n_points, n_state)``
+            array.
+
+        Returns
+        -------
+        np.ndarray
+            ``(n_points,)`` future cost at each point.
+        """
+        V = self.points(volumes)
+        values = np.full(len(V), self.lower_bound)
+        if self.n_cuts == 0:
+            return values
+        chunk = max(1, CHUNK_ENTRIES // self.n_cuts)
+        for start in range(0, len(V), chunk):
+            block = V[start:start + chunk] @ self.A.T + self.b
+            np.maximum(values[start:start + chunk], block.max(axis=1),
+                       out=values[start:start + chunk])
+        return values
+
+    def active_cut(self, volumes) -> np.ndarray:
+        """
+        Index of the highest cut at each point (``-1`` where no cut is
+        above ``lower_bound``).
+        """
+        V = self.points(volumes)
+        if self.n_cuts == 0:
+            return np.full(len(V), -1)
+        values = self.cut_values(V)
+        index = values.argmax(axis=1)
+        index[values[np.arange(len(V)), index] < self.lower_bound] = -1
+        return index
+
+    def surface(self,
+                unit_x: str,
+                unit_y: str,
+                x: np.ndarray,
+                y: np.ndarray,
+                fixed: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the function over a grid of two reservoirs.
+
+        Parameters
+        ----------
+        unit_x, unit_y : str
+            Units spanned by the grid.
+        x, y : np.ndarray
+            Grid values of ``unit_x`` and ``unit_y``.
+        fixed : dict, optional
+            Volumes of the other units (default 0.0).
+
+        Returns
+        -------
+        X, Y, Z : np.ndarray
+            ``(len(y), len(x))`` meshgrid arrays and the future cost.
+        """
+        X, Y = np.meshgrid(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        V = np.zeros((X.size, len(self.units)))
+        for unit, volume in (fixed or {}).items():
+            V[:, self.units.index(unit)] = volume
+        V[:, self.units.index(unit_x)] = X.ravel()
+        V[:, self.units.index(unit_y)] = Y.ravel()
+        return X, Y, self(V).reshape(X.shape)
@@ -0,0 +1,199 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Hybrid Start
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Initial Benders cuts of a PDDD run derived from the monolithic model of
+the whole horizon (see :func:`~NaivePyDECOMP.Builder.build_model_from_data`).
+
+The monolithic model is solved once as an LP (integer variables relaxed)
+and, for every stage boundary, one cut is built from its solution:
+
+- the trial state is the monolithic state (volumes and storage energies)
+  at the end of the previous stage;
+- the coefficients are the duals of the hydro volume and storage energy
+  balance constraints of the first period of the stage;
+- the value at the trial state is the cost of the remaining periods of
+  the monolithic solution.
+
+Restricted to the periods of the tail of the horizon, the monolithic duals
+are a feasible dual solution of the tail problem, so each cut is a valid
+lower bound of the future cost function, and it is tight at the
+monolithic trajectory. Loaded into the cut pool before the first
+iteration, these cuts replace the early, nearly myopic, iterations.
+
+Functions
+---------
+solve_monolithic_relaxation(case)
+    Build and solve the LP relaxation of the monolithic model.
+period_costs(model)
+    Objective cost of each period of a solved monolithic model.
+monolithic_cuts(model, stage_periods, units)
+    One Benders cut per stage boundary from a solved monolithic model.
+
+Notes
+-----
+- Constant terms of the objective are not attributed to any period.
+- The cuts are only as good as the LP relaxation: for cases whose stage
+  problems are LPs (the PDDD stage models relax the storage mode as well)
+  they are exact at the monolithic trajectory.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from typing import Dict, List, Tuple
+import copy
+
+import numpy as np
+
+from pyomo.environ import (
+    ConcreteModel,
+    Suffix,
+    TerminationCondition,
+    TransformationFactory,
+    value
+)
+from pyomo.common.errors import ApplicationError
+from pyomo.repn import generate_standard_repn
+
+from .Builder import build_model_from_data
+from .ModelCheck import has_hydro_model, has_storage_model
+from .SolverSession import get_solver_session
+
+
+def solve_monolithic_relaxation(case: Dict) -> ConcreteModel:
+    """
+    Build and solve the LP relaxation of the monolithic model of a case.
+
+    Parameters
+    ----------
+    case : dict
+        Parsed case (see
+        :func:`~NaivePyDECOMP.BuilderPDDD.build_pddd_data_from_file`). It
+        is not modified.
+
+    Returns
+    -------
+    ConcreteModel
+        The solved model, with the ``dual`` suffix populated.
+
+    Raises
+    ------
+    RuntimeError
+        If the solver is not available or the solve is not optimal.
+    """
+    model, _ = build_model_from_data(copy.deepcopy(case))
+    TransformationFactory('core.relax_integer_vars').apply_to(model)
+    model.dual = Suffix(direction=Suffix.IMPORT)
+
+    solver_str = case['meta']['Solver']
+    options = case['meta'].get('Solver_Options', {})
+    if solver_str.lower() == 'mindtpy':
+        # the relaxation is an LP: its MIP solver is enough
+        solver_str = options.get('mip_solver', 'glpk')
+
+    session = get_solver_session(solver_str, options)
+
+    try:
+        res = session.solve(model, duals=True)
+    except ApplicationError as e:
+        raise RuntimeError(f"Solver execution failed: {e}")
+
+    term_cond = res.solver.termination_condition
+    if term_cond != TerminationCondition.optimal:
+        raise RuntimeError(f"Solve terminated with condition: {term_cond}")
+    return model
+
+
+def period_costs(model: ConcreteModel) -> np.ndarray:
+    """
+    Split the objective of a solved monolithic model by period.
+
+    Each linear term of the objective is attributed to the period of its
+    variable (the last index of the variable).
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Solved monolithic model.
+
+    Returns
+    -------
+    np.ndarray
+        Cost of each period of ``model.T``, in order.
+    """
+    periods = list(model.T)
+    position = {t: i for i, t in enumerate(periods)}
+    costs = np.zeros(len(periods))
+    repn = generate_standard_repn(model.OBJ.expr, compute_values=True)
+    for coef, var in zip(repn.linear_coefs, repn.linear_vars):
+        index = var.index()
+        period = index[-1] if isinstance(index, tuple) else index
+        if period in position:
+            costs[position[period]] += coef * value(var)
+    return costs
+
+
+def monolithic_cuts(model: ConcreteModel,
+                    stage_periods: List[range],
+                    units: Tuple[str, ...]) -> List[Tuple[Dict, Dict[str, float]]]:
+    """
+    Derive one Benders cut per stage boundary from a solved monolithic model.
+
+    The cut of stage ``s - 1`` is
+    ``alpha >= C + sum(pi[u] * (x[u] - x*[u]))`` where ``x*`` is the
+    monolithic state at the end of stage ``s - 1``, ``pi`` the duals of the
+    balance constraints of the first period of stage ``s`` and ``C`` the
+    monolithic cost from that period to the end of the horizon.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Monolithic model solved by :func:`solve_monolithic_relaxation`.
+    stage_periods : list of range
+        0-based periods of every stage (see
+        :func:`~NaivePyDECOMP.BuilderPDDD.pddd_stage_periods`).
+    units : tuple of str
+        State units of the cut pool: hydro units, then storage units.
+
+    Returns
+    -------
+    list of (dict, dict)
+        ``(cut, trial)`` pairs ready for
+        :meth:`~NaivePyDECOMP.PDDDCutPool.CutPool.add`, one per stage
+        ``0 .. nstages - 2``.
+    """
+    hydro = set(model.HG) if has_hydro_model(model) else set()
+    storage = set(model.SU) if has_storage_model(model) else set()
+    tail = np.cumsum(period_costs(model)[::-1])[::-1]
+
+    cuts: List[Tuple[Dict, Dict[str, float]]] = []
+    for stage in range(1, len(stage_periods)):
+        # 1-based period opening the stage: its balance rows hold the state
+        t = stage_periods[stage].start + 1
+        coefs: Dict[str, float] = {}
+        trial: Dict[str, float] = {}
+        for unit in units:
+            if unit in hydro:
+                constraint = model.hydro_volume_balance_constraint[unit, t]
+                state = model.hydro_V[unit, t - 1]
+            elif unit in storage:
+                constraint = model.storage_energy_balance_constraint[unit, t]
+                state = model.storage_E[unit, t - 1]
+            else:
+                raise ValueError(f"Unit '{unit}' is not a state of the model.")
+            coefs[unit] = float(model.dual[constraint])
+            trial[unit] = float(value(state))
+        rhs = float(tail[t - 1]) - sum(coefs[u] * trial[u] for u in units)
+        cuts.append(({"stage": stage - 1, "rhs": rhs, "coefs": coefs}, trial))
+    return cuts
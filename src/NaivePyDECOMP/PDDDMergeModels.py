@@ -52,6 +52,9 @@ Examples
 
 See Also
 --------
+build_pddd_results : Lightweight, model-free assembly of the same results
+    (:mod:`~NaivePyDECOMP.PDDDResults`), used by ``solve_pddd`` and
+    ``solve_sddp`` for reporting and export.
 solve_pddd : The iterative algorithm that produces the input data for `generate_dummy_model`.
 solve_stage_pddd : Solves a single stage of the PDDD problem and stores intermediate results.
 
@@ -83,7 +86,8 @@ from .ModelCheck import (
     has_transmission_line_model
 )
 
-from .Builder import build_model_from_data as build_model
+from .Builder import build_result_model_from_data
+from .PDDDDataTypes import StageResult
 
 from NaivePyDECOMP.HydraulicGenerator.HydraulicEquations import (
     add_hydraulic_cost_expression
@@ -109,7 +113,7 @@ from NaivePyDECOMP.TransmissionLine.TransmissionLineEquations import (
     add_transmission_line_cost_expression
 )
 
-def generate_dummy_model(pddd_solution: List[Any],
+def generate_dummy_model(pddd_solution: List[StageResult],
                          yaml_data: Dict) -> ConcreteModel:
     """
     Generates a synthetic Pyomo model representing the structure and results 
@@ -122,10 +126,12 @@ def generate_dummy_model(pddd_solution: List[Any],
 
     Parameters
     ----------
-    pddd_solution : List
-        List containing the results of each stage of the PDDD algorithm, 
-        including model objects, decision variables, shadow prices, volumes, 
-        and costs for each time stage.
+    pddd_solution : List[StageResult]
+        Stage records of the PDDD algorithm (one per stage), holding the
+        decision variables, shadow prices, volumes and costs of each stage.
+        The periods of each stage (``StageResult.periods``) are spread over
+        the horizon of the result model; the future cost (``FC``,
+        ``alpha``) of a stage is reported at every one of its periods.
 
     yaml_data : dict
         Dictionary parsed from the YAML configuration file, containing system 
@@ -145,7 +151,8 @@ def generate_dummy_model(pddd_solution: List[Any],
     -----
     - The returned model is not intended to be solved again, but rather to 
       serve as a reference for results visualization, report generation, or 
-      post-analysis.
+      post-analysis. It holds no constraints (see
+      :func:`~NaivePyDECOMP.Builder.build_result_model_from_data`).
     - The cost components are reassembled using the same structure as in the 
       original model, using the `add_*_cost_expression` helper functions.
     - The model object stores one time step ahead (nstages + 1) for correct 
@@ -161,65 +168,57 @@ def generate_dummy_model(pddd_solution: List[Any],
     solve_pddd : Function that produces the input `pddd_solution` dictionary.
     """
 
-    model, _ = build_model(root=yaml_data)
-
-    for constraint in model.component_objects(Constraint, active=True):
-        constraint.deactivate()
-
-    start_model = pddd_solution[0]['model']
-
-    if has_hydro_model(start_model):
-
-        for t in model.T:
-            for h in model.HG:
-                model.hydro_Q[h, t] = value(
-                    pddd_solution[t-1]['model'].hydro_Q[h, 1])
-                model.hydro_V[h, t] = value(
-                    pddd_solution[t-1]['model'].hydro_V[h, 1])
-                model.hydro_S[h, t] = value(
-                    pddd_solution[t-1]['model'].hydro_S[h, 1])
-                model.hydro_G[h, t] = value(
-                    pddd_solution[t-1]['model'].hydro_G[h, 1])
-
-        model.CMA = {(h, t): -value(
-            pddd_solution[t-1]['cma'][h]) for h in model.HG for t in model.T}
-        model.FC = {t: value(pddd_solution[t-1]['alpha']) for t in model.T}
-
-    model.CMO = {t: value(pddd_solution[t-1]['cmo']) for t in model.T}
-    model.alpha = {t: value(pddd_solution[t-1]['alpha']) for t in model.T}
-
-    if has_thermal_model(start_model):
-        for t in model.T:
-            for g in model.TG:
-                model.thermal_p[g, t] = value(
-                    pddd_solution[t-1]['model'].thermal_p[g, 1])
-
-    if has_renewable_model(start_model):
-        for t in model.T:
-            for r in model.RU:
-                model.renewable_gen[r, t] = value(
-                    pddd_solution[t-1]['model'].renewable_gen[r, 1])
-
-    if has_storage_model(start_model):
-        for t in model.T:
-            for s in model.SU:
-                model.storage_E[s, t] = value(
-                    pddd_solution[t-1]['model'].storage_E[s, 1])
-                model.storage_ch[s, t] = value(
-                    pddd_solution[t-1]['model'].storage_ch[s, 1])
-                model.storage_dis[s, t] = value(
-                    pddd_solution[t-1]['model'].storage_dis[s, 1])
+    model = build_result_model_from_data(yaml_data)
+
+    # column of each horizon period in the record of its stage
+    columns = [(record, j, t)
+               for record in pddd_solution
+               for j, t in enumerate(record.periods)]
+
+    if has_hydro_model(model):
+
+        for record, j, t in columns:
+            for i, h in enumerate(record.hydro_units):
+                model.hydro_Q[h, t] = record.Q[i, j]
+                model.hydro_V[h, t] = record.V[i, j]
+                model.hydro_S[h, t] = record.S[i, j]
+                model.hydro_G[h, t] = record.G[i, j]
+
+        model.CMA = {(h, t): -record.cma[i, j]
+                     for record, j, t in columns
+                     for i, h in enumerate(record.hydro_units)}
+        model.FC = {t: record.alpha for record, j, t in columns}
+
+    model.CMO = {t: record.cmo[j] for record, j, t in columns}
+    model.alpha = {t: record.alpha for record, j, t in columns}
+
+    if has_thermal_model(model):
+        for record, j, t in columns:
+            for i, g in enumerate(record.thermal_units):
+                model.thermal_p[g, t] = record.thermal_p[i, j]
+
+    if has_renewable_model(model):
+        for record, j, t in columns:
+            for i, r in enumerate(record.renewable_units):
+                model.renewable_gen[r, t] = record.renewable_gen[i, j]
+
+    if has_storage_model(model):
+        for record, j, t in columns:
+            for i, s in enumerate(record.storage_units):
+                model.storage_E[s, t] = record.storage_E[i, j]
+                model.storage_ch[s, t] = record.storage_ch[i, j]
+                model.storage_dis[s, t] = record.storage_dis[i, j]
     
-    if has_connection_bar_model(start_model):
-        for t in model.T:
-            for b in model.CB:
-                model.D[b, t] = value(pddd_solution[t-1]['model'].D[b, 1])
+    if has_connection_bar_model(model):
+        for record, j, t in columns:
+            for i, b in enumerate(record.bars):
+                model.D[b, t] = record.D[i, j]
                 if not model.unique_bar:
-                    model.theta[b, t] = value(pddd_solution[t-1]['model'].theta[b, 1])
+                    model.theta[b, t] = record.theta[i, j]
  
-    if has_transmission_line_model(start_model):
-        for t in model.T:
-            for l in model.LT:
-                model.lines_flow[l, t] = value(pddd_solution[t-1]['model'].lines_flow[l, 1])
+    if has_transmission_line_model(model):
+        for record, j, t in columns:
+            for i, l in enumerate(record.lines):
+                model.lines_flow[l, t] = record.lines_flow[i, j]
 
     return model
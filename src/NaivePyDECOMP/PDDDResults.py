@@ -0,0 +1,233 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Results Container
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Multi-period view of a decomposed (PDDD, SDDP) solution assembled directly
+from the stage records (:class:`~NaivePyDECOMP.PDDDDataTypes.StageResult`),
+without building a Pyomo model.
+
+Each variable family (``hydro_V``, ``thermal_p``, ``D``, ...) is stored as
+one NumPy array (units × horizon periods), filled by copying the columns of
+every stage record at the positions of its periods. The container exposes
+the same attribute names and ``[unit, t]`` indexing as the monolithic
+model, so :mod:`~NaivePyDECOMP.Reporting` and
+:func:`~NaivePyDECOMP.DataFrames.build_dispatch_dataframe` accept it in
+place of a solved ``ConcreteModel``:
+
+- families absent from the case are not set, so the ``has_*_model``
+  checks of :mod:`~NaivePyDECOMP.ModelCheck` behave as for the model;
+- ``value()`` of Pyomo accepts the plain floats returned by the arrays;
+- ``OBJ`` is the operation cost of the trajectory (sum of the stage costs
+  without the future cost and the proximal terms).
+
+Classes
+-------
+SeriesFamily
+    Columnar values of one variable family, indexed by ``[unit, t]``.
+PDDDResults
+    Sets, parameters and variable families of a decomposed solution.
+
+Functions
+---------
+build_pddd_results(pddd_solution, yaml_data)
+    Assemble a :class:`PDDDResults` from the stage records of a run.
+
+Notes
+-----
+- Periods are 1-based, as in ``model.T``.
+- The future cost (``FC``, ``alpha``) of a stage is reported at every one
+  of its periods.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .Builder import _mk_thermal_data
+from .PDDDDataTypes import StageResult
+
+from NaivePyDESSEM.Builder import (
+    _mk_connection_bar_data,
+    _mk_transmission_line_data
+)
+
+
+@dataclass
+class SeriesFamily:
+    """
+    Values of one variable family over the horizon.
+
+    Parameters
+    ----------
+    units : Tuple[str, ...]
+        Unit names, in row order.
+    values : np.ndarray
+        Values (units × periods); column ``t - 1`` holds period ``t``.
+    """
+    units: Tuple[str, ...]
+    values: np.ndarray
+    _rows: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rows = {unit: i for i, unit in enumerate(self.units)}
+
+    def __getitem__(self, key: Tuple[str, int]) -> float:
+        unit, t = key
+        return float(self.values[self._rows[unit], t - 1])
+
+    def series(self, unit: str) -> np.ndarray:
+        """Values of ``unit`` in every period of the horizon."""
+        return self.values[self._rows[unit]]
+
+
+class PDDDResults:
+    """
+    Decomposed solution laid out like the multi-period model.
+
+    Attributes set for every case:
+
+    - ``T`` (periods, 1-based), ``OBJ``, ``CMO[t]``, ``alpha[t]``;
+    - bars: ``CB``, ``SB``, ``d``, ``Cdef``, ``unique_bar``, ``D`` and, for
+      multi-bar cases, ``theta``.
+
+    Attributes set when the case has the matching section:
+
+    - hydro: ``HG``, ``hydro_Q``, ``hydro_V``, ``hydro_S``, ``hydro_G``,
+      ``CMA``, ``FC[t]``;
+    - thermal: ``TG``, ``thermal_Cost``, ``thermal_p``;
+    - renewable: ``RU``, ``renewable_gen``;
+    - storage: ``SU``, ``storage_E``, ``storage_ch``, ``storage_dis``;
+    - lines: ``LT``, ``lines_transmission_model``, ``lines_b``,
+      ``lines_pmax``, ``lines_endpoints``, ``lines_flow``.
+
+    Variable families are :class:`SeriesFamily` objects; per-period series
+    (``CMO``, ``FC``, ``alpha``) are dictionaries keyed by period.
+
+    Parameters
+    ----------
+    horizon : int
+        Number of periods of the case.
+    """
+
+    def __init__(self, horizon: int) -> None:
+        self.T = range(1, horizon + 1)
+        self.OBJ = 0.0
+
+
+def _family(pddd_solution: List[StageResult],
+            units: Tuple[str, ...],
+            name: str,
+            horizon: int) -> SeriesFamily:
+    """Copy the ``name`` array of every record into one horizon array."""
+    values = np.zeros((len(units), horizon))
+    for record in pddd_solution:
+        columns = np.asarray(record.periods, dtype=int) - 1
+        values[:, columns] = getattr(record, name)
+    return SeriesFamily(units, values)
+
+
+def build_pddd_results(pddd_solution: List[StageResult],
+                       yaml_data: Dict) -> PDDDResults:
+    """
+    Assemble the results of a PDDD (or SDDP) run from its stage records.
+
+    Parameters
+    ----------
+    pddd_solution : List[StageResult]
+        Stage records of the run (one per stage), e.g. the last forward
+        pass.
+    yaml_data : dict
+        Case parsed by
+        :func:`~NaivePyDECOMP.BuilderPDDD.build_pddd_data_from_file` (with
+        its ``bars`` section).
+
+    Returns
+    -------
+    PDDDResults
+        Results ready for :mod:`~NaivePyDECOMP.Reporting` and
+        :func:`~NaivePyDECOMP.DataFrames.build_dispatch_dataframe`.
+    """
+    horizon = int(yaml_data['meta']['horizon'])
+    first = pddd_solution[0]
+    results = PDDDResults(horizon)
+
+    def family(units: Tuple[str, ...], name: str) -> SeriesFamily:
+        return _family(pddd_solution, units, name, horizon)
+
+    per_period = [(record, t)
+                  for record in pddd_solution
+                  for t in record.periods]
+    results.CMO = {t: float(record.cmo[j])
+                   for record in pddd_solution
+                   for j, t in enumerate(record.periods)}
+    results.alpha = {t: float(record.alpha) for record, t in per_period}
+    results.OBJ = float(sum(record.total_cost - record.alpha - record.regularization
+                            for record in pddd_solution))
+
+    bar_data = _mk_connection_bar_data(yaml_data)
+    bars = first.bars
+    results.CB = bars
+    results.SB = tuple(b for b, u in bar_data.units.items() if u.slack)
+    results.Cdef = {b: bar_data.units[b].Cdef for b in bars}
+    results.d = SeriesFamily(bars, np.array([bar_data.units[b].demand[:horizon]
+                                             for b in bars], dtype=float))
+    results.unique_bar = len(bars) == 1
+    results.D = family(bars, 'D')
+    if not results.unique_bar:
+        results.theta = family(bars, 'theta')
+
+    if "lines" in yaml_data and yaml_data["lines"] is not None and not results.unique_bar:
+        line_data = _mk_transmission_line_data(yaml_data)
+        lines = first.lines
+        results.LT = lines
+        results.lines_transmission_model = {l: line_data.units[l].model for l in lines}
+        results.lines_b = {l: line_data.units[l].b for l in lines}
+        results.lines_pmax = {l: line_data.units[l].pmax for l in lines}
+        results.lines_endpoints = {l: line_data.units[l].endpoints for l in lines}
+        results.lines_flow = family(lines, 'lines_flow')
+
+    if "hydro" in yaml_data and yaml_data["hydro"] is not None:
+        hydros = first.hydro_units
+        results.HG = hydros
+        results.hydro_Q = family(hydros, 'Q')
+        results.hydro_V = family(hydros, 'V')
+        results.hydro_S = family(hydros, 'S')
+        results.hydro_G = family(hydros, 'G')
+        cma = family(hydros, 'cma')
+        results.CMA = SeriesFamily(hydros, -cma.values)
+        results.FC = dict(results.alpha)
+
+    if "thermal" in yaml_data and yaml_data["thermal"] is not None:
+        thermal_data = _mk_thermal_data(yaml_data)
+        thermals = first.thermal_units
+        results.TG = thermals
+        results.thermal_Cost = {g: thermal_data.units[g].Cost for g in thermals}
+        results.thermal_p = family(thermals, 'thermal_p')
+
+    if "renewable" in yaml_data and yaml_data["renewable"] is not None:
+        renewables = first.renewable_units
+        results.RU = renewables
+        results.renewable_gen = family(renewables, 'renewable_gen')
+
+    if "storage" in yaml_data and yaml_data["storage"] is not None:
+        storages = first.storage_units
+        results.SU = storages
+        results.storage_E = family(storages, 'storage_E')
+        results.storage_ch = family(storages, 'storage_ch')
+        results.storage_dis = family(storages, 'storage_dis')
+
+    return results
@@ -0,0 +1,319 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: PDDD Performance Trace
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Structured performance trace of a PDDD run. Every stage solve is timed
+phase by phase:
+
+- ``copy``: deep copy of the case for the stage;
+- ``build``: construction of the Pyomo stage model (or update of the
+  parameters and cut rows of a persistent model);
+- ``solve``: the solver call;
+- ``load``: import of the primal solution and of the ``dual`` suffix;
+- ``duals``: copy of the duals of a persistent solver into the model;
+- ``collect``: extraction of the :class:`~NaivePyDECOMP.PDDDDataTypes.StageResult`.
+
+together with the number of cuts, the size of the LP (active rows and
+columns), the solver iteration count and the I/O of the solve (``io``:
+part of ``solve`` spent outside the optimizer writing or translating the
+problem and reading the solution back; ``io_mode``: ``memory``, ``tmpfs``
+or ``file``, see :mod:`NaivePyDESSEM.SolverSession`). The records are written as JSON
+lines (one per stage solve, plus one summary per iteration) and can also
+be exported as a Chrome trace (``chrome://tracing``, Perfetto) where every
+phase appears on a timeline.
+
+Classes
+-------
+PDDDTrace
+    Collector of stage and iteration records.
+
+Functions
+---------
+stage_model_size(model)
+    Active rows and columns of a stage model.
+solver_iterations(opt)
+    Simplex/barrier iteration count of the last solve, when available.
+
+Notes
+-----
+- Timestamps are wall-clock (``time.time()``) so that the records of the
+  parallel backward pass workers share the timeline of the main process;
+  durations are measured with ``time.perf_counter()``.
+- The iteration count is read from the native model of the solver
+  interface (Gurobi ``IterCount``, HiGHS ``simplex_iteration_count``) and
+  is ``None`` for interfaces that do not expose it.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import os
+import time
+
+from pyomo.environ import ConcreteModel, Constraint, Var
+
+# phases of a stage solve, in execution order
+STAGE_PHASES = ('copy', 'build', 'solve', 'load', 'duals', 'collect')
+
+
+def stage_model_size(model: ConcreteModel) -> Tuple[int, int]:
+    """
+    Count the active rows and the columns of a stage model.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Stage model.
+
+    Returns
+    -------
+    rows, cols : int
+        Number of active constraints and of variables.
+    """
+    rows = sum(1 for _ in model.component_data_objects(Constraint, active=True))
+    cols = sum(1 for _ in model.component_data_objects(Var))
+    return rows, cols
+
+
+def solver_iterations(opt: Any) -> Optional[int]:
+    """
+    Iteration count of the last solve of a solver interface.
+
+    Parameters
+    ----------
+    opt : Any
+        Pyomo solver interface.
+
+    Returns
+    -------
+    int or None
+        Simplex (or barrier) iterations, ``None`` when the interface does
+        not expose them.
+    """
+    native = getattr(opt, '_solver_model', None)
+    if native is None:
+        return None
+    try:
+        if hasattr(native, 'IterCount'):
+            return int(native.IterCount)
+        if hasattr(native, 'getInfo'):
+            return int(native.getInfo().simplex_iteration_count)
+    except Exception:
+        return None
+    return None
+
+
+@dataclass
+class PDDDTrace:
+    """
+    Collector of the performance records of a PDDD run.
+
+    Parameters
+    ----------
+    path : str, optional
+        JSON lines file receiving the records as they are produced.
+    chrome : str, optional
+        Chrome trace (``.json``) file written by :meth:`close`.
+    records : List[Dict]
+        Every record of the run, in order.
+    """
+    path: Optional[str] = None
+    chrome: Optional[str] = None
+    records: List[Dict] = field(default_factory=list)
+    _events: List[Dict] = field(default_factory=list, repr=False)
+    _stream: Any = field(default=None, repr=False)
+    _start: float = field(default_factory=time.time, repr=False)
+    _pid: int = field(default_factory=os.getpid, repr=False)
+
+    def __post_init__(self):
+        if self.path:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._stream = open(self.path, 'w', encoding='utf-8')
+
+    def _write(self, record: Dict) -> None:
+        self.records.append(record)
+        if self._stream is not None:
+            self._stream.write(json.dumps(record) + '\n')
+            self._stream.flush()
+
+    def span(self,
+             name: str,
+             start: float,
+             duration: float,
+             tid: int = 0,
+             args: Optional[Dict] = None) -> None:
+        """
+        Add a complete event to the Chrome trace.
+
+        Parameters
+        ----------
+        name : str
+            Event label.
+        start : float
+            Wall-clock start (``time.time()``).
+        duration : float
+            Duration in seconds.
+        tid : int, optional
+            Timeline row (process id of the worker, 0 for the main process).
+        args : dict, optional
+            Values shown when the event is selected.
+        """
+        if self.chrome is None:
+            return
+        self._events.append({"name": name,
+                             "ph": "X",
+                             "pid": 0,
+                             "tid": tid,
+                             "ts": (start - self._start) * 1e6,
+                             "dur": duration * 1e6,
+                             "args": args or {}})
+
+    def stage(self,
+              iteration: int,
+              pass_name: str,
+              perf: Dict[str, Any]) -> Dict:
+        """
+        Record one stage solve.
+
+        Parameters
+        ----------
+        iteration : int
+            Iteration index (0-based).
+        pass_name : str
+            ``forward`` or ``backward``.
+        perf : dict
+            Phase timings and model size of the solve
+            (:attr:`~NaivePyDECOMP.PDDDDataTypes.StageResult.perf`).
+            Solves of worker processes get their own timeline row.
+
+        Returns
+        -------
+        dict
+            The stored record.
+        """
+        record = {"type": "stage", "iteration": iteration, "pass": pass_name}
+        record.update(perf)
+        record["start"] = perf.get("start", time.time()) - self._start
+        self._write(record)
+
+        if self.chrome is not None and "start" in perf:
+            begin = perf["start"]
+            tid = 0 if perf.get("pid", self._pid) == self._pid else perf["pid"]
+            total = sum(perf.get(phase, 0.0) for phase in STAGE_PHASES)
+            args = {key: perf.get(key)
+                    for key in ("cuts", "rows", "cols", "solver_iterations",
+                                "io", "io_mode")}
+            self.span(f"{pass_name} stage {perf.get('stage')}", begin, total,
+                      tid, args)
+            for phase in STAGE_PHASES:
+                if phase in perf:
+                    self.span(phase, begin, perf[phase], tid)
+                    begin += perf[phase]
+        return record
+
+    def iteration(self,
+                  iteration: int,
+                  ZINF: float,
+                  ZSUP: float,
+                  forward: float,
+                  backward: float,
+                  start: float,
+                  n_cuts: int) -> Dict:
+        """
+        Record the summary of one iteration.
+
+        The phase totals and the I/O time (``io``) are accumulated from the
+        stage records of the iteration.
+
+        Parameters
+        ----------
+        iteration : int
+            Iteration index (0-based).
+        ZINF, ZSUP : float
+            Bounds of the iteration.
+        forward, backward : float
+            Wall time of the forward and backward passes (s).
+        start : float
+            Wall-clock start of the iteration (``time.time()``).
+        n_cuts : int
+            Cuts in the pool at the end of the iteration.
+
+        Returns
+        -------
+        dict
+            The stored record.
+        """
+        stages = [record for record in self.records
+                  if record["type"] == "stage" and record["iteration"] == iteration]
+        record = {"type": "iteration",
+                  "iteration": iteration,
+                  "ZINF": ZINF,
+                  "ZSUP": ZSUP,
+                  "gap": abs(ZSUP - ZINF),
+                  "forward": forward,
+                  "backward": backward,
+                  "stage_solves": len(stages),
+                  "cuts": n_cuts}
+        for phase in STAGE_PHASES:
+            record[phase] = sum(stage.get(phase, 0.0) for stage in stages)
+        record["io"] = sum(stage.get("io") or 0.0 for stage in stages)
+        self._write(record)
+
+        self.span(f"iteration {iteration + 1}", start, forward + backward,
+                  args={"ZINF": ZINF, "ZSUP": ZSUP})
+        self.span("forward pass", start, forward)
+        self.span("backward pass", start + forward, backward)
+        return record
+
+    def event(self,
+              name: str,
+              start: float,
+              duration: float) -> Dict:
+        """
+        Record a run-level phase (case parsing, result merging...).
+
+        Parameters
+        ----------
+        name : str
+            Phase name.
+        start : float
+            Wall-clock start (``time.time()``).
+        duration : float
+            Duration in seconds.
+
+        Returns
+        -------
+        dict
+            The stored record.
+        """
+        record = {"type": "event", "name": name,
+                  "start": start - self._start, "duration": duration}
+        self._write(record)
+        self.span(name, start, duration)
+        return record
+
+    def close(self) -> None:
+        """Close the JSON lines file and write the Chrome trace."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self.chrome is not None:
+            directory = os.path.dirname(os.path.abspath(self.chrome))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.chrome, 'w', encoding='utf-8') as stream:
+                json.dump({"traceEvents": self._events,
+                           "displayTimeUnit": "ms"}, stream)
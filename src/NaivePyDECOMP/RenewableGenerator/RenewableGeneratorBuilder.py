@@ -55,7 +55,8 @@ from typing import Dict
 
 def add_renewable_subproblem(m: ConcreteModel,
                              data: RenewableData,
-                             stage: int) -> ConcreteModel:
+                             stage: int,
+                             n_periods: int = 1) -> ConcreteModel:
     """
     Add renewable dispatch problem structure to a Pyomo model.
 
@@ -71,9 +72,11 @@ def add_renewable_subproblem(m: ConcreteModel,
     data : RenewableData
         Input data structure containing horizon, demand, units, and
         availability profiles.
-    include_objective : bool, optional
-        If ``True``, add the balance constraint and renewable objective
-        function (default is ``False``).
+    stage : int
+        First period (0-based) of the subproblem, informed for data copying.
+    n_periods : int, optional
+        Number of consecutive periods covered by the subproblem, starting
+        at period ``stage`` (default is 1).
 
     Returns
     -------
@@ -95,9 +98,10 @@ def add_renewable_subproblem(m: ConcreteModel,
     """
     # data copy
     subproblem_data = copy.deepcopy(data)
-    subproblem_data.horizon = 1
+    subproblem_data.horizon = n_periods
     for name in subproblem_data.units.keys():
-        subproblem_data.units[name].gbar = [data.units[name].gbar[stage]]
+        subproblem_data.units[name].gbar = \
+            data.units[name].gbar[stage:stage + n_periods]
 
     renewable_add_sets_and_params(m, subproblem_data)
     renewable_add_variables(m)
@@ -20,6 +20,8 @@ Features:
 - Solver selection and configuration via YAML metadata.
 - Support for MINLP solvers such as MindtPy with strategy and time limits.
 - Termination condition validation to ensure feasibility or optimality.
+- In-memory, tmpfs or file solver I/O (``Solver_Options.io_mode``), with the I/O time of the solve.
+- Optional on-disk cache of the compiled matrix model (see :mod:`~NaivePyDECOMP.ModelCache`).
 
 References
 ----------
@@ -28,12 +30,22 @@ References
 """
 
 
-from pyomo.opt import SolverFactory, TerminationCondition
+from pyomo.opt import TerminationCondition
 from pyomo.common.errors import ApplicationError
 from pyomo.environ import ConcreteModel, Suffix, value
-from typing import Any, Tuple, Dict
+from typing import Any, Tuple, Dict, Optional, Union
 from colorama import Fore, Style, init as colorama_init
-from .Builder import build_model_from_file
+from .Builder import build_model_from_data
+from .MatrixBuilder import (
+    MatrixModel,
+    MatrixResults,
+    build_matrix_model_from_data,
+    build_matrix_results,
+    solve_matrix_model
+)
+from .ModelCache import ModelCache, cache_key
+from .SolverSession import get_solver_session
+from .YAMLLoader import yaml_loader
 from .Reporting import *
 from .ModelCheck import *
 from .ModelFormatters import *
@@ -41,7 +53,9 @@ from .ModelFormatters import *
 colorama_init(autoreset=True)
 
 
-def solve(path: str) -> Tuple[ConcreteModel, Dict]:
+def solve(path: str,
+          backend: Optional[str] = None,
+          cache: Optional[ModelCache] = None) -> Tuple[Union[ConcreteModel, MatrixResults], Dict]:
     """
     Build and solve a Pyomo optimization model from a configuration file.
 
@@ -54,11 +68,20 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     ----------
     path : str
         Path to the configuration file containing model metadata and data sections.
+    backend : str, optional
+        ``pyomo`` (default) or ``matrix``: assemble the sparse model directly
+        and solve it with HiGHS (see :mod:`~NaivePyDECOMP.MatrixBuilder`).
+        When omitted, ``meta.backend`` is used.
+    cache : ModelCache, optional
+        Cache of compiled models used by the matrix backend: an unchanged
+        case starts from its cached matrices, skipping parsing and
+        assembly. Default is no cache.
 
     Returns
     -------
-    model : ConcreteModel
-        The Pyomo model after the solve routine, with variables populated.
+    model : ConcreteModel or MatrixResults
+        The Pyomo model after the solve routine, with variables populated,
+        or the results of the matrix backend.
     case : dict
         Parsed dictionary containing the original configuration, metadata,
         solver options, and problem data.
@@ -67,34 +90,43 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     ------
     RuntimeError
         If the solver is not available, solve fails, or model is infeasible.
+    ValueError
+        If the backend is unknown.
     """
 
-    model, case = build_model_from_file(path)
+    if cache is not None and backend in (None, 'matrix'):
+        entry = cache.load_file(path)
+        if entry is not None and (backend or entry[1]['meta'].get('backend')) == 'matrix':
+            return _solve_matrix(entry[1], entry[0], 'hit')
+
+    root = yaml_loader(path)
+    if backend is None:
+        backend = root['meta'].get('backend', 'pyomo')
+    if backend == 'matrix':
+        if cache is None:
+            return _solve_matrix(root)
+        key = cache_key(root)
+        entry = cache.load(root)
+        if entry is not None:
+            cache.link(path, key)
+            return _solve_matrix(entry[1], entry[0], 'hit')
+        mm = build_matrix_model_from_data(root)
+        cache.store(key, mm, root, source=path)
+        return _solve_matrix(root, mm, 'stored')
+    if backend != 'pyomo':
+        raise ValueError(f"Unknown backend '{backend}'. Use 'pyomo' or 'matrix'.")
+
+    model, case = build_model_from_data(root)
     # Ativar duals
     model.dual = Suffix(direction=Suffix.IMPORT)
     solver_str = case['meta']['Solver']
     options = case['meta'].get('Solver_Options', {})
     print_welcome_message(model, case)
-    # Create solver instance
-    opt = SolverFactory(solver_str)
-
-    if not opt.available():
-        raise RuntimeError(
-            f"Solver '{solver_str}' is not available on this systemodel.")
+    # pooled solver handle (see SolverSession)
+    session = get_solver_session(solver_str, options)
 
     try:
-        if solver_str.lower() == 'mindtpy':
-            res = opt.solve(
-                model,
-                mip_solver=options.get('mip_solver', 'glpk'),
-                nlp_solver=options.get('nlp_solver', 'cyipopt'),
-                strategy=options.get('strategy', 'OA'),
-                tee=False,
-                suffixes=["dual"]
-            )
-        else:
-            res = opt.solve(model, tee=False,
-                            suffixes=["dual"])
+        res = session.solve(model, duals=True)
 
         # Check termination condition
         term_cond = res.solver.termination_condition
@@ -104,6 +136,8 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
 
     except ApplicationError as e:
         raise RuntimeError(f"Solver execution failed: {e}")
+
+    print(f"  Solver I/O:   {Fore.GREEN}{session.io_summary()}")
     
     dispatch_summary(model)
     hydro_dispatch_summary(model)
@@ -114,3 +148,28 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     transmission_line_dispatch_summary(model)
     
     return model, case
+
+
+def _solve_matrix(case: Dict,
+                  mm: Optional[MatrixModel] = None,
+                  cached: Optional[str] = None) -> Tuple[MatrixResults, Dict]:
+    """Build (unless given) the sparse model of a case, solve it with HiGHS and report."""
+    if mm is None:
+        mm = build_matrix_model_from_data(case)
+    print_welcome_message(None, case)
+    print(f"  Backend:      {Fore.GREEN}matrix (HiGHS), {mm.n_rows} rows, "
+          f"{mm.n_cols} columns, {mm.A.nnz} nonzeros")
+    if cached is not None:
+        print(f"  Model cache:  {Fore.GREEN}{cached}")
+    solution = solve_matrix_model(mm, case['meta'].get('Solver_Options', {}))
+    results = build_matrix_results(mm, solution, case)
+
+    dispatch_summary(results)
+    hydro_dispatch_summary(results)
+    thermal_dispatch_summary(results)
+    renewable_dispatch_summary(results)
+    storage_dispatch_summary(results)
+    connection_bar_dispatch_summary(results)
+    transmission_line_dispatch_summary(results)
+
+    return results, case
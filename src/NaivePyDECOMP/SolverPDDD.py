@@ -27,26 +27,68 @@ References
 [2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
 """
 from pyomo.environ import (
-    ConcreteModel, SolverFactory, Suffix,
-    TerminationCondition
+    ConcreteModel, Suffix,
+    TerminationCondition, value
 )
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 from pyomo.contrib.latex_printer import latex_printer
 from pyomo.common.errors import ApplicationError
+from pyomo.contrib.appsi import solvers as appsi_solvers
+from pyomo.contrib.appsi.base import (
+    TerminationCondition as PersistentTerminationCondition
+)
 from colorama import Fore, Style, init as colorama_init
 from .Reporting import *
 from .ModelCheck import *
 from .ModelFormatters import *
 from .BuilderPDDD import (
     build_pddd_data_from_file,
-    build_pddd_balance_and_objective_from_yaml
+    build_pddd_balance_and_objective_from_yaml,
+    add_pddd_cuts,
+    pddd_stage_periods,
+    update_pddd_regularization,
+    update_pddd_stage_state
+)
+from .PDDDResults import PDDDResults, build_pddd_results
+from .PDDDDataTypes import StageResult
+from .PDDDCutPool import (
+    CutPool,
+    format_cut_pool_stats,
+    save_cut_pool,
+    load_cut_pool
 )
-from .Builder import build_model_from_file
-from .PDDDMergeModels import generate_dummy_model
+from .PDDDCheckpoint import (
+    checkpoint_due,
+    save_pddd_checkpoint,
+    load_pddd_checkpoint
+)
+from .PDDDTrace import PDDDTrace, stage_model_size, solver_iterations
+from .PDDDHybridStart import solve_monolithic_relaxation, monolithic_cuts
+from .PDDDConvergence import RegularizationSchedule, StoppingRule
+from .YAMLLoader import case_fingerprint
+from .SolverSession import get_solver_session, native_run_time, solver_family
+from .PDDDFutureCost import FutureCostFunction
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import copy
+import os
+import time
 
 colorama_init(autoreset=True)
 
+# persistent (in-memory, incremental) interfaces available through appsi
+PERSISTENT_SOLVERS: Dict[str, Any] = {
+    'highs': appsi_solvers.Highs,
+    'gurobi': appsi_solvers.Gurobi,
+    'cplex': appsi_solvers.Cplex,
+    'cbc': appsi_solvers.Cbc,
+    'ipopt': appsi_solvers.Ipopt
+}
+
+# per-process state of the parallel backward pass workers
+_WORKER_CASE: Optional[Dict] = None
+_WORKER_STAGE_MODELS: Optional[Dict] = None
+
 
 def fcf_from_cuts(cuts: List[Dict],
                   stage: int,
@@ -75,23 +117,23 @@ def fcf_from_cuts(cuts: List[Dict],
     Returns
     -------
     List[float]
-        Value of the Future Cost Function (FCF) evaluated at the given
-        storage levels.
-    """
-    values = []
+        Value of each cut of ``stage`` evaluated at the given storage
+        levels.
 
-    for cut in cuts:
-        if cut["stage"] == stage:
-            rhs = cut["rhs"]
-            coefs = cut["coefs"]
-            value = rhs + sum(coefs[unit] * storage_levels[unit]
-                              for unit in coefs)
-            values.append(value)
-    return values
+    Notes
+    -----
+    The cuts are evaluated through
+    :class:`~NaivePyDECOMP.PDDDFutureCost.FutureCostFunction`; use it
+    directly to evaluate many storage levels at once.
+    """
+    fcf = FutureCostFunction.from_cuts(cuts=cuts,
+                                       stage=stage,
+                                       units=tuple(storage_levels.keys()))
+    return fcf.cut_values(storage_levels)[0].tolist()
 
 
 def compute_fcf(cuts: List[Dict],
-                pddd_memory: List[Dict]) -> Dict:
+                pddd_memory: List[StageResult]) -> Dict:
     """
     Compute the Future Cost Function (FCF) values for all stages 
     in the PDDD framework, given a set of Benders cuts.
@@ -108,13 +150,10 @@ def compute_fcf(cuts: List[Dict],
             "rhs": float,                # adjusted intercept
             "coefs": {unit: float}       # coefficients (subgradients)
         }
-    pddd_memory : List[Dict]
-        List of stage-level information from the PDDD algorithm.
-        Each element must include the storage volumes in the key 
-        'f_volume', e.g.:
-        {
-            "f_volume": {"UHE1": 50, "UHE2": 80, ...}
-        }
+    pddd_memory : List[StageResult]
+        List of stage records from the PDDD algorithm. The final state of
+        each record (volumes and storage energies, ``state``) is used as
+        evaluation point.
 
     Returns
     -------
@@ -130,9 +169,10 @@ def compute_fcf(cuts: List[Dict],
     """
     fcf_values: Dict = {}
     for stage in range(len(pddd_memory)-1):
-        stage_fcf_values = fcf_from_cuts(cuts=cuts,
-                                         stage=stage,
-                                         storage_levels=pddd_memory[stage]['f_volume'])
+        fcf = FutureCostFunction.from_cuts(cuts=cuts,
+                                           stage=stage,
+                                           units=pddd_memory[stage].state_units)
+        stage_fcf_values = fcf.cut_values(pddd_memory[stage].state)[0].tolist()
         fcf_values[r"FCF_{" + f"{stage+1:d}" + r"}"] = stage_fcf_values
     
     return fcf_values
@@ -143,7 +183,10 @@ def solve_stage_pddd(yaml_data: Dict,
                      stage_hydros: Dict,
                      stage_storage: Dict,
                      cuts: Dict,
-                     stage: int) -> Dict:
+                     stage: int,
+                     stage_models: Optional[Dict] = None,
+                     reg_center: Optional[Dict[str, float]] = None,
+                     reg_weight: float = 0.0) -> StageResult:
     """
     Solves a single stage of the hydrothermal dispatch problem within the 
     Deterministic Dual Dynamic Programming (PDDD) framework.
@@ -172,28 +215,32 @@ def solve_stage_pddd(yaml_data: Dict,
     stage : int
         The index of the current stage being solved (0-based).
 
+    stage_models : dict, optional
+        Cache of persistent stage models. When given, the stage is solved
+        by :func:`solve_persistent_stage_pddd` instead of being rebuilt.
+
+    reg_center : dict, optional
+        Center of the proximal term of a regularized forward pass (final
+        state of the stage in the previous iteration). ``None`` (default)
+        solves the plain stage problem.
+
+    reg_weight : float, optional
+        Weight of the proximal term (see
+        :func:`~NaivePyDECOMP.BuilderPDDD.add_pddd_regularization`).
+
     Returns
     -------
-    results : dict
-        Dictionary containing:
-
-        - 'model' : ConcreteModel
-            The Pyomo model instance with solved values.
-        - 'hydro' : dict
-            The hydro dictionary passed as input, preserved for traceability.
-        - 'storage' : dict
-            The storage dictionary passed as input, preserved for traceability.
-        - 'total_cost' : float
-            The stage cost including the estimated future cost via alpha.
-        - 'alpha' : float
-            The value of the cost-to-go (future cost approximation) variable.
-        - 'f_volume' : dict
-            Dictionary mapping each hydro plant to its final volume at the end of the stage.
-        - 'cmo' : float
-            The dual variable associated with the system-wide energy balance constraint (marginal cost of operation).
-        - 'cma' : dict
-            Dictionary mapping each hydro plant to its marginal water value 
-            (dual variable of the volume balance constraint).
+    results : StageResult
+        Compact record of the stage solve (see
+        :class:`~NaivePyDECOMP.PDDDDataTypes.StageResult`) with:
+
+        - the stage cost including the estimated future cost via alpha
+          (``total_cost``) and the cost-to-go variable (``alpha``);
+        - the initial state used (``Vini``, ``Eini``);
+        - the primal values of every variable family (``V``, ``Q``, ``S``,
+          ``G``, ``thermal_p``, ``storage_E``, ``D``, ``lines_flow``...);
+        - the marginal cost of operation (``cmo``) and the marginal water
+          values (``cma``, duals of the volume balance constraints).
 
     Raises
     ------
@@ -207,6 +254,20 @@ def solve_stage_pddd(yaml_data: Dict,
     to simulate stage-wise operations and propagate information backward via cuts.
     """
 
+    if stage_models is not None:
+        return solve_persistent_stage_pddd(yaml_data=yaml_data,
+                                           stage_hydros=stage_hydros,
+                                           stage_storage=stage_storage,
+                                           cuts=cuts,
+                                           stage=stage,
+                                           stage_models=stage_models,
+                                           reg_center=reg_center,
+                                           reg_weight=reg_weight)
+
+    perf: Dict[str, Any] = {'stage': stage, 'pid': os.getpid(),
+                            'persistent': False, 'start': time.time()}
+    clock = time.perf_counter()
+
     # --------------------------
     # PROBLEM PREPARATION
     # --------------------------
@@ -216,32 +277,24 @@ def solve_stage_pddd(yaml_data: Dict,
         current_yaml_data['storage'] = stage_storage
     solver_str = current_yaml_data['meta']['Solver']
     options = current_yaml_data['meta'].get('Solver_Options', {})
+    clock = _lap(perf, 'copy', clock)
 
     model = build_pddd_balance_and_objective_from_yaml(yaml_data=current_yaml_data,
                                                        stage=stage,
                                                        cuts=cuts)
+    update_pddd_regularization(model, reg_center, reg_weight)
+    clock = _lap(perf, 'build', clock)
 
-    opt = SolverFactory(solver_str)
-
-    if not opt.available():
-        raise RuntimeError(f"Solver '{solver_str}' is not available")
+    session = get_solver_session(solver_str, options)
 
     # --------------------------
     # PROBLEM SOLUTION
     # --------------------------
     try:
-        if solver_str.lower() == 'mindtpy':
-            res = opt.solve(
-                model,
-                mip_solver=options.get('mip_solver', 'glpk'),
-                nlp_solver=options.get('nlp_solver', 'cyipopt'),
-                strategy=options.get('strategy', 'OA'),
-                tee=False,
-                suffixes=["dual"]
-            )
-        else:
-            res = opt.solve(model, tee=False,
-                            suffixes=["dual"])
+        res = session.solve(model, duals=True, load_solutions=False)
+        clock = _lap(perf, 'solve', clock)
+        perf['io'] = session.last_io_time
+        perf['io_mode'] = session.io_mode
 
 
         # Check termination condition
@@ -250,6 +303,10 @@ def solve_stage_pddd(yaml_data: Dict,
                              TerminationCondition.feasible]:
             raise RuntimeError(f"Solve terminated with condition: {term_cond}")
 
+        if session.name.lower() != 'mindtpy':
+            model.solutions.load_from(res)
+        clock = _lap(perf, 'load', clock)
+
     except ApplicationError as e:
         raise RuntimeError(f"Solver execution failed: {e}")
 
@@ -257,24 +314,499 @@ def solve_stage_pddd(yaml_data: Dict,
     # RESULTS PREPARATION
     # --------------------------
 
-    results: Dict = {}
-    results['model'] = copy.deepcopy(model)
-    results['hydro'] = copy.deepcopy(stage_hydros)
-    results['storage'] = copy.deepcopy(stage_storage)
-    results['total_cost'] = model.OBJ()
-    results['alpha'] = model.alpha.value
-    results['f_volume'] = {h: model.hydro_V[h, 1].value for h in model.HG}
-    results['cmo'] = model.dual[model.Balance[1]]
-    results['cma'] = {
-        h: model.dual[model.hydro_volume_balance_constraint[h, 1]] for h in model.HG}
+    results = collect_stage_results(model, stage)
+    _lap(perf, 'collect', clock)
+    _model_stats(perf, model, session.handle, cuts)
+    results.perf = perf
+    return results
+
+
+def _lap(perf: Dict[str, Any], phase: str, clock: float) -> float:
+    """Store the time elapsed since ``clock`` as ``phase``; return the new clock."""
+    now = time.perf_counter()
+    perf[phase] = now - clock
+    return now
+
+
+def _model_stats(perf: Dict[str, Any],
+                 model: ConcreteModel,
+                 opt: Any,
+                 cuts: List[Dict]) -> None:
+    """Store the cut count, the LP size and the solver iterations of a solve."""
+    perf['cuts'] = len(cuts)
+    perf['rows'], perf['cols'] = stage_model_size(model)
+    perf['solver_iterations'] = solver_iterations(opt)
+
+
+def make_persistent_solver(solver_str: str) -> Any:
+    """
+    Create a persistent solver interface for PDDD stage models.
+
+    The solver name from ``meta.Solver`` is mapped to the matching appsi
+    interface (``highs``, ``appsi_highs``, ``gurobi_direct`` and
+    ``gurobi_persistent`` all map to the same family). The interface keeps
+    the stage model loaded in the solver between calls, so only changed
+    bounds, parameters and new rows are transmitted, and the previous basis
+    is reused as a warm start.
+
+    Parameters
+    ----------
+    solver_str : str
+        Solver name as given in ``meta.Solver``.
+
+    Returns
+    -------
+    Any
+        An appsi solver instance configured for incremental updates.
+
+    Raises
+    ------
+    RuntimeError
+        If the solver has no persistent interface or is not available.
+    """
+    name = solver_family(solver_str)
+
+    if name not in PERSISTENT_SOLVERS:
+        raise RuntimeError(
+            f"Solver '{solver_str}' has no persistent interface. "
+            f"Use one of: {', '.join(sorted(PERSISTENT_SOLVERS))}")
+
+    opt = PERSISTENT_SOLVERS[name]()
+
+    if not opt.available():
+        raise RuntimeError(f"Solver '{solver_str}' is not available")
+
+    # only the state parameters and the cut list change between solves
+    opt.update_config.check_for_new_or_removed_constraints = True
+    opt.update_config.check_for_new_or_removed_vars = False
+    opt.update_config.check_for_new_or_removed_params = False
+    opt.update_config.check_for_new_objective = False
+    opt.update_config.update_constraints = False
+    opt.update_config.update_vars = False
+    opt.update_config.update_params = True
+    opt.update_config.update_named_expressions = False
+    opt.update_config.update_objective = False
+
+    return opt
+
+
+def _values(component: Any,
+            index: List[Any],
+            periods: List[int]) -> np.ndarray:
+    """
+    Read the values of a time-indexed component into a NumPy array
+    (``index`` × ``periods``).
+    """
+    return np.array([[value(component[i, t]) for t in periods]
+                     for i in index], dtype=float).reshape(len(index), len(periods))
+
+
+def _duals(model: ConcreteModel,
+           constraint: Any,
+           index: List[Any],
+           periods: List[int]) -> np.ndarray:
+    """
+    Read the duals of a time-indexed constraint into a NumPy array
+    (``index`` × ``periods``).
+    """
+    return np.array([[model.dual[constraint[i, t]] for t in periods]
+                     for i in index], dtype=float).reshape(len(index), len(periods))
+
+
+def collect_stage_results(model: ConcreteModel,
+                          stage: int) -> StageResult:
+    """
+    Collect the economic and operational results of a solved stage model.
+
+    Only numbers are kept: the returned record holds no reference to the
+    Pyomo model, which can be discarded or reused after this call. Every
+    time-indexed family is read for all the periods of the stage.
+
+    Parameters
+    ----------
+    model : ConcreteModel
+        Solved stage model with the ``dual`` suffix populated.
+    stage : int
+        The index of the stage (0-based).
+
+    Returns
+    -------
+    StageResult
+        Compact record of the stage solve.
+    """
+    T = list(model.T)
+    # the balance rows are added period by period, one per bar
+    n_bars = len(model.CB)
+    results = StageResult(stage=stage,
+                          total_cost=value(model.OBJ),
+                          alpha=value(model.alpha),
+                          cmo=np.array([model.dual[model.Balance[(t - 1) * n_bars + 1]]
+                                        for t in T]),
+                          periods=tuple(period + 1 for period in model.pddd_periods))
+
+    if has_hydro_model(model):
+        HG = list(model.HG)
+        results.hydro_units = tuple(HG)
+        results.Vini = np.array([value(model.hydro_Vini[h]) for h in HG])
+        results.V = _values(model.hydro_V, HG, T)
+        results.Q = _values(model.hydro_Q, HG, T)
+        results.S = _values(model.hydro_S, HG, T)
+        results.G = _values(model.hydro_G, HG, T)
+        results.cma = _duals(model, model.hydro_volume_balance_constraint, HG, T)
+
+    if has_thermal_model(model):
+        TG = list(model.TG)
+        results.thermal_units = tuple(TG)
+        results.thermal_p = _values(model.thermal_p, TG, T)
+
+    if has_renewable_model(model):
+        RU = list(model.RU)
+        results.renewable_units = tuple(RU)
+        results.renewable_gen = _values(model.renewable_gen, RU, T)
+
+    if has_storage_model(model):
+        SU = list(model.SU)
+        results.storage_units = tuple(SU)
+        results.Eini = np.array([value(model.storage_Eini[s]) for s in SU])
+        results.storage_E = _values(model.storage_E, SU, T)
+        results.storage_ch = _values(model.storage_ch, SU, T)
+        results.storage_dis = _values(model.storage_dis, SU, T)
+        results.cme = _duals(model, model.storage_energy_balance_constraint, SU, T)
+
+    if has_connection_bar_model(model):
+        CB = list(model.CB)
+        results.bars = tuple(CB)
+        results.D = _values(model.D, CB, T)
+        if not model.unique_bar:
+            results.theta = _values(model.theta, CB, T)
+
+    if has_transmission_line_model(model):
+        LT = list(model.LT)
+        results.lines = tuple(LT)
+        results.lines_flow = _values(model.lines_flow, LT, T)
+
+    if hasattr(model, 'reg_penalty'):
+        results.regularization = value(model.reg_penalty)
 
     return results
 
 
+def solve_persistent_stage_pddd(yaml_data: Dict,
+                                stage_hydros: Dict,
+                                stage_storage: Dict,
+                                cuts: List[Dict],
+                                stage: int,
+                                stage_models: Dict,
+                                reg_center: Optional[Dict[str, float]] = None,
+                                reg_weight: float = 0.0) -> StageResult:
+    """
+    Solves a single PDDD stage reusing a persistent stage model.
+
+    The stage model and its persistent solver are built on the first call
+    for ``stage`` and cached in ``stage_models``. Later calls only update
+    the initial volumes and energies (mutable parameters), synchronize the
+    cut rows with ``cuts`` (new cuts are added, cuts left out of the
+    selection are deactivated) and re-solve, so the solver receives just the
+    modified rows and bounds and warm-starts from its last basis.
+
+    Parameters
+    ----------
+    yaml_data : dict
+        The full configuration dictionary loaded from a YAML file.
+    stage_hydros : dict
+        Hydro section with the initial volumes of the stage.
+    stage_storage : dict
+        Storage section with the initial energies of the stage.
+    cuts : list of dict
+        Benders cuts to enforce (see
+        :func:`~NaivePyDECOMP.BuilderPDDD.add_pddd_cuts`).
+    stage : int
+        The index of the current stage being solved (0-based).
+    stage_models : dict
+        Cache mapping each stage to a ``(model, solver)`` pair. Filled on
+        demand.
+    reg_center : dict, optional
+        Center of the proximal term of a regularized forward pass.
+    reg_weight : float, optional
+        Weight of the proximal term.
+
+    Returns
+    -------
+    StageResult
+        Compact record of the stage solve.
+
+    Raises
+    ------
+    RuntimeError
+        If the solver is not available or the solve is not optimal.
+    """
+    perf: Dict[str, Any] = {'stage': stage, 'pid': os.getpid(),
+                            'persistent': True, 'start': time.time()}
+    clock = time.perf_counter()
+
+    if stage not in stage_models:
+        model = build_pddd_balance_and_objective_from_yaml(yaml_data=yaml_data,
+                                                           stage=stage,
+                                                           cuts=[])
+        opt = make_persistent_solver(yaml_data['meta']['Solver'])
+        stage_models[stage] = (model, opt)
+
+    model, opt = stage_models[stage]
+
+    update_pddd_stage_state(model, stage_hydros, stage_storage)
+    update_pddd_regularization(model, reg_center, reg_weight)
+    add_pddd_cuts(model, cuts, stage)
+    clock = _lap(perf, 'build', clock)
+
+    res = opt.solve(model)
+    clock = _lap(perf, 'solve', clock)
+    run_time = native_run_time(opt)
+    perf['io'] = None if run_time is None else max(perf['solve'] - run_time, 0.0)
+    perf['io_mode'] = 'memory'
+
+    if res.termination_condition != PersistentTerminationCondition.optimal:
+        raise RuntimeError(
+            f"Solve terminated with condition: {res.termination_condition}")
+
+    for constraint, dual in opt.get_duals().items():
+        model.dual[constraint] = dual
+    clock = _lap(perf, 'duals', clock)
+
+    results = collect_stage_results(model, stage)
+    _lap(perf, 'collect', clock)
+    _model_stats(perf, model, opt, cuts)
+    results.perf = perf
+    return results
+
+
+def pddd_state_units(case: Dict) -> Tuple[str, ...]:
+    """
+    Names of the PDDD state variables of a case: the hydro units (volumes)
+    followed by the storage units (energies).
+    """
+    units = tuple(case['hydro']['units'].keys())
+    if case.get('storage') is not None:
+        units += tuple(case['storage']['units'].keys())
+    return units
+
+
+def _trial_state(stage_hydros: Dict,
+                 stage_storage: Optional[Dict]) -> Dict[str, float]:
+    """Initial state of a stage, i.e. the trial point of its cut."""
+    state = {uhe: float(unit['Vini'])
+             for uhe, unit in stage_hydros['units'].items()}
+    if stage_storage is not None:
+        state.update({sunit: float(unit['Eini'])
+                      for sunit, unit in stage_storage['units'].items()})
+    return state
+
+
+def make_benders_cut(results: StageResult) -> Dict:
+    """
+    Build the Benders cut of the previous stage from a backward-pass solve.
+
+    The cut is the supporting hyperplane of the stage cost at the trial
+    state: ``alpha >= rhs + sum(coefs[u] * x[u])`` over the hydro volumes
+    and the storage energies, with their marginal values (``cma``,
+    ``cme``) as coefficients and the trial state absorbed into the
+    intercept.
+
+    Parameters
+    ----------
+    results : StageResult
+        Record of the backward-pass solve of stage ``t``.
+
+    Returns
+    -------
+    dict
+        Cut for stage ``t - 1`` with keys ``stage``, ``rhs`` and ``coefs``.
+    """
+    return {
+        "stage": results.stage - 1,
+        "rhs": results.total_cost - float(results.state_duals @ results.state_initial),
+        "coefs": dict(zip(results.state_units, results.state_duals.tolist()))
+    }
+
+
+def warm_start_cut_pool(pool: CutPool,
+                        path: str,
+                        nstages: int,
+                        verbose: bool = True) -> CutPool:
+    """
+    Load a saved cut file into an empty pool before the first iteration.
+
+    Parameters
+    ----------
+    pool : CutPool
+        Pool of the run, created with the fingerprint of the current case.
+    path : str
+        ``.npz`` file written by :func:`~NaivePyDECOMP.PDDDCutPool.save_cut_pool`.
+    nstages : int
+        Number of stages of the current case.
+    verbose : bool, optional
+        Whether to report the loaded cuts.
+
+    Returns
+    -------
+    CutPool
+        The same pool, holding the loaded cuts.
+
+    Raises
+    ------
+    ValueError
+        If the file does not match the hydro units or the horizon of the case.
+    """
+    fingerprint = load_cut_pool(path, pool)
+    stages = pool.stages()
+    if stages and stages[-1] >= nstages - 1:
+        raise ValueError(
+            f"Cut file '{path}' has cuts for stage {stages[-1] + 1}, "
+            f"but the case has only {nstages} stages.")
+    if verbose:
+        print(f"Warm start with {len(pool)} cuts from {path}")
+        if fingerprint != pool.fingerprint:
+            print(f"{Fore.YELLOW}The cuts were computed for a different case: "
+                  f"they remain a valid approximation only if the changes do "
+                  f"not lower the future costs.{Style.RESET_ALL}")
+    return pool
+
+
+def hybrid_start_cut_pool(pool: CutPool,
+                          case: Dict,
+                          verbose: bool = True) -> CutPool:
+    """
+    Seed the cut pool with the cuts of the monolithic LP relaxation.
+
+    The whole horizon is solved once as an LP and one cut per stage
+    boundary is derived from its duals, state trajectory and tail costs
+    (see :mod:`~NaivePyDECOMP.PDDDHybridStart`).
+
+    Parameters
+    ----------
+    pool : CutPool
+        Pool of the run.
+    case : dict
+        Parsed case.
+    verbose : bool, optional
+        Whether to report the monolithic bound and the loaded cuts.
+
+    Returns
+    -------
+    CutPool
+        The same pool, holding the monolithic cuts.
+    """
+    model = solve_monolithic_relaxation(case)
+    added = 0
+    for cut, trial in monolithic_cuts(model, pddd_stage_periods(case), pool.units):
+        added += pool.add(cut, trial=trial)
+    if verbose:
+        print(f"Hybrid start: monolithic LP = {value(model.OBJ):.4f}, "
+              f"{added} cuts loaded")
+    return pool
+
+
+def first_stage_alpha_values(pool: CutPool,
+                             memory: List[StageResult]) -> Dict:
+    """
+    Summarize the first stage cuts of a finished run.
+
+    Parameters
+    ----------
+    pool : CutPool
+        Cut pool of the run.
+    memory : list of StageResult
+        Stage records of the final forward pass.
+
+    Returns
+    -------
+    dict
+        ``T``: sum of the trial volumes of each first stage cut (NaN when
+        unknown) and ``FCF_{1}``: value of each of those cuts at the final
+        state (volumes and storage energies) of the first stage. Both are
+        empty when the whole horizon is a single stage.
+    """
+    fct_values = compute_fcf(pool.cuts(0), memory)
+    # trial volumes only: the storage energies follow the hydro units
+    n_hydro = len(memory[0].hydro_units)
+    return {"T": pool.trial_points(0)[:, :n_hydro].sum(axis=1).tolist(),
+            "FCF_{1}": fct_values.get("FCF_{1}", [])}
+
+
+def init_backward_worker(yaml_data: Dict,
+                         persistent: bool) -> None:
+    """
+    Initialize a worker process of the parallel backward pass.
+
+    The case is sent once per worker instead of once per task. When
+    ``persistent`` is set, each worker also keeps its own cache of
+    persistent stage models.
+
+    Parameters
+    ----------
+    yaml_data : dict
+        The full configuration dictionary of the case.
+    persistent : bool
+        Whether stage models are kept alive inside the worker.
+    """
+    global _WORKER_CASE, _WORKER_STAGE_MODELS
+    _WORKER_CASE = yaml_data
+    _WORKER_STAGE_MODELS = {} if persistent else None
+
+
+def solve_backward_stage_pddd(stage_hydros: Dict,
+                              stage_storage: Dict,
+                              stage_cuts: List[Dict],
+                              stage: int) -> Dict:
+    """
+    Solve one backward-pass stage inside a worker process.
+
+    Parameters
+    ----------
+    stage_hydros : dict
+        Hydro section with the trial volumes of the stage.
+    stage_storage : dict
+        Storage section with the trial energies of the stage.
+    stage_cuts : list of dict
+        Selected cuts of ``stage`` at the end of the previous iteration.
+    stage : int
+        The index of the stage (0-based, ``stage > 0``).
+
+    Returns
+    -------
+    cut : dict
+        Benders cut for ``stage - 1`` (see :func:`make_benders_cut`).
+    perf : dict
+        Phase timings and model size of the solve.
+    """
+    results = solve_stage_pddd(yaml_data=_WORKER_CASE,
+                               stage_hydros=stage_hydros,
+                               stage_storage=stage_storage,
+                               cuts=stage_cuts,
+                               stage=stage,
+                               stage_models=_WORKER_STAGE_MODELS)
+    return make_benders_cut(results), results.perf
+
+
 def solve_pddd(path: str,
                max_iter: int = 500,
                tol: float = 0.01,
-               verbose: bool = True) -> Tuple[ConcreteModel, Dict]:
+               verbose: bool = True,
+               persistent: Optional[bool] = None,
+               parallel_backward: Optional[bool] = None,
+               workers: Optional[int] = None,
+               cut_selection: Optional[str] = None,
+               warm_start: Optional[str] = None,
+               save_cuts: Optional[str] = None,
+               checkpoint: Optional[str] = None,
+               checkpoint_every: Optional[int] = None,
+               checkpoint_seconds: Optional[float] = None,
+               resume: bool = False,
+               trace: Optional[str] = None,
+               chrome_trace: Optional[str] = None,
+               stage_length: Optional[int] = None,
+               hybrid_start: Optional[bool] = None,
+               regularization: Optional[Dict] = None,
+               stopping: Optional[Dict] = None) -> Tuple[PDDDResults, Dict, Dict, Dict]:
     """
     Solves the full multi-stage hydrothermal dispatch problem using the 
     Deterministic Dual Dynamic Programming (PDDD) algorithm.
@@ -302,18 +834,112 @@ def solve_pddd(path: str,
     verbose : bool, optional
         Whether to print iteration logs and convergence progress (default is True).
 
+    persistent : bool, optional
+        Keep one model per stage alive for the whole run and solve it through
+        a persistent solver interface (see :func:`make_persistent_solver`).
+        When ``None`` (default), ``meta.PDDD_Options.persistent`` is used.
+
+    parallel_backward : bool, optional
+        Solve all backward-pass stages concurrently in a process pool, each
+        one against the cuts of the previous iteration, and merge the new
+        cuts before the next forward pass. Cuts are slightly weaker per
+        iteration, but every core is used. When ``None`` (default),
+        ``meta.PDDD_Options.parallel_backward`` is used.
+
+    workers : int, optional
+        Number of worker processes of the parallel backward pass. When
+        ``None`` (default), ``meta.PDDD_Options.workers`` or the number of
+        CPUs is used.
+
+    cut_selection : str, optional
+        Cuts loaded into the stage models: ``all``, ``level1`` (Level-1
+        dominance) or ``last_k`` (binding in the last
+        ``meta.PDDD_Options.cut_last_k`` iterations), see
+        :class:`~NaivePyDECOMP.PDDDCutPool.CutPool`. Duplicate cuts (within
+        ``meta.PDDD_Options.cut_tol``) are always rejected. When ``None``
+        (default), ``meta.PDDD_Options.cut_selection`` or ``all`` is used.
+
+    warm_start : str, optional
+        ``.npz`` cut file (see :func:`~NaivePyDECOMP.PDDDCutPool.save_cut_pool`)
+        loaded as the initial future cost approximation. When ``None``
+        (default), ``meta.PDDD_Options.warm_start`` is used.
+
+    save_cuts : str, optional
+        ``.npz`` file receiving the cut pool at the end of the run. When
+        ``None`` (default), ``meta.PDDD_Options.save_cuts`` is used.
+
+    checkpoint : str, optional
+        ``.npz`` file receiving periodic checkpoints of the run (cut pool,
+        trial trajectory, bound history and iteration counter, see
+        :func:`~NaivePyDECOMP.PDDDCheckpoint.save_pddd_checkpoint`). When
+        ``None`` (default), ``meta.PDDD_Options.checkpoint`` is used.
+
+    checkpoint_every : int, optional
+        Write a checkpoint every ``checkpoint_every`` iterations. When
+        ``None`` (default), ``meta.PDDD_Options.checkpoint_every`` is used,
+        or 10 when neither this nor ``checkpoint_seconds`` is set.
+
+    checkpoint_seconds : float, optional
+        Write a checkpoint when this many seconds have elapsed since the
+        previous one. When ``None`` (default),
+        ``meta.PDDD_Options.checkpoint_seconds`` is used.
+
+    resume : bool, optional
+        Continue from ``checkpoint`` instead of starting from scratch
+        (default is False). ``max_iter`` counts the iterations of the
+        original run as well.
+
+    trace : str, optional
+        JSON lines file receiving one performance record per stage solve
+        and one summary per iteration (see
+        :class:`~NaivePyDECOMP.PDDDTrace.PDDDTrace`). When ``None``
+        (default), ``meta.PDDD_Options.trace`` is used.
+
+    chrome_trace : str, optional
+        Chrome trace file (``.json``) with the timeline of the run, for
+        ``chrome://tracing`` or Perfetto. When ``None`` (default),
+        ``meta.PDDD_Options.chrome_trace`` is used.
+
+    stage_length : int, optional
+        Number of consecutive periods of the horizon covered by each stage
+        (see :func:`~NaivePyDECOMP.BuilderPDDD.pddd_stage_periods`). Longer
+        stages mean fewer, larger subproblems per pass; stages are coupled
+        only through the state at their boundaries. When ``None``
+        (default), ``meta.PDDD_Options.stage_length`` or 1 is used.
+
+    hybrid_start : bool, optional
+        Solve the monolithic LP relaxation of the whole horizon once and
+        load one cut per stage boundary, built from its duals, into the
+        pool before the first iteration (see
+        :func:`hybrid_start_cut_pool`). Ignored when resuming. When
+        ``None`` (default), ``meta.PDDD_Options.hybrid_start`` is used.
+
+    regularization : dict, optional
+        Regularized forward pass: ``type`` (``l1`` or ``quadratic``),
+        ``weight``, ``decay`` and ``min_weight`` (see
+        :class:`~NaivePyDECOMP.PDDDConvergence.RegularizationSchedule`).
+        When ``None`` (default), ``meta.PDDD_Options.regularization`` is
+        used; without it the forward pass is not regularized.
+
+    stopping : dict, optional
+        Adaptive stopping rule: ``rel_gap``, ``stall_iterations`` and
+        ``stall_tol`` (see :class:`~NaivePyDECOMP.PDDDConvergence.StoppingRule`),
+        checked together with ``tol``. When ``None`` (default),
+        ``meta.PDDD_Options.stopping`` is used.
+
     Returns
     -------
-    model : ConcreteModel
-        A dummy Pyomo model representing the structure and solution of the 
-        final iteration. This is mainly for completeness and introspection.
+    model : PDDDResults
+        Results of the final forward pass, laid out like the multi-period
+        model (see :func:`~NaivePyDECOMP.PDDDResults.build_pddd_results`)
+        and accepted by the reporting and DataFrame functions.
 
     case : dict
         The parsed YAML case dictionary used in the PDDD process, containing 
         metadata, hydro data, and solver configurations.
 
     alpha_values : dict
-        alpha values of future costs.
+        alpha values of future costs (see :func:`first_stage_alpha_values`).
 
     ZINF: dict
 
@@ -337,13 +963,14 @@ def solve_pddd(path: str,
     - This implementation is pedagogical and emphasizes clarity and modularity 
       over computational performance.
     """
-    # === Compatibilidade com pl único ===
-    npl_model, npl_case = build_model_from_file(path)
-    print_welcome_message(npl_model, npl_case)
-    # === Construção dos subproblemas ===
+    run_start = time.time()
+    clock = time.perf_counter()
+    # === Caso único: lido e validado uma só vez ===
+    # the welcome message, the stage builders and the result merger all
+    # share this case, which is never modified in place
     case = build_pddd_data_from_file(path)
-    original_case = copy.deepcopy(case)
-    nstages = case['meta'].get('horizon', 1)
+    print_welcome_message(None, case)
+    setup_time = time.perf_counter() - clock
 
     if 'hydro' not in case:
         raise ValueError(
@@ -354,126 +981,262 @@ def solve_pddd(path: str,
             'Thermal Units must be set o perform DECOMP Like Dispatch')
 
 
+    pddd_options = case['meta'].get('PDDD_Options', {})
+    if persistent is None:
+        persistent = bool(pddd_options.get('persistent', False))
+    if parallel_backward is None:
+        parallel_backward = bool(pddd_options.get('parallel_backward', False))
+    if workers is None:
+        workers = int(pddd_options.get('workers', os.cpu_count() or 1))
+    if cut_selection is None:
+        cut_selection = pddd_options.get('cut_selection', 'all')
+    if warm_start is None:
+        warm_start = pddd_options.get('warm_start')
+    if save_cuts is None:
+        save_cuts = pddd_options.get('save_cuts')
+    if checkpoint is None:
+        checkpoint = pddd_options.get('checkpoint')
+    if checkpoint_every is None:
+        checkpoint_every = pddd_options.get('checkpoint_every')
+    if checkpoint_seconds is None:
+        checkpoint_seconds = pddd_options.get('checkpoint_seconds')
+    if checkpoint and checkpoint_every is None and checkpoint_seconds is None:
+        checkpoint_every = 10
+    if resume and not checkpoint:
+        raise ValueError('resume requires a checkpoint file')
+    if trace is None:
+        trace = pddd_options.get('trace')
+    if chrome_trace is None:
+        chrome_trace = pddd_options.get('chrome_trace')
+    # the stage builders read the stage length and the regularization
+    # from the case: overrides go into a shallow copy, the parsed case
+    # stays intact
+    overrides: Dict[str, Any] = {}
+    if stage_length is not None and stage_length != pddd_options.get('stage_length', 1):
+        overrides['stage_length'] = stage_length
+    if regularization is not None and regularization != pddd_options.get('regularization'):
+        overrides['regularization'] = regularization
+    if overrides:
+        pddd_options = dict(pddd_options, **overrides)
+        case = dict(case, meta=dict(case['meta'], PDDD_Options=pddd_options))
+    nstages = len(pddd_stage_periods(case))
+    schedule = RegularizationSchedule.from_options(pddd_options.get('regularization'),
+                                                   solver=case['meta']['Solver'])
+    if stopping is None:
+        stopping = pddd_options.get('stopping')
+    stopping_rule = StoppingRule.from_options(tol, stopping)
+    if hybrid_start is None:
+        hybrid_start = bool(pddd_options.get('hybrid_start', False))
+
+    tracer = None
+    if trace or chrome_trace:
+        tracer = PDDDTrace(path=trace, chrome=chrome_trace, _start=run_start)
+        tracer.event('setup', run_start, setup_time)
+
     # === Inicializações ===
-    cuts = []
+    pool = CutPool(units=pddd_state_units(case),
+                   tol=float(pddd_options.get('cut_tol', 1e-6)),
+                   strategy=cut_selection,
+                   last_k=int(pddd_options.get('cut_last_k', 5)),
+                   fingerprint=case_fingerprint(case))
+    if warm_start and not resume:
+        warm_start_cut_pool(pool, warm_start, nstages, verbose)
+    if hybrid_start and not resume:
+        hybrid_start_time = time.time()
+        clock = time.perf_counter()
+        hybrid_start_cut_pool(pool, case, verbose)
+        if tracer is not None:
+            tracer.event('hybrid_start', hybrid_start_time,
+                         time.perf_counter() - clock)
+    stage_models = {} if persistent else None
     ZINF = []
     ZSUP = []
+    start_iter = 0
 
-    alpha_values: Dict = {}
-
-    alpha_values["T"] = []
-
-    hydro_units_default = case['hydro']
+    # initial state of each stage: the forward pass overwrites Vini/Eini
+    # of stage t+1 with the final volumes/energies of stage t
+    stage_hydros: List[Dict] = [copy.deepcopy(case['hydro'])
+                                for _ in range(nstages)]
 
     if 'storage' in case:
-        storage_units_default = case['storage']
+        stage_storage: List[Any] = [copy.deepcopy(case['storage'])
+                                    for _ in range(nstages)]
     else:
-        storage_units_default = None
-
-    memory: List[Any] = [{"model": ConcreteModel(),
-                          "hydro": hydro_units_default,
-                          'storage': storage_units_default,
-                          "total_cost": 0.0,
-                          "alpha": 0.0,
-                          "f_volume": {},
-                          "cmo": 0.0,
-                          "cma": {}} for _ in range(nstages)]
+        stage_storage = [None for _ in range(nstages)]
 
-    for iter_idx in range(max_iter):
+    memory: List[Optional[StageResult]] = [None for _ in range(nstages)]
 
+    if resume:
+        state = load_pddd_checkpoint(checkpoint, pool, stage_hydros, stage_storage)
+        start_iter = state['iteration']
+        ZINF = state['ZINF']
+        ZSUP = state['ZSUP']
         if verbose:
-            print(f"\n--- Iteration {iter_idx + 1} ---")
-
-        current_zsup = 0.0
-        current_zinf = 0.0
-        # === Forward Pass ===
-        for t in range(nstages):
-
-            stage_data = memory[t]
-
-            results = solve_stage_pddd(yaml_data=case,
-                                       stage_hydros=stage_data['hydro'],
-                                       stage_storage=stage_data['storage'],
-                                       cuts=cuts,
-                                       stage=t)
-
-            memory[t] = copy.deepcopy(results)
-
-            if t < nstages - 1:
-
-                next_stage_data = memory[t + 1]
-                for uhe in stage_data['hydro']['units'].keys():
-                    next_stage_data['hydro']['units'][uhe]['Vini'] = results['f_volume'][uhe]
-                if 'storage' in case:
-                    for sunit in stage_data['storage']['units']:
-                        next_stage_data['storage']['units'][sunit]['Eini'] = value(
-                            results['model'].storage_E[sunit, 1])
-                memory[t+1] = copy.deepcopy(next_stage_data)
-
-            current_zsup += results['total_cost'] - results['alpha']
-            if t == 0:
-                current_zinf = results['total_cost']
-
-        
-        ZSUP.append(current_zsup)
-
-        ZINF.append(current_zinf)
-
+            print(f"Resuming from {checkpoint}: {start_iter} iterations, "
+                  f"{len(pool)} cuts")
+    last_checkpoint = time.monotonic()
+
+    executor = None
+    if parallel_backward and nstages > 1:
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=init_backward_worker,
+                                       initargs=(case, persistent))
         if verbose:
-            print(
-                f"ZINF[{iter_idx}] = {ZINF[-1]:.4f}, ZSUP[{iter_idx}] = {ZSUP[-1]:.4f}")
-
-        if abs(ZSUP[-1] - ZINF[-1]) <= tol:
-            break
-
-        alpha_values["T"].append(sum([memory[0]['f_volume'][h] for h in memory[0]['f_volume']]))
-
-        # === Backward Pass ===
-        for t in reversed(range(nstages)):
-
-            if t > 0:
-
-                stage_data = memory[t]
+            print(f"Parallel backward pass with {workers} workers")
 
+    # the workers are released even if a stage solve, a checkpoint write
+    # or an interrupt aborts the iterations
+    try:
+        # a resumed run always performs at least the final forward pass
+        for iter_idx in range(start_iter, max(max_iter, start_iter + 1)):
+
+            if verbose:
+                print(f"\n--- Iteration {iter_idx + 1} ---")
+
+            pool.iteration = iter_idx
+            current_zsup = 0.0
+            current_zinf = 0.0
+            iter_start = time.time()
+            clock = time.perf_counter()
+            reg_weight = schedule.weight_at(iter_idx) if schedule is not None else 0.0
+            # === Forward Pass ===
+            for t in range(nstages):
+
+                # regularized pass: attract the final state of the stage to
+                # that of the previous iteration
+                reg_center = memory[t].f_state \
+                    if reg_weight > 0 and memory[t] is not None else None
                 results = solve_stage_pddd(yaml_data=case,
-                                           stage_hydros=stage_data['hydro'],
-                                           stage_storage=stage_data['storage'],
-                                           cuts=cuts,
-                                           stage=t)
-
-                rhs = results['total_cost']
-                coefs = dict()
+                                           stage_hydros=stage_hydros[t],
+                                           stage_storage=stage_storage[t],
+                                           cuts=pool.select(t),
+                                           stage=t,
+                                           stage_models=stage_models,
+                                           reg_center=reg_center,
+                                           reg_weight=reg_weight)
+
+                memory[t] = results
+                pool.mark_active(t, results.state)
+                if tracer is not None:
+                    tracer.stage(iter_idx, 'forward', results.perf)
+
+                if t < nstages - 1:
+                    for uhe, volume in results.f_volume.items():
+                        stage_hydros[t + 1]['units'][uhe]['Vini'] = volume
+                    if stage_storage[t + 1] is not None:
+                        for sunit, energy in results.f_energy.items():
+                            stage_storage[t + 1]['units'][sunit]['Eini'] = energy
+
+                current_zsup += results.total_cost - results.alpha - results.regularization
+                if t == 0:
+                    if reg_center is None:
+                        current_zinf = results.total_cost
+                    else:
+                        # the lower bound needs the plain first stage problem
+                        plain = solve_stage_pddd(yaml_data=case,
+                                                 stage_hydros=stage_hydros[t],
+                                                 stage_storage=stage_storage[t],
+                                                 cuts=pool.select(t),
+                                                 stage=t,
+                                                 stage_models=stage_models)
+                        current_zinf = plain.total_cost
+                        if tracer is not None:
+                            tracer.stage(iter_idx, 'forward', plain.perf)
 
-                for uhe in stage_data['hydro']['units']:
-                    # cma = -results['cma'][uhe]
-                    cma = results['cma'][uhe]
-                    rhs -= cma * results['hydro']['units'][uhe]['Vini']
-                    # rhs -= cma * results['model'].hydro_V[uhe, 1].value
-                    coefs[uhe] = cma
-
-                cuts.append({
-                    "stage": t-1,
-                    "rhs": rhs,
-                    "coefs": coefs
-                })
+        
+            ZSUP.append(current_zsup)
+
+            ZINF.append(current_zinf)
+
+            if verbose:
+                print(
+                    f"ZINF[{iter_idx}] = {ZINF[-1]:.4f}, ZSUP[{iter_idx}] = {ZSUP[-1]:.4f}"
+                    + (f" (regularization weight {reg_weight:g})" if reg_weight > 0 else ""))
+
+            forward_time = time.perf_counter() - clock
+            clock = time.perf_counter()
+
+            stop_reason = stopping_rule.check(ZINF, ZSUP)
+            if stop_reason is not None:
+                if verbose:
+                    print(f"Stopping rule met: {stop_reason}")
+                if tracer is not None:
+                    tracer.iteration(iter_idx, ZINF[-1], ZSUP[-1], forward_time,
+                                     0.0, iter_start, len(pool))
+                break
+
+            # === Backward Pass ===
+            if executor is not None:
+                # every stage sees the cuts of the previous iteration only
+                futures = [(t, executor.submit(solve_backward_stage_pddd,
+                                               stage_hydros[t],
+                                               stage_storage[t],
+                                               pool.select(t),
+                                               t))
+                           for t in reversed(range(1, nstages))]
+                for t, future in futures:
+                    cut, perf = future.result()
+                    pool.add(cut, trial=_trial_state(stage_hydros[t], stage_storage[t]))
+                    if tracer is not None:
+                        tracer.stage(iter_idx, 'backward', perf)
+            else:
+                for t in reversed(range(1, nstages)):
+
+                    results = solve_stage_pddd(yaml_data=case,
+                                               stage_hydros=stage_hydros[t],
+                                               stage_storage=stage_storage[t],
+                                               cuts=pool.select(t),
+                                               stage=t,
+                                               stage_models=stage_models)
+
+                    pool.add(make_benders_cut(results),
+                             trial=_trial_state(stage_hydros[t], stage_storage[t]))
+                    if tracer is not None:
+                        tracer.stage(iter_idx, 'backward', results.perf)
+
+            if tracer is not None:
+                tracer.iteration(iter_idx, ZINF[-1], ZSUP[-1], forward_time,
+                                 time.perf_counter() - clock, iter_start, len(pool))
+
+            if verbose:
+                print(format_cut_pool_stats(pool))
+
+            if checkpoint and (iter_idx + 1 >= max_iter or
+                               checkpoint_due(iter_idx + 1, last_checkpoint,
+                                              checkpoint_every, checkpoint_seconds)):
+                save_pddd_checkpoint(checkpoint, pool, iter_idx + 1, ZINF, ZSUP,
+                                     stage_hydros, stage_storage)
+                last_checkpoint = time.monotonic()
+                if verbose:
+                    print(f"Checkpoint written to {checkpoint}")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if save_cuts:
+        save_cut_pool(pool, save_cuts)
 
     # FCF from benders cuts
 
-    fct_values = compute_fcf(cuts, memory)
-
-    alpha_values["FCF_{1}"] = fct_values["FCF_{1}"]
+    alpha_values = first_stage_alpha_values(pool, memory)
 
     if verbose:
         print("\n=== PDDD Finished ===")
         print(f"Final ZINF = {ZINF[-1]:.4f}")
         print(f"Final ZSUP = {ZSUP[-1]:.4f}")
         print(
-            f"Gap = {abs(ZSUP[-1] - ZINF[-1]):.4f} after {iter_idx + 1} iterations")
+            f"Gap = {abs(ZSUP[-1] - ZINF[-1]):.4f} after {iter_idx + 1} iterations "
+            f"({'parallel' if executor is not None else 'sequential'} backward pass)")
 
     z_limits = {'ZINF': ZINF,
                 'ZSUP': ZSUP}
     
-    model = generate_dummy_model(memory, original_case)
+    merge_start = time.time()
+    clock = time.perf_counter()
+    model = build_pddd_results(memory, case)
+    if tracer is not None:
+        tracer.event('merge', merge_start, time.perf_counter() - clock)
+        tracer.close()
 
     dispatch_summary(model)
     hydro_dispatch_summary(model)
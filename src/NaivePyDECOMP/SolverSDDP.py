@@ -0,0 +1,536 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Utility: Solve Stochastic (SDDP) Pyomo Models from YAML Configuration
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Stochastic Dual Dynamic Programming (SDDP) on top of the PDDD stage models.
+Each stage has a discrete set of natural inflow scenarios (stage-wise
+independent). Every iteration:
+
+- samples ``K`` forward trajectories (one scenario per stage) and simulates
+  the current policy along them, in parallel worker processes;
+- for every stage and every trial state visited by the trajectories, solves
+  the stage for all of its scenarios and adds the *expected* Benders cut
+  (average intercept and average water values) to the previous stage;
+- reports the lower bound ZINF (expected first stage cost) and a statistical
+  upper bound ZSUP (mean trajectory cost) with its confidence interval.
+
+Inflow scenarios
+----------------
+Scenarios are read from the ``hydro`` section of the case, in one of two
+forms:
+
+- per unit, ``afluencia_scenarios``: a list with one list of inflows per
+  stage (all units must have the same number of scenarios at a stage);
+- for the whole section, ``scenarios_file``: a NumPy ``.npy`` file (path
+  relative to the YAML file) with shape ``(T, N, H)`` — stages, scenarios
+  and hydro units in the order of the case.
+
+Without either entry the case is deterministic (one scenario per stage, the
+``afluencia`` series) and SDDP reduces to PDDD.
+
+References
+----------
+[1] CEPEL, DECOMP. Manual de Metodologia, 2023
+[2] Pereira, M. V. F.; Pinto, L. M. V. G. Multi-stage stochastic
+    optimization applied to energy planning. Mathematical Programming,
+    52, 1991.
+[3] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+from typing import Any, List, Dict, Optional, Sequence, Tuple
+from colorama import init as colorama_init
+from .Reporting import *
+from .ModelFormatters import *
+from .BuilderPDDD import build_pddd_data_from_file
+from .PDDDResults import PDDDResults, build_pddd_results
+from .PDDDDataTypes import StageResult
+from .PDDDCutPool import CutPool, format_cut_pool_stats, save_cut_pool
+from .SolverPDDD import (
+    solve_stage_pddd,
+    make_benders_cut,
+    warm_start_cut_pool,
+    first_stage_alpha_values,
+    pddd_state_units
+)
+from .YAMLLoader import case_fingerprint
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import copy
+import os
+
+colorama_init(autoreset=True)
+
+# normal quantile of the two-sided 95% confidence interval of ZSUP
+CONFIDENCE_Z = 1.96
+
+# per-process state of the SDDP workers (also set in the main process when
+# the run is sequential)
+_SDDP_CASE: Optional[Dict] = None
+_SDDP_SCENARIOS: Optional[List[np.ndarray]] = None
+_SDDP_STAGE_MODELS: Optional[Dict] = None
+
+
+def load_inflow_scenarios(case: Dict,
+                          path: str) -> List[np.ndarray]:
+    """
+    Read the natural inflow scenarios of every stage.
+
+    Parameters
+    ----------
+    case : dict
+        Parsed case dictionary (see :func:`build_pddd_data_from_file`).
+    path : str
+        Path of the YAML file, used to resolve a relative ``scenarios_file``.
+
+    Returns
+    -------
+    List[np.ndarray]
+        One ``(N_t, H)`` array per stage: the ``N_t`` inflow scenarios of
+        stage ``t`` for the ``H`` hydro units, in the order of the case.
+
+    Raises
+    ------
+    ValueError
+        If the scenario data is inconsistent with the horizon or the units.
+    """
+    hydro = case['hydro']
+    units = list(hydro['units'].keys())
+    nstages = case['meta'].get('horizon', 1)
+
+    if hydro.get('scenarios_file') is not None:
+        file = hydro['scenarios_file']
+        if not os.path.isabs(file):
+            file = os.path.join(os.path.dirname(os.path.abspath(path)), file)
+        data = np.load(file)
+        if data.ndim != 3 or data.shape[0] != nstages or data.shape[2] != len(units):
+            raise ValueError(
+                f"hydro.scenarios_file must have shape (T, N, H) = "
+                f"({nstages}, N, {len(units)}), got {data.shape}.")
+        return [np.asarray(data[t], dtype=float) for t in range(nstages)]
+
+    scenarios: List[np.ndarray] = []
+    for t in range(nstages):
+        columns = []
+        for name in units:
+            unit = hydro['units'][name]
+            if 'afluencia_scenarios' not in unit:
+                columns.append([float(unit['afluencia'][t])])
+                continue
+            if len(unit['afluencia_scenarios']) != nstages:
+                raise ValueError(
+                    f"hydro.units[{name}].afluencia_scenarios must have length {nstages}.")
+            columns.append([float(x) for x in unit['afluencia_scenarios'][t]])
+
+        nscen = max(len(column) for column in columns)
+        for name, column in zip(units, columns):
+            if len(column) == 1 and nscen > 1:
+                # deterministic units repeat their inflow in every scenario
+                column *= nscen
+            elif len(column) != nscen:
+                raise ValueError(
+                    f"hydro.units[{name}] must have {nscen} inflow scenarios "
+                    f"at stage {t + 1}.")
+        scenarios.append(np.array(columns, dtype=float).T)
+
+    return scenarios
+
+
+def init_sddp_worker(yaml_data: Dict,
+                     scenarios: List[np.ndarray],
+                     persistent: bool) -> None:
+    """
+    Initialize a process (worker or main) for SDDP stage solves.
+
+    Parameters
+    ----------
+    yaml_data : dict
+        The full configuration dictionary of the case.
+    scenarios : list of np.ndarray
+        Inflow scenarios of every stage (see :func:`load_inflow_scenarios`).
+    persistent : bool
+        Whether stage models are kept alive inside the process.
+    """
+    global _SDDP_CASE, _SDDP_SCENARIOS, _SDDP_STAGE_MODELS
+    _SDDP_CASE = yaml_data
+    _SDDP_SCENARIOS = scenarios
+    _SDDP_STAGE_MODELS = {} if persistent else None
+
+
+def _stage_sections(stage: int,
+                    f_volume: Optional[Dict],
+                    f_energy: Optional[Dict],
+                    scenario: Optional[int]) -> Tuple[Dict, Any]:
+    """
+    Copy the hydro and storage sections with a given state and inflow.
+
+    ``None`` keeps the initial state of the case (``f_volume``/``f_energy``)
+    or its ``afluencia`` series (``scenario``).
+    """
+    hydros = copy.deepcopy(_SDDP_CASE['hydro'])
+    storage = copy.deepcopy(_SDDP_CASE.get('storage'))
+
+    if f_volume is not None:
+        for uhe, volume in f_volume.items():
+            hydros['units'][uhe]['Vini'] = volume
+    if f_energy is not None and storage is not None:
+        for sunit, energy in f_energy.items():
+            storage['units'][sunit]['Eini'] = energy
+    if scenario is not None:
+        inflows = _SDDP_SCENARIOS[stage][scenario]
+        for uhe, inflow in zip(hydros['units'].keys(), inflows.tolist()):
+            hydros['units'][uhe]['afluencia'][stage] = inflow
+
+    return hydros, storage
+
+
+def simulate_sddp_path(path: Optional[Sequence[int]],
+                       cuts: List[Dict]) -> List[StageResult]:
+    """
+    Simulate the current policy along one inflow trajectory.
+
+    Parameters
+    ----------
+    path : sequence of int or None
+        Scenario index of every stage. ``None`` follows the ``afluencia``
+        series of the case.
+    cuts : list of dict
+        Selected Benders cuts of every stage.
+
+    Returns
+    -------
+    List[StageResult]
+        Record of every stage solve along the trajectory.
+    """
+    nstages = len(_SDDP_SCENARIOS)
+    records: List[StageResult] = []
+    f_volume, f_energy = None, None
+
+    for t in range(nstages):
+        hydros, storage = _stage_sections(stage=t,
+                                          f_volume=f_volume,
+                                          f_energy=f_energy,
+                                          scenario=None if path is None else int(path[t]))
+        results = solve_stage_pddd(yaml_data=_SDDP_CASE,
+                                   stage_hydros=hydros,
+                                   stage_storage=storage,
+                                   cuts=cuts,
+                                   stage=t,
+                                   stage_models=_SDDP_STAGE_MODELS)
+        records.append(results)
+        f_volume, f_energy = results.f_volume, results.f_energy
+
+    return records
+
+
+def solve_sddp_expected_stage(f_volume: Optional[Dict],
+                              f_energy: Optional[Dict],
+                              cuts: List[Dict],
+                              stage: int) -> StageResult:
+    """
+    Solve a stage for all of its inflow scenarios at one trial state.
+
+    Parameters
+    ----------
+    f_volume : dict or None
+        Initial volumes of the stage (final volumes of the previous stage).
+        ``None`` uses the initial volumes of the case.
+    f_energy : dict or None
+        Initial storage energies of the stage, same convention.
+    cuts : list of dict
+        Selected Benders cuts of every stage.
+    stage : int
+        The index of the stage (0-based).
+
+    Returns
+    -------
+    StageResult
+        Record of the *expected* solve: the cost, future cost, marginal
+        operation cost and water values are averaged over the scenarios
+        (equiprobable), so :func:`make_benders_cut` yields the expected cut.
+    """
+    outcomes: List[StageResult] = []
+    for scenario in range(len(_SDDP_SCENARIOS[stage])):
+        hydros, storage = _stage_sections(stage=stage,
+                                          f_volume=f_volume,
+                                          f_energy=f_energy,
+                                          scenario=scenario)
+        outcomes.append(solve_stage_pddd(yaml_data=_SDDP_CASE,
+                                         stage_hydros=hydros,
+                                         stage_storage=storage,
+                                         cuts=cuts,
+                                         stage=stage,
+                                         stage_models=_SDDP_STAGE_MODELS))
+
+    return StageResult(stage=stage,
+                       total_cost=float(np.mean([r.total_cost for r in outcomes])),
+                       alpha=float(np.mean([r.alpha for r in outcomes])),
+                       cmo=np.mean([r.cmo for r in outcomes], axis=0),
+                       hydro_units=outcomes[0].hydro_units,
+                       Vini=outcomes[0].Vini,
+                       cma=np.mean([r.cma for r in outcomes], axis=0),
+                       storage_units=outcomes[0].storage_units,
+                       Eini=outcomes[0].Eini,
+                       cme=np.mean([r.cme for r in outcomes], axis=0))
+
+
+def solve_sddp(path: str,
+               max_iter: int = 500,
+               tol: float = 0.01,
+               verbose: bool = True,
+               forward_paths: Optional[int] = None,
+               seed: Optional[int] = None,
+               persistent: Optional[bool] = None,
+               workers: Optional[int] = None,
+               cut_selection: Optional[str] = None,
+               warm_start: Optional[str] = None,
+               save_cuts: Optional[str] = None) -> Tuple[PDDDResults, Dict, Dict, Dict]:
+    """
+    Solves the multi-stage hydrothermal dispatch problem with inflow
+    uncertainty using Stochastic Dual Dynamic Programming (SDDP).
+
+    Parameters
+    ----------
+    path : str
+        Path to the YAML file containing the problem configuration.
+
+    max_iter : int, optional
+        Maximum number of forward-backward iterations (default is 500).
+
+    tol : float, optional
+        Minimum convergence tolerance between ZSUP and ZINF (default is
+        1e-2). The run stops when ``|ZSUP - ZINF|`` is within the larger of
+        ``tol`` and the half-width of the ZSUP confidence interval.
+
+    verbose : bool, optional
+        Whether to print iteration logs and convergence progress.
+
+    forward_paths : int, optional
+        Number ``K`` of trajectories sampled per iteration. When ``None``,
+        ``meta.PDDD_Options.forward_paths`` or 10 is used.
+
+    seed : int, optional
+        Seed of the trajectory sampling. When ``None``,
+        ``meta.PDDD_Options.seed`` is used (unseeded if absent).
+
+    persistent : bool, optional
+        Keep one model per stage alive in every process (see
+        :func:`NaivePyDECOMP.SolverPDDD.make_persistent_solver`). When
+        ``None``, ``meta.PDDD_Options.persistent`` is used.
+
+    workers : int, optional
+        Number of worker processes for the forward trajectories and the
+        backward trial states. ``1`` runs everything in the calling
+        process. When ``None``, ``meta.PDDD_Options.workers`` or the number
+        of CPUs is used.
+
+    cut_selection : str, optional
+        Cuts loaded into the stage models (``all``, ``level1`` or
+        ``last_k``, see :class:`~NaivePyDECOMP.PDDDCutPool.CutPool`). When
+        ``None``, ``meta.PDDD_Options.cut_selection`` or ``all`` is used.
+
+    warm_start : str, optional
+        ``.npz`` cut file loaded as the initial future cost approximation.
+        When ``None``, ``meta.PDDD_Options.warm_start`` is used.
+
+    save_cuts : str, optional
+        ``.npz`` file receiving the cut pool at the end of the run. When
+        ``None``, ``meta.PDDD_Options.save_cuts`` is used.
+
+    Returns
+    -------
+    model : PDDDResults
+        Results of the policy simulated along the ``afluencia`` series of
+        the case (see :func:`~NaivePyDECOMP.PDDDResults.build_pddd_results`).
+
+    case : dict
+        The parsed YAML case dictionary.
+
+    alpha_values : dict
+        Sum of the trial volumes of every first stage cut (``T``) and the
+        value of those cuts at the simulated first stage volumes
+        (``FCF_{1}``).
+
+    z_limits : dict
+        Per iteration ZINF, ZSUP and the bounds of the ZSUP confidence
+        interval (``ZSUP_CI_low``, ``ZSUP_CI_high``).
+
+    Raises
+    ------
+    RuntimeError
+        If the specified solver is not available or any stage optimization fails.
+
+    ValueError
+        If no hydro or thermal data is provided, the scenarios are invalid
+        or ``meta.PDDD_Options.stage_length`` is not 1 (the inflow scenarios
+        are sampled per stage, so every stage must be a single period).
+    """
+    # === Caso único: lido e validado uma só vez ===
+    # the welcome message, the stage builders and the result merger all
+    # share this case, which is never modified in place
+    case = build_pddd_data_from_file(path)
+    print_welcome_message(None, case)
+    nstages = case['meta'].get('horizon', 1)
+
+    if 'hydro' not in case:
+        raise ValueError(
+            'Hydro Units must be set o perform DECOMP Like Dispatch')
+
+    if 'thermal' not in case:
+        raise ValueError(
+            'Thermal Units must be set o perform DECOMP Like Dispatch')
+
+    pddd_options = case['meta'].get('PDDD_Options', {})
+    if forward_paths is None:
+        forward_paths = int(pddd_options.get('forward_paths', 10))
+    if seed is None:
+        seed = pddd_options.get('seed')
+    if persistent is None:
+        persistent = bool(pddd_options.get('persistent', False))
+    if workers is None:
+        workers = int(pddd_options.get('workers', os.cpu_count() or 1))
+    if cut_selection is None:
+        cut_selection = pddd_options.get('cut_selection', 'all')
+    if warm_start is None:
+        warm_start = pddd_options.get('warm_start')
+    if save_cuts is None:
+        save_cuts = pddd_options.get('save_cuts')
+    if int(pddd_options.get('stage_length', 1)) != 1:
+        raise ValueError('SDDP requires single-period stages (stage_length = 1)')
+
+    scenarios = load_inflow_scenarios(case, path)
+    rng = np.random.default_rng(seed)
+
+    # the main process always solves the final simulation
+    init_sddp_worker(case, scenarios, persistent)
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=init_sddp_worker,
+                                       initargs=(case, scenarios, persistent))
+
+    def _map(function, *iterables) -> List[Any]:
+        if executor is not None:
+            return list(executor.map(function, *iterables))
+        return list(map(function, *iterables))
+
+    if verbose:
+        print(f"SDDP with {forward_paths} forward paths, "
+              f"{[len(s) for s in scenarios]} inflow scenarios per stage and "
+              f"{workers if executor is not None else 1} process(es)")
+
+    # === Inicializações ===
+    pool = CutPool(units=pddd_state_units(case),
+                   tol=float(pddd_options.get('cut_tol', 1e-6)),
+                   strategy=cut_selection,
+                   last_k=int(pddd_options.get('cut_last_k', 5)),
+                   fingerprint=case_fingerprint(case))
+    if warm_start:
+        warm_start_cut_pool(pool, warm_start, nstages, verbose)
+    ZINF: List[float] = []
+    ZSUP: List[float] = []
+    ZSUP_CI_low: List[float] = []
+    ZSUP_CI_high: List[float] = []
+
+    for iter_idx in range(max_iter):
+
+        if verbose:
+            print(f"\n--- Iteration {iter_idx + 1} ---")
+
+        pool.iteration = iter_idx
+        cuts = pool.select()
+
+        # === Lower bound: expected first stage cost ===
+        first_stage = solve_sddp_expected_stage(
+            f_volume=None,
+            f_energy=None,
+            cuts=cuts,
+            stage=0)
+        ZINF.append(first_stage.total_cost)
+
+        # === Forward Pass ===
+        paths = np.column_stack([rng.integers(0, len(scenarios[t]), size=forward_paths)
+                                 for t in range(nstages)])
+        trajectories = _map(simulate_sddp_path,
+                            paths.tolist(),
+                            [cuts] * forward_paths)
+
+        for records in trajectories:
+            for results in records:
+                pool.mark_active(results.stage, results.state)
+
+        costs = np.array([sum(r.total_cost - r.alpha for r in records)
+                          for records in trajectories])
+        half_width = 0.0
+        if forward_paths > 1:
+            half_width = CONFIDENCE_Z * float(costs.std(ddof=1)) / np.sqrt(forward_paths)
+        ZSUP.append(float(costs.mean()))
+        ZSUP_CI_low.append(ZSUP[-1] - half_width)
+        ZSUP_CI_high.append(ZSUP[-1] + half_width)
+
+        if verbose:
+            print(
+                f"ZINF[{iter_idx}] = {ZINF[-1]:.4f}, ZSUP[{iter_idx}] = {ZSUP[-1]:.4f} "
+                f"± {half_width:.4f} "
+                f"(95% CI [{ZSUP_CI_low[-1]:.4f}, {ZSUP_CI_high[-1]:.4f}])")
+
+        if abs(ZSUP[-1] - ZINF[-1]) <= max(tol, half_width):
+            break
+
+        # === Backward Pass ===
+        for t in reversed(range(1, nstages)):
+            cuts = pool.select()
+            expected = _map(solve_sddp_expected_stage,
+                            [records[t - 1].f_volume for records in trajectories],
+                            [records[t - 1].f_energy for records in trajectories],
+                            [cuts] * forward_paths,
+                            [t] * forward_paths)
+            for records, results in zip(trajectories, expected):
+                pool.add(make_benders_cut(results),
+                         trial=records[t - 1].f_state)
+
+        if verbose:
+            print(format_cut_pool_stats(pool))
+
+    if executor is not None:
+        executor.shutdown()
+
+    # policy simulation along the afluencia series of the case
+    memory = simulate_sddp_path(None, pool.select())
+
+    if save_cuts:
+        save_cut_pool(pool, save_cuts)
+
+    alpha_values = first_stage_alpha_values(pool, memory)
+
+    if verbose:
+        print("\n=== SDDP Finished ===")
+        print(f"Final ZINF = {ZINF[-1]:.4f}")
+        print(f"Final ZSUP = {ZSUP[-1]:.4f} "
+              f"(95% CI [{ZSUP_CI_low[-1]:.4f}, {ZSUP_CI_high[-1]:.4f}])")
+        print(f"Gap = {abs(ZSUP[-1] - ZINF[-1]):.4f} after {iter_idx + 1} iterations "
+              f"and {len(pool)} cuts")
+
+    z_limits = {'ZINF': ZINF,
+                'ZSUP': ZSUP,
+                'ZSUP_CI_low': ZSUP_CI_low,
+                'ZSUP_CI_high': ZSUP_CI_high}
+
+    model = build_pddd_results(memory, case)
+
+    dispatch_summary(model)
+    hydro_dispatch_summary(model)
+    thermal_dispatch_summary(model)
+    renewable_dispatch_summary(model)
+    storage_dispatch_summary(model)
+    connection_bar_dispatch_summary(model)
+    transmission_line_dispatch_summary(model)
+
+    return model, case, alpha_values, z_limits
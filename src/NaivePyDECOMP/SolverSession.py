@@ -0,0 +1,36 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: Solver Sessions
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Re-export of the shared solver session layer of NaivePyDESSEM (pooled
+solver handles, cached availability, normalized ``Solver_Options``,
+in-process solver interfaces and the ``io_mode`` of the solves). See :mod:`NaivePyDESSEM.SolverSession`.
+
+References
+----------
+[1] CEPEL, DESSEM. Manual de Metodologia, 2023
+[2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from NaivePyDESSEM.SolverSession import (
+    IN_PROCESS_SOLVERS,
+    AUTO_IN_PROCESS,
+    SOLVER_OPTION_NAMES,
+    IO_MODES,
+    SolverSession,
+    solver_family,
+    solver_accepts_qp,
+    solver_available,
+    normalize_solver_options,
+    get_solver_session,
+    clear_solver_sessions,
+    native_run_time
+)
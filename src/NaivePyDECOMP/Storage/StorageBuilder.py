@@ -37,7 +37,7 @@ References
 [2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
 """
 import copy
-from pyomo.environ import ConcreteModel, Objective, minimize
+from pyomo.environ import ConcreteModel, Objective, Param, UnitInterval, minimize
 from .StorageDataTypes import StorageData
 from .StorageObjective import set_objective_storage
 from .StorageVars import storage_add_sets_and_params, storage_add_variables
@@ -55,7 +55,8 @@ from typing import Dict
 
 def add_storage_subproblem(m: ConcreteModel,
                            data: StorageData,
-                           stage: int) -> ConcreteModel:
+                           stage: int,
+                           n_periods: int = 1) -> ConcreteModel:
     """
     Add storage dispatch problem structure to an existing model.
 
@@ -69,9 +70,11 @@ def add_storage_subproblem(m: ConcreteModel,
         Target model to be updated.
     data : StorageData
         Input container with horizon, units, and time-step duration.
-    include_objective : bool, optional
-        If ``True``, add the storage-only balance constraint and attach the
-        deficit objective (default is ``False``).
+    stage : int
+        First period (0-based) of the subproblem, informed for data copying.
+    n_periods : int, optional
+        Number of consecutive periods covered by the subproblem, starting
+        at period ``stage`` (default is 1).
 
     Returns
     -------
@@ -88,14 +91,26 @@ def add_storage_subproblem(m: ConcreteModel,
     - If ``include_objective=True``:
         * Add storage-only balance: Σ(dis − ch) + D = d
         * Attach deficit objective
+    - The binary charge/discharge mode is relaxed to [0, 1], keeping the
+      stage problem linear so that the duals of the energy balance exist.
     """
     # data copy
     subproblem_data = copy.deepcopy(data)
-    subproblem_data.horizon = 1
+    subproblem_data.horizon = n_periods
     # sets & params
     storage_add_sets_and_params(m, data)
+    # the initial energy is the stage state: keeping it mutable lets a
+    # persistent stage model be re-targeted without being rebuilt
+    eini = m.storage_Eini
+    del m.storage_Eini
+    m.storage_Eini = Param(m.SU, initialize=eini, mutable=True)
     # variables
     storage_add_variables(m)
+    # the stage problem must remain an LP so that the energy balance has a
+    # dual (the future value of the stored energy used by the Benders cuts):
+    # the charge/discharge mode is relaxed to [0, 1]
+    for index in m.storage_mode:
+        m.storage_mode[index].domain = UnitInterval
     # constraints
     add_storage_energy_balance_constraint(m)
     add_storage_soc_bounds_constraint(m)
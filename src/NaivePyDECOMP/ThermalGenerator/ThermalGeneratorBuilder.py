@@ -168,7 +168,8 @@ def add_thermal_problem(m: ConcreteModel,
 
 def add_thermal_subproblem(m: ConcreteModel,
                            data: ThermalData,
-                           stage: int) -> ConcreteModel:
+                           stage: int,
+                           n_periods: int = 1) -> ConcreteModel:
     """
     Assemble a thermal unit-commitment (UC) subproblem in Pyomo.
 
@@ -186,6 +187,9 @@ def add_thermal_subproblem(m: ConcreteModel,
         horizon length, demand, reserve requirements, and initial conditions.
     stage : int
         the stage subproblem, informed for data copying
+    n_periods : int, optional
+        Number of consecutive periods covered by the subproblem, starting
+        at period ``stage`` (default is 1).
 
     Returns
     -------
@@ -204,7 +208,7 @@ def add_thermal_subproblem(m: ConcreteModel,
     """
     # data copy
     subproblem_data = copy.deepcopy(data)
-    subproblem_data.horizon = 1
+    subproblem_data.horizon = n_periods
     thermal_add_sets_and_params(m, subproblem_data)
     thermal_add_variables_uc(m)
 
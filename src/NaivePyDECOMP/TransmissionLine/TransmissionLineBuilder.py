@@ -56,7 +56,8 @@ from .TransmissionLineConstraints import (add_transmission_line_flow_constraints
 
 def add_transmission_line_subproblem(m: ConcreteModel,
                                      data: TransmissionLineData,
-                                     stage: bool = False) -> ConcreteModel:
+                                     stage: bool = False,
+                                     n_periods: int = 1) -> ConcreteModel:
     """
     Attach the transmission-line subsystem to an existing Pyomo model.
 
@@ -83,6 +84,9 @@ def add_transmission_line_subproblem(m: ConcreteModel,
         endpoints, susceptance, and capacity.
     stage : int
         the stage subproblem, informed for data copying
+    n_periods : int, optional
+        Number of consecutive periods covered by the subproblem, starting
+        at period ``stage`` (default is 1).
 
     Returns
     -------
@@ -115,7 +119,7 @@ def add_transmission_line_subproblem(m: ConcreteModel,
     # data copy
     if not m.unique_bar:
         subproblem_data = copy.deepcopy(data)
-        subproblem_data.horizon = 1
+        subproblem_data.horizon = n_periods
         transmission_line_add_sets_and_params(m, subproblem_data)
         transmission_line_add_variables(m)
         add_transmission_line_flow_constraints(m)
@@ -32,6 +32,9 @@ pre_process(config_dict, transform_names=True)
 yaml_loader(file, transform_names=True)
     Load a YAML file and return a processed configuration dictionary suitable
     for model building.
+case_fingerprint(config_dict)
+    Stable SHA-256 digest of a configuration dictionary, used to tag files
+    derived from a case (cuts, checkpoints, caches).
 
 Notes
 -----
@@ -52,5 +55,6 @@ References
 [2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
 """
 from NaivePyDESSEM.YAMLLoader import (
-    yaml_loader
+    yaml_loader,
+    case_fingerprint
 )
@@ -61,6 +61,17 @@ Builder
     Constructs a complete Pyomo model from the YAML data, invoking the appropriate
     subsystems and assembling the balance constraint and cost-minimizing objective.
 
+MatrixBuilder
+    Compiles the monolithic model directly into a sparse constraint matrix and
+    solves it with HiGHS, without building Pyomo expressions.
+
+ModelCache
+    On-disk cache of the compiled matrix models, keyed by the case fingerprint
+    and the package version, with size and age eviction.
+
+SolverSession
+    Re-export of the shared solver session layer of NaivePyDESSEM.
+
 Solver
     Handles the selection and execution of solvers (e.g., GLPK, IPOPT, MindtPy),
     with optional reporting and solution validation.
@@ -107,4 +118,7 @@ from .ModelFormatters import *
 from .Reporting import *
 from .YAMLLoader import *
 from .Builder import *
+from .MatrixBuilder import *
+from .ModelCache import *
+from .SolverSession import *
 from .Solver import *
@@ -25,6 +25,7 @@ Features
 - Tabular export using *NaivePyDECOMP.DataFrames.build_dispatch_dataframe*
 - Interactive or scriptable invocation
 - Colorized console output via *colorama* for enhanced readability
+- Cached compiled models for the matrix backend (*NaivePyDECOMP.ModelCache*)
 
 Dependencies
 ------------
@@ -35,6 +36,7 @@ Dependencies
 - pyomo.environ
 - NaivePyDECOMP.Solver
 - NaivePyDECOMP.DataFrames
+- NaivePyDECOMP.ModelCache
 
 Usage
 -----
@@ -51,6 +53,7 @@ import argparse
 import os
 from colorama import Fore, Style, init as colorama_init
 from NaivePyDECOMP.Solver import solve
+from NaivePyDECOMP.ModelCache import ModelCache
 from NaivePyDECOMP.DataFrames import build_dispatch_dataframe
 import pandas as pd
 
@@ -124,6 +127,8 @@ def main():
     Examples
     --------
     $ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx
+    $ python cli.py case.yaml --out_dir results --out_file dispatch.csv --backend matrix
+    $ python cli.py case.yaml --out_dir results --out_file dispatch.csv --backend matrix --no_cache
     """
 
     colorama_init(autoreset=True)
@@ -137,12 +142,29 @@ def main():
                         help="Output directory for results")
     parser.add_argument("--out_file", required=True,
                         help="Output file name with extension (.csv, .xlsx, .parquet)")
+    parser.add_argument("--backend", choices=("pyomo", "matrix"), default=None,
+                        help="Model backend (default: meta.backend, else pyomo)")
+    parser.add_argument("--no_cache", action="store_true",
+                        help="Do not read or write the compiled model cache (matrix backend)")
+    parser.add_argument("--clear_cache", action="store_true",
+                        help="Remove every cached model before solving")
+    parser.add_argument("--cache_dir", default=None,
+                        help="Cache directory (default: $NAIVEPY_CACHE_DIR or ~/.cache/naivepy/models)")
+    parser.add_argument("--cache_max_mb", type=float, default=1024.0,
+                        help="Size limit of the cache in MB (default: 1024)")
+    parser.add_argument("--cache_max_days", type=float, default=30.0,
+                        help="Evict cached models unused for this many days (default: 30)")
     args = parser.parse_args()
 
     os.makedirs(args.out_dir, exist_ok=True)
     output_path = os.path.join(args.out_dir, args.out_file)
 
-    model, data = solve(args.yaml)
+    cache = ModelCache(args.cache_dir, args.cache_max_mb, args.cache_max_days)
+    if args.clear_cache:
+        removed = cache.clear()
+        print(f"{Fore.CYAN}Model cache cleared:{Style.RESET_ALL} {removed} entries")
+    model, data = solve(args.yaml, backend=args.backend,
+                        cache=None if args.no_cache else cache)
     df = build_dispatch_dataframe(model)
     df[abs(df) < 1e-3] = 0.0
     save_dataframe(df, output_path)
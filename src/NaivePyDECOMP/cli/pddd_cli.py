@@ -39,6 +39,17 @@ Dependencies
 Usage
 -----
 $ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --persistent
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --parallel_backward --workers 8
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --sddp --forward_paths 20 --seed 42
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --persistent --cut_selection level1
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --save_cuts cuts.npz
+$ python cli.py other_case.yaml --out_dir results --out_file dispatch.xlsx --warm_start cuts.npz
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --checkpoint_every 10
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --resume
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --trace trace.jsonl --chrome_trace trace.json
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --stage_length 24
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --hybrid_start
 
 References
 ----------
@@ -51,6 +62,8 @@ import argparse
 import os
 from colorama import Fore, Style, init as colorama_init
 from NaivePyDECOMP.SolverPDDD import solve_pddd
+from NaivePyDECOMP.SolverSDDP import solve_sddp
+from NaivePyDECOMP.PDDDCutPool import CUT_SELECTION_STRATEGIES
 from NaivePyDECOMP.DataFrames import build_dispatch_dataframe
 import pandas as pd
 
@@ -137,17 +150,93 @@ def main():
                         help="Output directory for results")
     parser.add_argument("--out_file", required=True,
                         help="Output file name with extension (.csv, .xlsx, .parquet)")
+    parser.add_argument("--persistent", action="store_true",
+                        help="Keep one model per stage and solve it with a persistent solver interface")
+    parser.add_argument("--parallel_backward", action="store_true",
+                        help="Solve the backward-pass stages concurrently in a process pool")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes of the parallel backward pass (or of SDDP)")
+    parser.add_argument("--sddp", action="store_true",
+                        help="Solve with stochastic inflow scenarios (SDDP) instead of PDDD")
+    parser.add_argument("--forward_paths", type=int, default=None,
+                        help="Number of SDDP forward trajectories sampled per iteration")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed of the SDDP trajectory sampling")
+    parser.add_argument("--cut_selection", choices=CUT_SELECTION_STRATEGIES, default=None,
+                        help="Cuts loaded into the stage models (default: all)")
+    parser.add_argument("--warm_start", default=None,
+                        help="Cut file (.npz) used as the initial future cost approximation")
+    parser.add_argument("--save_cuts", default=None,
+                        help="Save the cut pool to this file (.npz) at the end of the run")
+    parser.add_argument("--checkpoint", default=None,
+                        help="Checkpoint file (.npz) of the PDDD run "
+                             "(default: <out_dir>/<out_file root>_checkpoint.npz)")
+    parser.add_argument("--checkpoint_every", type=int, default=None,
+                        help="Write a checkpoint every N iterations")
+    parser.add_argument("--checkpoint_seconds", type=float, default=None,
+                        help="Write a checkpoint every M seconds")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the PDDD run from the latest checkpoint")
+    parser.add_argument("--trace", default=None,
+                        help="Write one performance record per stage solve and per iteration to this file (.jsonl)")
+    parser.add_argument("--chrome_trace", default=None,
+                        help="Write the timeline of the PDDD run to this Chrome trace file (.json)")
+    parser.add_argument("--stage_length", type=int, default=None,
+                        help="Number of consecutive periods covered by each PDDD stage")
+    parser.add_argument("--hybrid_start", action="store_true",
+                        help="Seed the PDDD cut pool with cuts from the monolithic LP relaxation")
     args = parser.parse_args()
 
+    if args.sddp and (args.resume or args.checkpoint or args.checkpoint_every
+                      or args.checkpoint_seconds):
+        parser.error("checkpoints are only available for PDDD runs")
+    if args.sddp and (args.trace or args.chrome_trace):
+        parser.error("performance traces are only available for PDDD runs")
+    if args.sddp and args.hybrid_start:
+        parser.error("the hybrid start is only available for PDDD runs")
+    if args.sddp and args.stage_length not in (None, 1):
+        parser.error("multi-period stages are only available for PDDD runs")
+    if args.stage_length is not None and args.stage_length < 1:
+        parser.error("--stage_length must be a positive integer")
+
     os.makedirs(args.out_dir, exist_ok=True)
     output_path = os.path.join(args.out_dir, args.out_file)
 
-    model, _, alpha_values, z_limits = solve_pddd(args.yaml)
+    root, ext = os.path.splitext(args.out_file)
+    checkpoint = args.checkpoint
+    if checkpoint is None and (args.resume or args.checkpoint_every
+                               or args.checkpoint_seconds):
+        checkpoint = os.path.join(args.out_dir, f"{root}_checkpoint.npz")
+
+    if args.sddp:
+        model, _, alpha_values, z_limits = solve_sddp(args.yaml,
+                                                      forward_paths=args.forward_paths,
+                                                      seed=args.seed,
+                                                      persistent=args.persistent or None,
+                                                      workers=args.workers,
+                                                      cut_selection=args.cut_selection,
+                                                      warm_start=args.warm_start,
+                                                      save_cuts=args.save_cuts)
+    else:
+        model, _, alpha_values, z_limits = solve_pddd(args.yaml,
+                                                      persistent=args.persistent or None,
+                                                      parallel_backward=args.parallel_backward or None,
+                                                      workers=args.workers,
+                                                      cut_selection=args.cut_selection,
+                                                      warm_start=args.warm_start,
+                                                      save_cuts=args.save_cuts,
+                                                      checkpoint=checkpoint,
+                                                      checkpoint_every=args.checkpoint_every,
+                                                      checkpoint_seconds=args.checkpoint_seconds,
+                                                      resume=args.resume,
+                                                      trace=args.trace,
+                                                      chrome_trace=args.chrome_trace,
+                                                      stage_length=args.stage_length,
+                                                      hybrid_start=args.hybrid_start or None)
     df = build_dispatch_dataframe(model)
     df[abs(df) < 1e-3] = 0.0
     save_dataframe(df, output_path)
 
-    root, ext = os.path.splitext(args.out_file)
     alpha_filename = f"{root}_alpha{ext}"
 
     alpha_output_path = os.path.join(args.out_dir, alpha_filename)
@@ -51,14 +51,19 @@ References
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pyomo.environ import ConcreteModel, Objective, Constraint, minimize
 
 from NaivePyDESSEM.HydraulicGenerator.HydraulicDataTypes import HydraulicData, HydraulicUnit
 from NaivePyDESSEM.HydraulicGenerator.HydraulicGeneratorBuilder import add_hydro_problem
 from NaivePyDESSEM.HydraulicGenerator.HydraulicEquations import add_hydraulic_cost_expression
 
-from NaivePyDESSEM.ThermalGenerator.ThermalDataTypes import ThermalData, ThermalUnit
+from NaivePyDESSEM.ThermalGenerator.ThermalDataTypes import (
+    THERMAL_COST_MODELS,
+    THERMAL_UC_FORMULATIONS,
+    ThermalData,
+    ThermalUnit
+)
 from NaivePyDESSEM.ThermalGenerator.ThermalGeneratorBuilder import add_thermal_problem
 from NaivePyDESSEM.ThermalGenerator.ThermalEquations import add_thermal_cost_expression
 
@@ -79,7 +84,13 @@ from NaivePyDESSEM.TransmissionLine.TransmissionLineDataTypes import Transmissio
 from NaivePyDESSEM.TransmissionLine.TransmissionLineBuilder import add_transmission_line_problem
 from NaivePyDESSEM.TransmissionLine.TransmissionLineEquations import add_transmission_line_cost_expression
 
+from .TerminalCost import (
+    add_terminal_future_cost,
+    add_terminal_cost_expression,
+    terminal_cuts_from_options
+)
 from .YAMLLoader import yaml_loader
+from .SolverSession import solver_family
 
 # ============================================================================
 # Validators (lightweight sanity checks)
@@ -168,7 +179,12 @@ def _validate_hydro(hydro: Dict[str, Any], T: int) -> None:
             raise ValueError(f"hydro.units[{name}] must satisfy Qmin <= Qmax.")
 
 
-def _validate_thermal(thermal: Dict[str, Any]) -> None:
+# solvers that treat the perspective cones p² <= z u as nonconvex (NLP
+# relaxations, outer-approximation cuts)
+PERSPECTIVE_UNSUPPORTED_SOLVERS = ("mindtpy", "ipopt", "cyipopt")
+
+
+def _validate_thermal(thermal: Dict[str, Any], solver: Optional[str] = None) -> None:
     """
     Validate thermal unit configuration for consistency.
 
@@ -179,14 +195,44 @@ def _validate_thermal(thermal: Dict[str, Any]) -> None:
     ----------
     thermal : dict
         Dictionary containing thermal units and parameters.
+    solver : str, optional
+        ``meta.Solver``, checked against ``thermal.perspective``.
 
     Raises
     ------
     ValueError
-        If Pmin > Pmax or if ramp-up/ramp-down limits are negative.
-
-    """
-
+        If Pmin > Pmax, if ramp-up/ramp-down limits are negative, if a
+        start-up/shut-down ramp is below Pmin, if the formulation or cost
+        model is unknown, if the tangent or perspective settings are
+        invalid (including a perspective cost with a solver of
+        ``PERSPECTIVE_UNSUPPORTED_SOLVERS``) or if a ``pwl`` cost curve is
+        malformed.
+
+    """
+
+    formulation = thermal.get("formulation", "classic")
+    if formulation not in THERMAL_UC_FORMULATIONS:
+        raise ValueError(
+            f"thermal.formulation must be one of {THERMAL_UC_FORMULATIONS}.")
+    cost_model = thermal.get("cost_model", "quadratic")
+    if cost_model not in THERMAL_COST_MODELS:
+        raise ValueError(
+            f"thermal.cost_model must be one of {THERMAL_COST_MODELS}.")
+    if thermal.get("tangents") is not None and int(thermal["tangents"]) < 1:
+        raise ValueError("thermal.tangents must be at least 1.")
+    if thermal.get("tangent_tol") is not None and float(thermal["tangent_tol"]) <= 0:
+        raise ValueError("thermal.tangent_tol must be positive.")
+    perspective = bool(thermal.get("perspective", False))
+    if perspective and cost_model != "quadratic":
+        raise ValueError(
+            "thermal.perspective requires thermal.cost_model: quadratic.")
+    if perspective and solver is not None \
+            and solver_family(solver) in PERSPECTIVE_UNSUPPORTED_SOLVERS:
+        raise ValueError(
+            f"thermal.perspective is not supported with Solver: {solver}: "
+            "the cones p² <= z u are bilinear, so its NLP subproblems and "
+            "outer-approximation cuts are not valid. Use a MIQCP solver "
+            "(gurobi, cplex, xpress, scip).")
     units = thermal.get("units", {})
     for name, u in units.items():
         if not (u["Pmin"] <= u["Pmax"]):
@@ -196,6 +242,55 @@ def _validate_thermal(thermal: Dict[str, Any]) -> None:
             if u[k] < 0:
                 raise ValueError(
                     f"thermal.units[{name}].{k} must be non-negative.")
+        for k in ("SU", "SD"):
+            if u.get(k) is not None and u[k] < u["Pmin"]:
+                raise ValueError(
+                    f"thermal.units[{name}].{k} must be at least Pmin.")
+        if cost_model == "tangent" and u.get("c", 0.0) < 0:
+            raise ValueError(
+                f"thermal.units[{name}].c must be non-negative with tangent costs.")
+        if perspective and u.get("c", 0.0) < 0:
+            raise ValueError(
+                f"thermal.units[{name}].c must be non-negative with perspective costs.")
+        if cost_model == "pwl":
+            _validate_pwl_curve(name, u)
+
+
+def _validate_pwl_curve(name: str, u: Dict[str, Any]) -> None:
+    """
+    Validate the piecewise-linear cost curve of a thermal unit.
+
+    Parameters
+    ----------
+    name : str
+        Unit identifier.
+    u : dict
+        Unit data with ``pw_breaks`` and ``pw_costs``.
+
+    Raises
+    ------
+    ValueError
+        If the curve is missing, has mismatched or too few points, has
+        breakpoints that are not strictly increasing or that do not cover
+        ``[Pmin, Pmax]``, has negative costs or has a nonzero cost at zero
+        output.
+    """
+    xs, ys = u.get("pw_breaks"), u.get("pw_costs")
+    if xs is None or ys is None or len(xs) != len(ys) or len(xs) < 2:
+        raise ValueError(
+            f"thermal.units[{name}] needs pw_breaks and pw_costs of the same "
+            "length (at least 2 points) with pwl costs.")
+    if any(x1 <= x0 for x0, x1 in zip(xs, xs[1:])):
+        raise ValueError(
+            f"thermal.units[{name}].pw_breaks must be strictly increasing.")
+    if xs[0] < 0 or xs[0] > u["Pmin"] or xs[-1] < u["Pmax"]:
+        raise ValueError(
+            f"thermal.units[{name}].pw_breaks must cover [Pmin, Pmax] "
+            "and be non-negative.")
+    if min(ys) < 0 or (xs[0] == 0 and ys[0] != 0):
+        raise ValueError(
+            f"thermal.units[{name}].pw_costs must be non-negative and zero "
+            "at zero output (use a for the no-load cost).")
 
 
 def _validate_renewable(renewable: Dict[str, Any], T: int) -> None:
@@ -402,7 +497,9 @@ def _mk_thermal_data(root: Dict[str, Any]) -> ThermalData:
             pw_breaks=u.get("pw_breaks", None),
             pw_costs=u.get("pw_costs", None),
             gamma=float(u.get("gamma", 0.0)),
-            init_status_h=float(u.get("init_status_h", 0.0))
+            init_status_h=float(u.get("init_status_h", 0.0)),
+            SU=None if u.get("SU") is None else float(u["SU"]),
+            SD=None if u.get("SD") is None else float(u["SD"])
         )
 
     Rreq = None
@@ -414,7 +511,13 @@ def _mk_thermal_data(root: Dict[str, Any]) -> ThermalData:
         horizon=H,
         units=units,
         Rreq=Rreq,
-        has_history=meta.get("has_history", False)
+        has_history=meta.get("has_history", False),
+        formulation=str(thermal.get("formulation", "classic")),
+        cost_model=str(thermal.get("cost_model", "quadratic")),
+        tangents=None if thermal.get("tangents") is None else int(thermal["tangents"]),
+        tangent_tol=None if thermal.get("tangent_tol") is None else float(thermal["tangent_tol"]),
+        perspective=bool(thermal.get("perspective", False)),
+        symmetry_breaking=bool(thermal.get("symmetry_breaking", False))
     )
 
 
@@ -611,6 +714,7 @@ def build_balance_and_objective_from_yaml(model: ConcreteModel, yaml_data: Dict[
         add_connection_bar_cost_expression(model, cost_terms)
     if 'lines' in yaml_data:
         add_transmission_line_cost_expression(model, cost_terms)
+    add_terminal_cost_expression(model, cost_terms)
 
     # a fonte déficit
 
@@ -622,7 +726,9 @@ def build_balance_and_objective_from_yaml(model: ConcreteModel, yaml_data: Dict[
     return model
 
 
-def build_model_from_file(path: str) -> Tuple[ConcreteModel, Dict]:
+def build_model_from_file(path: str,
+                          terminal_fcf: Optional[Union[str, Dict[str, Any]]] = None
+                          ) -> Tuple[ConcreteModel, Dict]:
     """
     Load master data from YAML/JSON and build subsystem models.
 
@@ -631,6 +737,11 @@ def build_model_from_file(path: str) -> Tuple[ConcreteModel, Dict]:
     path : str
         Path to a YAML file with sections: meta, demand, and one or
         more of {hydro, thermal, renewable, storage, bars, lines}.
+    terminal_fcf : str or dict, optional
+        Cut file (or ``{'file': ..., 'stage': ...}``) used as the terminal
+        future cost function of the horizon (see
+        :mod:`~NaivePyDESSEM.TerminalCost`). When ``None``,
+        ``meta.terminal_fcf`` is used, if present.
 
     Returns
     -------
@@ -692,7 +803,7 @@ def build_model_from_file(path: str) -> Tuple[ConcreteModel, Dict]:
         has_valid_units = True
 
     if "thermal" in root and root["thermal"] is not None:
-        _validate_thermal(root["thermal"])
+        _validate_thermal(root["thermal"], root["meta"].get("Solver"))
         thermal_data = _mk_thermal_data(root)
         m = add_thermal_problem(m=m,
                                 data=thermal_data,
@@ -720,6 +831,12 @@ def build_model_from_file(path: str) -> Tuple[ConcreteModel, Dict]:
     if not has_valid_units:
         raise ValueError("No buildable sections found. Provide at least one of "
                          "{hydro, thermal, renewable, storage, bars, lines}.")
+
+    if terminal_fcf is None:
+        terminal_fcf = root["meta"].get("terminal_fcf")
+    if terminal_fcf:
+        m = add_terminal_future_cost(m, terminal_cuts_from_options(terminal_fcf))
+
     m = build_balance_and_objective_from_yaml(m, root)
 
     return m, root
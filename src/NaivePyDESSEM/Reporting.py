@@ -30,6 +30,7 @@ from typing import Any, Tuple, Dict
 from colorama import Fore, Style
 from .Formatters import format_brl
 from .ModelCheck import *
+from .ThermalGenerator.ThermalOuterApproximation import thermal_tangent_error
 
 
 def __compute_total_generation(model: ConcreteModel) -> float:
@@ -176,7 +177,9 @@ def hydro_dispatch_summary(model: ConcreteModel) -> None:
 
 def thermal_dispatch_summary(model: ConcreteModel) -> None:
     """
-    Print unit-level thermal generation summary in MWh.
+    Print unit-level thermal generation summary in MWh, the groups of
+    identical units when symmetry breaking is enabled and, for the
+    tangent cost model, the cost approximation error.
 
     Parameters
     ----------
@@ -189,6 +192,14 @@ def thermal_dispatch_summary(model: ConcreteModel) -> None:
             dispatch = sum(value(model.thermal_p[g, t]) for t in model.T)
             print(
                 f"  {Fore.BLUE}{g}{Style.RESET_ALL}: {Fore.RED}{dispatch:.2f} MWh")
+        for names in getattr(model, 'thermal_identical_groups', []):
+            print(f"  {Fore.CYAN}Identical Units{Style.RESET_ALL}: {Fore.RED}"
+                  f"{', '.join(str(g) for g in names)}")
+        if hasattr(model, 'thermal_tangent_constraint'):
+            error = thermal_tangent_error(model)
+            print(f"  {Fore.CYAN}Tangent Cost Error{Style.RESET_ALL}: {Fore.RED}"
+                  f"max $ {format_brl(error['max'])}/h, total $ {format_brl(error['total'])} "
+                  f"(bound $ {format_brl(error['bound'])}/h)")
 
 
 def renewable_dispatch_summary(model: ConcreteModel) -> None:
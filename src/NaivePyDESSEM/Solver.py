@@ -20,6 +20,7 @@ Features:
 - Solver selection and configuration via YAML metadata.
 - Support for MINLP solvers such as MindtPy with strategy and time limits.
 - Termination condition validation to ensure feasibility or optimality.
+- In-memory, tmpfs or file solver I/O (``Solver_Options.io_mode``), with the I/O time of the solve.
 
 References
 ----------
@@ -28,19 +29,21 @@ References
 """
 
 
-from pyomo.opt import SolverFactory, TerminationCondition
+from pyomo.opt import TerminationCondition
 from pyomo.common.errors import ApplicationError
 from pyomo.environ import ConcreteModel, value
-from typing import Any, Tuple, Dict
+from typing import Any, Tuple, Dict, Optional, Union
 from colorama import Fore, Style, init as colorama_init
 from .Builder import build_model_from_file
+from .SolverSession import get_solver_session
 from .Reporting import *
 from .ModelCheck import *
 from .ModelFormatters import *
 
 colorama_init(autoreset=True)
 
-def solve(path: str) -> Tuple[ConcreteModel, Dict]:
+def solve(path: str,
+          terminal_fcf: Optional[Union[str, Dict[str, Any]]] = None) -> Tuple[ConcreteModel, Dict]:
     """
     Build and solve a Pyomo optimization model from a configuration file.
 
@@ -53,6 +56,9 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     ----------
     path : str
         Path to the configuration file containing model metadata and data sections.
+    terminal_fcf : str or dict, optional
+        Cut file used as the terminal future cost function (see
+        :func:`~NaivePyDESSEM.Builder.build_model_from_file`).
 
     Returns
     -------
@@ -68,32 +74,15 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
         If the solver is not available, solve fails, or model is infeasible.
     """
 
-    model, case = build_model_from_file(path)
+    model, case = build_model_from_file(path, terminal_fcf=terminal_fcf)
     solver_str = case['meta']['Solver']
     options = case['meta'].get('Solver_Options', {})
     print_welcome_message(model, case)
-    # Create solver instance
-    opt = SolverFactory(solver_str)
-
-    if not opt.available():
-        raise RuntimeError(
-            f"Solver '{solver_str}' is not available on this system.")
+    # pooled solver handle (see SolverSession)
+    session = get_solver_session(solver_str, options)
 
     try:
-        if solver_str.lower() == 'mindtpy':
-            res = opt.solve(
-                model,
-                mip_solver=options.get('mip_solver', 'glpk'),
-                nlp_solver=options.get('nlp_solver', 'cyipopt'),
-                strategy=options.get('strategy', 'OA'),
-                tee=False
-            )
-        else:
-            res = opt.solve(model, tee=False)
-
-        # Optional: print/write results if available
-        # if hasattr(res, 'write'):
-        #    res.write()
+        res = session.solve(model)
 
         # Check termination condition
         term_cond = res.solver.termination_condition
@@ -104,6 +93,8 @@ def solve(path: str) -> Tuple[ConcreteModel, Dict]:
     except ApplicationError as e:
         raise RuntimeError(f"Solver execution failed: {e}")
 
+    print(f"  Solver I/O:   {Fore.GREEN}{session.io_summary()}")
+
     dispatch_summary(model)
     hydro_dispatch_summary(model)
     thermal_dispatch_summary(model)
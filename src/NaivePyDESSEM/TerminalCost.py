@@ -0,0 +1,234 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Module: Terminal Future Cost Function
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Couples a short-term (DESSEM-like) model to a medium-term policy through a
+terminal future cost function (FCF) given by Benders cuts, such as the cut
+files written by the PDDD solver of NaivePyDECOMP (``--save_cuts``).
+
+Each cut ``k`` of the chosen stage becomes a constraint over the state at
+the last period ``T`` of the horizon::
+
+    fcf_alpha >= rhs[k] + sum(coefs[k, u] * x[u])
+
+where ``x[u]`` is ``hydro_V[u, T]`` for hydro units and ``storage_E[u, T]``
+for storage units, and ``fcf_alpha`` is added to the objective. The water
+values at the end of the horizon then come from the medium-term policy, so
+a short horizon (e.g. one day) needs no terminal volume target.
+
+The cut file is read with NumPy only: it holds the arrays ``units`` (state
+columns), ``stage``, ``rhs`` and ``coefs`` of every cut.
+
+Usage
+-----
+In the ``meta`` section of the case::
+
+    meta:
+      terminal_fcf:
+        file: results/cuts.npz
+        stage: 0          # PDDD stage whose end matches the end of the horizon
+
+or ``terminal_fcf: results/cuts.npz`` (stage 0).
+
+Classes
+-------
+TerminalCuts
+    Cuts of one stage of a cut file.
+
+Functions
+---------
+load_terminal_cuts(path, stage)
+    Read the cuts of one stage from a ``.npz`` cut file.
+terminal_cuts_from_options(options)
+    Read the cuts named by ``meta.terminal_fcf``.
+add_terminal_future_cost(m, cuts)
+    Add ``fcf_alpha`` and the cut constraints to a model.
+add_terminal_cost_expression(m, cost_array)
+    Append ``fcf_alpha`` to the objective terms.
+
+Notes
+-----
+- Every state unit of the cut file must exist in the model with the same
+  name; units of the model absent from the file get no coefficient.
+- The cuts must be expressed in the units of the model (hm³, MWh and the
+  currency of the objective).
+- With a terminal FCF the terminal volume targets (``Vmeta``) are
+  redundant and their constraints are deactivated.
+
+References
+----------
+[1] CEPEL, DESSEM. Manual de Metodologia, 2023
+[2] CEPEL, DECOMP. Manual de Metodologia, 2023
+[3] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    RangeSet,
+    Var
+)
+
+
+@dataclass
+class TerminalCuts:
+    """
+    Benders cuts of one stage of a cut file.
+
+    Parameters
+    ----------
+    units : Tuple[str, ...]
+        State units, in column order of ``coefs``.
+    rhs : np.ndarray
+        Intercept of every cut.
+    coefs : np.ndarray
+        Coefficients of every cut (cuts × units).
+    stage : int
+        Stage of the cuts in the cut file.
+    """
+    units: Tuple[str, ...]
+    rhs: np.ndarray
+    coefs: np.ndarray
+    stage: int = 0
+
+
+def load_terminal_cuts(path: str, stage: int = 0) -> TerminalCuts:
+    """
+    Read the cuts of one stage from a ``.npz`` cut file.
+
+    Parameters
+    ----------
+    path : str
+        Cut file (e.g. written by ``pydecomp-pddd-solve --save_cuts``).
+    stage : int, optional
+        Stage (0-based) whose cuts approximate the future cost at the end
+        of the horizon of the model. Default is 0.
+
+    Returns
+    -------
+    TerminalCuts
+
+    Raises
+    ------
+    ValueError
+        If the file has no cut for ``stage``.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        units = tuple(str(unit) for unit in data['units'])
+        mask = data['stage'] == stage
+        rhs = np.asarray(data['rhs'][mask], dtype=float)
+        coefs = np.asarray(data['coefs'][mask], dtype=float).reshape(len(rhs), len(units))
+    if len(rhs) == 0:
+        raise ValueError(f"Cut file '{path}' has no cut for stage {stage}.")
+    return TerminalCuts(units=units, rhs=rhs, coefs=coefs, stage=stage)
+
+
+def terminal_cuts_from_options(options: Union[str, Dict[str, Any]]) -> TerminalCuts:
+    """
+    Read the cuts named by ``meta.terminal_fcf``.
+
+    Parameters
+    ----------
+    options : str or dict
+        Cut file, or a dictionary with keys ``file`` and ``stage``.
+
+    Returns
+    -------
+    TerminalCuts
+    """
+    if isinstance(options, str):
+        return load_terminal_cuts(options)
+    if 'file' not in options:
+        raise ValueError("meta.terminal_fcf must be a cut file or define 'file'.")
+    return load_terminal_cuts(str(options['file']), int(options.get('stage', 0)))
+
+
+def _terminal_state(m: ConcreteModel, unit: str) -> Any:
+    """State variable of ``unit`` at the last period of the horizon."""
+    T = m.T.last()
+    if hasattr(m, 'HG') and unit in m.HG:
+        return m.hydro_V[unit, T]
+    if hasattr(m, 'SU') and unit in m.SU:
+        return m.storage_E[unit, T]
+    raise ValueError(f"Unit '{unit}' of the terminal cuts is not a hydro "
+                     "or storage unit of the model.")
+
+
+def add_terminal_future_cost(m: ConcreteModel, cuts: TerminalCuts) -> ConcreteModel:
+    """
+    Add the terminal future cost variable and its cut constraints.
+
+    Declares ``m.FCF`` (cut indices), ``m.fcf_alpha`` (future cost at the
+    end of the horizon) and ``m.fcf_cut_constraint[k]``, and deactivates
+    ``m.hydro_volume_meta_constraint`` when present.
+
+    Parameters
+    ----------
+    m : ConcreteModel
+        Model with the hydro and/or storage subproblems already built.
+    cuts : TerminalCuts
+        Cuts of the terminal stage (see :func:`load_terminal_cuts`).
+
+    Returns
+    -------
+    ConcreteModel
+        The same model with the terminal future cost.
+
+    Raises
+    ------
+    ValueError
+        If a unit of the cuts is not a state of the model.
+    """
+    state = {unit: _terminal_state(m, unit) for unit in cuts.units}
+
+    m.FCF = RangeSet(1, len(cuts.rhs))
+    m.fcf_alpha = Var(domain=NonNegativeReals)
+
+    def _cut_rule(m, k):
+        row = cuts.coefs[k - 1]
+        return m.fcf_alpha >= float(cuts.rhs[k - 1]) + \
+            sum(float(coef) * state[unit]
+                for unit, coef in zip(cuts.units, row) if coef != 0.0)
+
+    m.fcf_cut_constraint = Constraint(m.FCF, rule=_cut_rule)
+
+    if hasattr(m, 'hydro_volume_meta_constraint'):
+        m.hydro_volume_meta_constraint.deactivate()
+    return m
+
+
+def add_terminal_cost_expression(m: ConcreteModel,
+                                 cost_array: List[Any]) -> List[Any]:
+    """
+    Append the terminal future cost to the total cost expression list.
+
+    Parameters
+    ----------
+    m : ConcreteModel
+        Pyomo model, with or without a terminal future cost.
+    cost_array : list of expressions
+        List of symbolic expressions used in constructing the total system cost.
+
+    Returns
+    -------
+    list of expressions
+        The input list, extended with ``m.fcf_alpha`` when the model has a
+        terminal future cost.
+    """
+    if hasattr(m, 'fcf_alpha'):
+        cost_array.append(m.fcf_alpha)
+    return cost_array
@@ -50,6 +50,32 @@ Constraint Families
    - Up: \SUM_{t=t-Tu+1}^{t} thermal_y[g,t] <= thermal_u[g,t]
    - Down: \SUM_{t=t-Td+1}^{t} thermal_w[g,t] <= 1 - thermal_u[g,t]
 
+Tight formulation
+-----------------
+The *thermal_add_tight_** builders (``thermal.formulation: tight``) give a
+stronger LP relaxation with fewer rows and binaries:
+
+- Rajan–Takriti minimum up/down rows for every window length, so the
+  start-up/shut-down variables may be continuous and the
+  ``y + w <= 1`` rows are dropped;
+- the remaining minimum time of the initial state as variable bounds;
+- ramps scaled by the commitment (``RU u[g,t-1] + SU y[g,t]``), with
+  start-up/shut-down ramp limits (``SU``, ``SD``) also bounding the output
+  in the start and shut-down periods; redundant ramp rows are skipped;
+- per-unit parameters read once per builder, not in every rule call.
+
+Perspective cost
+----------------
+With ``thermal.perspective: true`` the quadratic cost ``c p²`` becomes
+``c z`` with the rotated second-order cone
+
+   - thermal_p[g,t]² <= thermal_z[g,t] * thermal_u[g,t]
+
+(*thermal_add_perspective_constraint*). For integer ``u`` it is the same
+cost, since ``p = 0`` when ``u = 0``; in the continuous relaxation a
+fractional ``u`` costs ``c p² / u`` instead of ``c p²``, the convex hull of
+the on/off cost, so the root bound is much tighter.
+
 Usage
 -----
 Combine these builders with:
@@ -143,6 +169,48 @@ def thermal_add_capacity_constraint(m, include_reserve: bool = False):
     return m
 
 
+
+def thermal_add_perspective_constraint(m):
+    """
+    Add the perspective cones of the quadratic cost of every unit.
+
+    Bounds the squared output variable by the perspective of ``p²``::
+
+        thermal_p[g,t]² <= thermal_z[g,t] * thermal_u[g,t]
+
+    so that ``c z`` replaces ``c p²`` in the objective. Units with linear
+    costs (``c = 0``) get no cone.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model containing thermal parameters and variables, including
+        ``m.thermal_z``.
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        The updated model with the constraint block
+        m.thermal_perspective_constraint.
+
+    Notes
+    -----
+    The rows are quadratic (rotated second-order cones): they need a solver
+    that recognizes them as convex, such as Gurobi, CPLEX, Xpress or SCIP.
+    Written as ``p² - z u <= 0`` they are nonconvex to NLP solvers, so the
+    builder rejects them with MindtPy (its OA cuts would not be valid) and
+    Ipopt/cyipopt. A MILP alternative with the same perspective cuts is
+    the tangent cost model, whose intercepts are scaled by ``u``.
+    """
+    quadratic = {g for g in m.TG if value(m.thermal_c[g]) > 0.0}
+
+    def _cone(m, g, t):
+        if g not in quadratic:
+            return Constraint.Skip
+        return m.thermal_p[g, t] ** 2 <= m.thermal_z[g, t] * m.thermal_u[g, t]
+    m.thermal_perspective_constraint = Constraint(m.TG, m.T, rule=_cone)
+    return m
+
 def thermal_add_reserve_constraint(m):
     """
     Add spinning reserve requirement constraints.
@@ -272,7 +340,25 @@ def thermal_add_ramps_constraint(m):
     return m
 
 
-from pyomo.environ import Constraint, value
+def thermal_uc_unit_times(m):
+    """
+    Minimum up/down times and initial status of every unit, read once.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model with thermal parameters
+
+    Returns
+    -------
+    dict
+        ``{g: (Tu, Td, init_status)}`` as integers.
+    """
+    return {g: (int(value(m.thermal_t_up[g])),
+                int(value(m.thermal_t_dn[g])),
+                int(value(m.thermal_init_status[g])))
+            for g in m.TG}
+
 
 def thermal_add_min_up_down_constraint(m):
     """
@@ -306,12 +392,13 @@ def thermal_add_min_up_down_constraint(m):
     --------
     >>> _ = thermal_add_min_up_down_constraint(m)
     """
+    times = thermal_uc_unit_times(m)
+
     def _min_up(m, g, t):
-        Tu = int(value(m.thermal_t_up[g]))
+        Tu, _, initial_status = times[g]
         if Tu <= 1:
             return Constraint.Skip
 
-        initial_status = int(value(m.thermal_init_status[g]))
         if initial_status > 0:
             if t <= Tu - initial_status:
                 return Constraint.Skip
@@ -320,11 +407,10 @@ def thermal_add_min_up_down_constraint(m):
         return sum(m.thermal_y[g, tau] for tau in range(start, t+1)) <= m.thermal_u[g, t]
 
     def _min_dn(m, g, t):
-        Td = int(value(m.thermal_t_dn[g]))
+        _, Td, initial_status = times[g]
         if Td <= 1:
             return Constraint.Skip
 
-        initial_status = int(value(m.thermal_init_status[g]))
         if initial_status < 0:
             if t <= Td + initial_status:
                 return Constraint.Skip
@@ -337,3 +423,212 @@ def thermal_add_min_up_down_constraint(m):
     m.thermal_min_dn_constraint = Constraint(m.TG, m.T, rule=_min_dn)
     return m
 
+
+
+def thermal_add_tight_capacity_constraint(m, include_reserve: bool = False):
+    """
+    Add capacity limits aware of the start-up and shut-down ramps (tight).
+
+    The lower bound is the classic one. The upper bound of a unit whose
+    start-up or shut-down ramp (``thermal_SU``, ``thermal_SD``) is below
+    ``Pmax`` also limits the output in the period it starts and in the
+    period before it shuts down:
+
+    - Tu >= 2: p[g,t] (+ r[g,t]) <= Pmax u[g,t] - (Pmax - SU) y[g,t]
+      - (Pmax - SD) w[g,t+1]
+    - Tu = 1: the two terms go to separate rows, since a unit may start and
+      shut down in consecutive periods.
+
+    Units with ``SU = SD = Pmax`` keep the classic upper bound.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model containing thermal parameters and variables
+    include_reserve : bool, optional
+        If True, the reserve counts in the upper bound. Default is False.
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        The updated model with constraint blocks
+        m.thermal_cap_lower_constraint, m.thermal_cap_upper_constraint
+        and m.thermal_cap_shutdown_constraint.
+    """
+    times = thermal_uc_unit_times(m)
+    T = m.T.last()
+    limits = {g: (value(m.thermal_Pmax[g]),
+                  value(m.thermal_SU[g]),
+                  value(m.thermal_SD[g]))
+              for g in m.TG}
+
+    def _output(m, g, t):
+        if include_reserve:
+            return m.thermal_p[g, t] + m.thermal_r[g, t]
+        return m.thermal_p[g, t]
+
+    def _shutdown_term(m, g, t):
+        Pmax, _, SD = limits[g]
+        if SD >= Pmax or t == T:
+            return 0
+        return (Pmax - SD) * m.thermal_w[g, t + 1]
+
+    def _lower(m, g, t):
+        return m.thermal_Pmin[g] * m.thermal_u[g, t] <= m.thermal_p[g, t]
+
+    def _upper(m, g, t):
+        Pmax, SU, _ = limits[g]
+        rhs = Pmax * m.thermal_u[g, t]
+        if SU < Pmax:
+            rhs = rhs - (Pmax - SU) * m.thermal_y[g, t]
+        if times[g][0] >= 2:
+            rhs = rhs - _shutdown_term(m, g, t)
+        return _output(m, g, t) <= rhs
+
+    def _shutdown(m, g, t):
+        Pmax, _, SD = limits[g]
+        if times[g][0] >= 2 or SD >= Pmax or t == T:
+            return Constraint.Skip
+        return _output(m, g, t) <= Pmax * m.thermal_u[g, t] - _shutdown_term(m, g, t)
+
+    m.thermal_cap_lower_constraint = Constraint(m.TG, m.T, rule=_lower)
+    m.thermal_cap_upper_constraint = Constraint(m.TG, m.T, rule=_upper)
+    m.thermal_cap_shutdown_constraint = Constraint(m.TG, m.T, rule=_shutdown)
+    return m
+
+
+def thermal_add_tight_logic_constraint(m):
+    """
+    Add the state transition of the tight formulation.
+
+    Only the transition rows of
+    :func:`thermal_add_startup_shutdown_logic_constraint` are kept:
+    ``y[g,t] + w[g,t] <= 1`` is implied by the minimum up/down rows of
+    :func:`thermal_add_tight_min_up_down_constraint`, which include
+    ``y[g,t] <= u[g,t]`` and ``w[g,t] <= 1 - u[g,t]``.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model with thermal parameters and variables
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        The updated model with constraint block m.thermal_logic_constraint.
+    """
+    def _logic(m, g, t):
+        if t == 1:
+            return (m.thermal_u[g, 1] - m.thermal_u0[g]
+                    == m.thermal_y[g, 1] - m.thermal_w[g, 1])
+        return (m.thermal_u[g, t] - m.thermal_u[g, t-1]
+                == m.thermal_y[g, t] - m.thermal_w[g, t])
+    m.thermal_logic_constraint = Constraint(m.TG, m.T, rule=_logic)
+    return m
+
+
+def thermal_add_tight_ramps_constraint(m):
+    """
+    Add start-up/shut-down aware ramp constraints (tight).
+
+    - Up: p[g,t] - p[g,t-1] <= RU u[g,t-1] + SU y[g,t]
+    - Down: p[g,t-1] - p[g,t] <= RD u[g,t] + SD w[g,t]
+
+    The ramp allowance only applies while the unit stays on, instead of
+    the constant ``RU`` (``RD``) of the classic rows. Rows that cannot
+    bind (``RU >= Pmax - Pmin`` and ``SU >= Pmax``, likewise for the
+    down ramp) are not generated. As in the classic rows, t=1 is skipped.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model with thermal parameters and variables
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        The updated model with constraint blocks
+        m.thermal_ramp_up_constraint and m.thermal_ramp_dn_constraint.
+    """
+    ramps = {}
+    for g in m.TG:
+        Pmin, Pmax = value(m.thermal_Pmin[g]), value(m.thermal_Pmax[g])
+        RU, RD = value(m.thermal_RU[g]), value(m.thermal_RD[g])
+        SU, SD = value(m.thermal_SU[g]), value(m.thermal_SD[g])
+        ramps[g] = (RU, min(SU, Pmax), RU >= Pmax - Pmin and SU >= Pmax,
+                    RD, min(SD, Pmax), RD >= Pmax - Pmin and SD >= Pmax)
+
+    def _up(m, g, t):
+        RU, SU, redundant = ramps[g][:3]
+        if t == 1 or redundant:
+            return Constraint.Skip
+        return (m.thermal_p[g, t] - m.thermal_p[g, t-1]
+                <= RU * m.thermal_u[g, t-1] + SU * m.thermal_y[g, t])
+
+    def _down(m, g, t):
+        RD, SD, redundant = ramps[g][3:]
+        if t == 1 or redundant:
+            return Constraint.Skip
+        return (m.thermal_p[g, t-1] - m.thermal_p[g, t]
+                <= RD * m.thermal_u[g, t] + SD * m.thermal_w[g, t])
+
+    m.thermal_ramp_up_constraint = Constraint(m.TG, m.T, rule=_up)
+    m.thermal_ramp_dn_constraint = Constraint(m.TG, m.T, rule=_down)
+    return m
+
+
+def thermal_add_tight_min_up_down_constraint(m):
+    """
+    Add Rajan–Takriti minimum up/down constraints (tight).
+
+    For every unit and period (windows clipped to the horizon):
+
+    - Up: sum_{tau=t-Tu+1}^{t} y[g,tau] <= u[g,t]
+    - Down: sum_{tau=t-Td+1}^{t} w[g,tau] <= 1 - u[g,t]
+
+    Windows of one period are kept (``y <= u``, ``w <= 1 - u``): with them
+    the start-up and shut-down variables are integral whenever ``u`` is,
+    so they can be continuous. The remaining minimum time of the initial
+    state is enforced through variable bounds: a unit ON for
+    ``init_status`` periods stays ON while ``t <= Tu - init_status``, and
+    an OFF unit stays OFF while ``t <= Td + init_status``.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model with thermal parameters and variables
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        Model with added constraint blocks:
+        - m.thermal_min_up_constraint
+        - m.thermal_min_dn_constraint
+
+    References
+    ----------
+    Rajan, D.; Takriti, S. Minimum up/down polytopes of the unit commitment
+    problem with start-up costs. IBM Research Report RC23628, 2005.
+    """
+    times = thermal_uc_unit_times(m)
+
+    for g in m.TG:
+        Tu, Td, initial_status = times[g]
+        if value(m.thermal_u0[g]) >= 0.5 and initial_status > 0:
+            for t in range(1, min(Tu - initial_status, m.T.last()) + 1):
+                m.thermal_u[g, t].setlb(1)
+        elif value(m.thermal_u0[g]) < 0.5 and initial_status < 0:
+            for t in range(1, min(Td + initial_status, m.T.last()) + 1):
+                m.thermal_u[g, t].setub(0)
+
+    def _min_up(m, g, t):
+        start = max(1, t - max(times[g][0], 1) + 1)
+        return sum(m.thermal_y[g, tau] for tau in range(start, t+1)) <= m.thermal_u[g, t]
+
+    def _min_dn(m, g, t):
+        start = max(1, t - max(times[g][1], 1) + 1)
+        return sum(m.thermal_w[g, tau] for tau in range(start, t+1)) <= 1 - m.thermal_u[g, t]
+
+    m.thermal_min_up_constraint = Constraint(m.TG, m.T, rule=_min_up)
+    m.thermal_min_dn_constraint = Constraint(m.TG, m.T, rule=_min_dn)
+    return m
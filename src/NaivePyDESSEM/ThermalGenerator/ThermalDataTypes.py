@@ -77,6 +77,12 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
+# unit-commitment formulations accepted in ``thermal.formulation``
+THERMAL_UC_FORMULATIONS = ("classic", "tight")
+
+# variable cost models accepted in ``thermal.cost_model``
+THERMAL_COST_MODELS = ("quadratic", "tangent", "pwl")
+
 
 @dataclass
 class ThermalUnit:
@@ -122,6 +128,13 @@ class ThermalUnit:
     gamma : float, optional
         Emission factor or auxiliary cost coefficient (unit-dependent),
         default is 0.0.
+    SU : float, optional
+        Start-up ramp limit: maximum output in the period the unit starts
+        (MW). Used by the ``tight`` formulation; ``None`` means ``Pmax``.
+    SD : float, optional
+        Shut-down ramp limit: maximum output in the period before the unit
+        shuts down (MW). Used by the ``tight`` formulation; ``None`` means
+        ``Pmax``.
 
     Notes
     -----
@@ -148,6 +161,8 @@ class ThermalUnit:
     pw_breaks: Optional[List[float]] = None
     pw_costs: Optional[List[float]] = None
     gamma: float = 0.0
+    SU: Optional[float] = None
+    SD: Optional[float] = None
 
 
 @dataclass
@@ -166,12 +181,44 @@ class ThermalData:
         Defaults to ``None``.
     has_history: bool, optional
         Consider previous states or not. Default is false
+    formulation : str, optional
+        Unit-commitment formulation (see ``THERMAL_UC_FORMULATIONS``):
+        ``"classic"`` (default) or ``"tight"``.
+    cost_model : str, optional
+        Variable cost model (see ``THERMAL_COST_MODELS``): ``"quadratic"``
+        (default, MIQP), ``"tangent"`` (outer approximation, MILP) or
+        ``"pwl"`` (the ``pw_breaks``/``pw_costs`` curve of each unit).
+    tangents : int, optional
+        Tangents per unit of the ``"tangent"`` model.
+    tangent_tol : float, optional
+        Maximum cost error ($/h) of the ``"tangent"`` model; when given,
+        the number of tangents of each unit is chosen from it.
+    perspective : bool, optional
+        Perspective reformulation of the ``"quadratic"`` cost (default
+        False): ``c p²`` becomes ``c z`` with ``p² <= z u``. Same optimum,
+        tighter continuous relaxation; needs a MIQCP solver that recognizes
+        rotated cones (Gurobi, CPLEX, Xpress, SCIP). Not valid with
+        MindtPy or Ipopt, which see the bilinear ``z u`` as nonconvex.
+    symmetry_breaking : bool, optional
+        Order identical units without minimum up/down times or binding
+        ramps period by period (default False), see ``ThermalSymmetry``.
     Notes
     -----
     - This class serves as a structured input for Pyomo-based UC models.
     - ``Rreq`` is optional; if not provided, reserve constraints must be disabled.
+    - ``formulation="tight"`` selects the constraint builders of
+      ``ThermalConstraints`` marked *tight*; with the default ``SU``/``SD``
+      both formulations have the same integer solutions, except that the
+      tight one also enforces the remaining minimum up/down time of the
+      initial state (``init_status_h``).
     """
     horizon: int
     units: Dict[str, ThermalUnit]
     Rreq: Optional[Dict[int, float]] = None
-    has_history: bool = False 
+    has_history: bool = False
+    formulation: str = "classic"
+    cost_model: str = "quadratic"
+    tangents: Optional[int] = None
+    tangent_tol: Optional[float] = None
+    perspective: bool = False
+    symmetry_breaking: bool = False 
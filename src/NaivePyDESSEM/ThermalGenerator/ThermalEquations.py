@@ -77,18 +77,40 @@ def add_thermal_cost_expression(
     -------
     list of expressions
         The updated list including thermal cost terms if available.
+
+    Notes
+    -----
+    When the model has a variable cost ``m.thermal_Cvar`` (tangent or
+    piecewise-linear cost model), it replaces ``c p² + b p``. With the
+    perspective reformulation (``m.thermal_z``), ``c z`` replaces ``c p²``.
     """
     required = [
         'TG', 'T', 'thermal_c', 'thermal_b', 'thermal_a',
         'thermal_p', 'thermal_u', 'thermal_y', 'thermal_SC'
     ]
     if all(hasattr(m, attr) for attr in required):
-        quad = sum(
-            m.thermal_c[g] * m.thermal_p[g, t]**2 +
-            m.thermal_b[g] * m.thermal_p[g, t] +
-            m.thermal_a[g] * m.thermal_u[g, t]
-            for g in m.TG for t in m.T
-        )
+        if hasattr(m, 'thermal_Cvar'):
+            # linearized variable cost (tangent or PWL)
+            quad = sum(
+                m.thermal_Cvar[g, t] +
+                m.thermal_a[g] * m.thermal_u[g, t]
+                for g in m.TG for t in m.T
+            )
+        elif hasattr(m, 'thermal_z'):
+            # perspective of the quadratic cost (z >= p²/u)
+            quad = sum(
+                m.thermal_c[g] * m.thermal_z[g, t] +
+                m.thermal_b[g] * m.thermal_p[g, t] +
+                m.thermal_a[g] * m.thermal_u[g, t]
+                for g in m.TG for t in m.T
+            )
+        else:
+            quad = sum(
+                m.thermal_c[g] * m.thermal_p[g, t]**2 +
+                m.thermal_b[g] * m.thermal_p[g, t] +
+                m.thermal_a[g] * m.thermal_u[g, t]
+                for g in m.TG for t in m.T
+            )
         starts = sum(
             m.thermal_SC[g] * m.thermal_y[g, t]
             for g in m.TG for t in m.T
@@ -18,6 +18,11 @@ It orchestrates the composition of Pyomo model objects by combining:
 - Constraint families (*thermal_constraints*)
 - Objective functions (*thermal_objectives*)
 - Optional features:
+    * Classic or tight unit-commitment formulation (``data.formulation``)
+    * Quadratic, tangent (outer approximation) or piecewise-linear variable
+      cost (``data.cost_model``), with an optional perspective
+      reformulation of the quadratic one (``data.perspective``)
+    * Symmetry breaking among identical units (``data.symmetry_breaking``)
     * Reserve provision and requirement constraints
     * Emissions/fuel caps
     * Piecewise-linear (PWL) variable cost representation
@@ -58,10 +63,17 @@ from .ThermalConstraints import (
     thermal_add_startup_shutdown_logic_constraint,
     thermal_add_ramps_constraint,
     thermal_add_min_up_down_constraint,
-    thermal_add_reserve_constraint
+    thermal_add_reserve_constraint,
+    thermal_add_tight_capacity_constraint,
+    thermal_add_tight_logic_constraint,
+    thermal_add_tight_ramps_constraint,
+    thermal_add_tight_min_up_down_constraint,
+    thermal_add_perspective_constraint
 )
 from .ThermalObjectives import set_objective_thermo_miqp, set_objective_thermo_pwl
 from .ThermalPieceWise import thermal_add_piecewise_cost
+from .ThermalOuterApproximation import thermal_add_tangent_cost
+from .ThermalSymmetry import orderable_unit_groups, thermal_add_symmetry_breaking_constraint
 from .ThermalDataTypes import ThermalData
 
 
@@ -127,8 +139,8 @@ def build_thermal_uc(
     -----
     - Reserve constraints require that reserve variables r[g, t] 
       are declared during variable creation.
-    - The piecewise linear objective uses SOS2 variables or 
-      McCormick envelopes for convexification.
+    - The piecewise linear objective is an LP epigraph for convex curves
+      and an incremental Piecewise otherwise.
     """
     m = ConcreteModel()
 
@@ -182,9 +194,20 @@ def add_thermal_problem(m: ConcreteModel,
     -----
     - Core constraints include: balance, capacity, startup/shutdown logic,
       ramping, and minimum up/down times.
+    - ``data.formulation == "tight"`` uses the *thermal_add_tight_**
+      builders and continuous start-up/shut-down indicators.
+    - ``data.cost_model == "tangent"`` replaces the quadratic cost with a
+      tangent epigraph on ``m.thermal_Cvar`` (MILP), see
+      *ThermalOuterApproximation*; ``"pwl"`` uses the ``pw_breaks``/
+      ``pw_costs`` curves, as an LP epigraph when convex, see
+      *ThermalPieceWise*.
+    - ``data.perspective`` (quadratic cost only) replaces ``c p²`` with
+      ``c z`` and the cones ``p² <= z u``
+      (*thermal_add_perspective_constraint*).
+    - ``data.symmetry_breaking`` orders identical units without minimum
+      up/down times or binding ramps period by period (*ThermalSymmetry*).
     - When include_reserve=True, a reserve requirement constraint is added.
-    - When objective="pwl" and include_objective=True, piecewise cost
-      variables and constraints are attached along with the linear objective.
+    - objective="pwl" is the same as ``data.cost_model == "pwl"``.
     - When objective="miqp" and include_objective=True, a quadratic
       cost objective is set.
     - This routine assumes that *thermal_add_sets_and_params* and
@@ -202,20 +225,43 @@ def add_thermal_problem(m: ConcreteModel,
     """
 
     thermal_add_sets_and_params(m, data)
-    use_pwl = (objective.lower() == "pwl")
+    use_pwl = (objective.lower() == "pwl" or data.cost_model == "pwl")
+    tight = (data.formulation == "tight")
+    tangent = (data.cost_model == "tangent")
+    perspective = data.perspective and not (use_pwl or tangent)
     thermal_add_variables_uc(
-        m, include_reserve=include_reserve, use_pwl=use_pwl)
-
-    thermal_add_capacity_constraint(m, include_reserve=include_reserve)
-    thermal_add_startup_shutdown_logic_constraint(m)
-    thermal_add_ramps_constraint(m)
-    thermal_add_min_up_down_constraint(m)
+        m, include_reserve=include_reserve, use_pwl=use_pwl or tangent,
+        relax_transitions=tight, perspective=perspective)
+
+    if tight:
+        thermal_add_tight_capacity_constraint(m, include_reserve=include_reserve)
+        thermal_add_tight_logic_constraint(m)
+        thermal_add_tight_ramps_constraint(m)
+        thermal_add_tight_min_up_down_constraint(m)
+    else:
+        thermal_add_capacity_constraint(m, include_reserve=include_reserve)
+        thermal_add_startup_shutdown_logic_constraint(m)
+        thermal_add_ramps_constraint(m)
+        thermal_add_min_up_down_constraint(m)
+
+    if use_pwl:
+        thermal_add_piecewise_cost(m)
+    elif tangent:
+        thermal_add_tangent_cost(m, tangents=data.tangents, tol=data.tangent_tol)
+    elif perspective:
+        thermal_add_perspective_constraint(m)
+
+    if data.symmetry_breaking:
+        thermal_add_symmetry_breaking_constraint(m, orderable_unit_groups(data))
 
     if include_reserve:
         thermal_add_reserve_constraint(m)
 
     if include_objective:
         thermal_add_balance_constraint(m)
-        set_objective_thermo_miqp(m)
+        if use_pwl or tangent:
+            set_objective_thermo_pwl(m)
+        else:
+            set_objective_thermo_miqp(m)
 
     return m
@@ -19,7 +19,8 @@ Two major formulations are supported:
        a * u + b * p + c * p^2 + SC * y + Cdef * D
    
    capturing fixed commitment cost, linear/quadratic variable cost,
-   hot start-up cost, and deficit penalty.
+   hot start-up cost, and deficit penalty. With the perspective
+   reformulation (``m.thermal_z``), ``c * p^2`` is replaced by ``c * z``.
 
 2) Mixed-Integer Linear Programming (MILP) with Piecewise Linear (PWL) cost
    Variable cost represented by linear segments (Piecewise/SOS2).
@@ -86,10 +87,18 @@ def set_objective_thermo_miqp(m):
     - Prefer MIQP when accurate heat-rate curves are important and the solver
       handles convex quadratic objectives efficiently.
     - Ensure convexity: typically *m.thermal_c[g] >= 0* for all *g*.
+    - When the model has *m.thermal_z* (perspective reformulation, see
+      *thermal_add_perspective_constraint*), the quadratic term is
+      *c * z[g,t]*.
     - Check scaling of cost coefficients to avoid numerical issues.
     """
+    def _sq(m, g, t):
+        if hasattr(m, 'thermal_z'):
+            return m.thermal_z[g, t]
+        return m.thermal_p[g, t]**2
+
     def _obj(m):
-        quad = sum(m.thermal_c[g]*(m.thermal_p[g, t]**2) + m.thermal_b[g]*m.thermal_p[g, t] + m.thermal_a[g]*m.thermal_u[g, t]
+        quad = sum(m.thermal_c[g]*_sq(m, g, t) + m.thermal_b[g]*m.thermal_p[g, t] + m.thermal_a[g]*m.thermal_u[g, t]
                    for g in m.TG for t in m.T)
         starts = sum(m.thermal_SC[g]*m.thermal_y[g, t]
                      for g in m.TG for t in m.T)
@@ -138,7 +147,7 @@ def set_objective_thermo_pwl(m):
     -----
     - Prefer PWL when MILP solvers perform better on large instances or when
       granular control of approximation accuracy is desired.
-    - Ensure the PWL construction (breakpoints/SOS2) matches unit operating ranges.
+    - Ensure the PWL breakpoints cover the unit operating ranges.
     - Keep cost units consistent across all terms to maintain a well-scaled model.
     """
     def _obj(m):
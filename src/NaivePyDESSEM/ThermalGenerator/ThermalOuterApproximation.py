@@ -0,0 +1,205 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Thermal Unit Commitment — Outer Approximation of Quadratic Costs
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Replaces the quadratic variable cost ``c p² + b p`` of every thermal unit
+with an epigraph over tangent lines (outer approximation), so the UC
+becomes a MILP solvable by glpk, cbc or HiGHS. With ``K`` tangent points
+``p_k`` spread over ``[Pmin, Pmax]``, each unit and period gets::
+
+    Cvar[g,t] >= (2 c p_k + b) p[g,t] - c p_k² u[g,t],    k = 1..K
+
+The intercept ``-c p_k²`` is multiplied by the commitment, so an offline
+unit (``p = u = 0``) has ``Cvar = 0``. Tangents underestimate a convex
+function, hence the optimum is a lower bound of the MIQP optimum; between
+two equally spaced points ``h`` apart the error is at most ``c h² / 4``
+(at their midpoint).
+
+The number of tangents is ``thermal.tangents`` (per system), or the
+smallest count whose error bound is within ``thermal.tangent_tol``
+($/h) for each unit.
+
+Functions
+---------
+tangent_count(Pmin, Pmax, c, tol)
+    Tangents needed for an error bound of ``tol``.
+tangent_points(Pmin, Pmax, c, tangents, tol)
+    Tangent points of one unit.
+thermal_add_tangent_cost(m, tangents, tol)
+    Add the tangent epigraph of every unit.
+thermal_tangent_error(m)
+    Cost approximation error of a solved model.
+
+Notes
+-----
+- Requires convex costs (``c >= 0``); units with ``c = 0`` get one exact
+  tangent.
+- The objective uses ``a u + Cvar + SC y``; the reports still evaluate
+  the true quadratic cost of the dispatch.
+
+References
+----------
+[1] CEPEL, DESSEM. Manual de Metodologia, 2023
+[2] Duran, M. A.; Grossmann, I. E. An outer-approximation algorithm for a
+    class of mixed-integer nonlinear programs. Mathematical Programming,
+    36, 1986.
+[3] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+import math
+from typing import Dict, List, Optional
+
+from pyomo.environ import Constraint, Set, value
+
+# tangents per unit when neither a count nor a tolerance is given
+DEFAULT_TANGENTS = 10
+
+
+def tangent_count(Pmin: float, Pmax: float, c: float, tol: float) -> int:
+    """
+    Number of equally spaced tangents for an error bound of ``tol``.
+
+    Parameters
+    ----------
+    Pmin, Pmax : float
+        Output range of the unit (MW).
+    c : float
+        Quadratic cost coefficient ($/MW²h).
+    tol : float
+        Maximum cost error ($/h).
+
+    Returns
+    -------
+    int
+        ``1`` for linear costs or a single output level, else the smallest
+        ``K >= 2`` with ``c ((Pmax - Pmin) / (2 (K - 1)))² <= tol``.
+    """
+    if c <= 0.0 or Pmax <= Pmin:
+        return 1
+    return 1 + max(1, math.ceil((Pmax - Pmin) / 2.0 * math.sqrt(c / tol)))
+
+
+def tangent_points(Pmin: float,
+                   Pmax: float,
+                   c: float,
+                   tangents: Optional[int] = None,
+                   tol: Optional[float] = None) -> List[float]:
+    """
+    Tangent points of one unit.
+
+    Parameters
+    ----------
+    Pmin, Pmax : float
+        Output range of the unit (MW).
+    c : float
+        Quadratic cost coefficient ($/MW²h).
+    tangents : int, optional
+        Number of tangents. Ignored when ``tol`` is given.
+    tol : float, optional
+        Maximum cost error ($/h), see :func:`tangent_count`.
+
+    Returns
+    -------
+    list of float
+        Equally spaced points over ``[Pmin, Pmax]`` (both ends included),
+        or ``[Pmax]`` when one tangent is exact.
+    """
+    if tol is not None:
+        K = tangent_count(Pmin, Pmax, c, tol)
+    else:
+        K = DEFAULT_TANGENTS if tangents is None else int(tangents)
+    if c <= 0.0 or Pmax <= Pmin or K <= 1:
+        return [float(Pmax)]
+    step = (Pmax - Pmin) / (K - 1)
+    return [float(Pmin + k * step) for k in range(K)]
+
+
+def thermal_add_tangent_cost(m,
+                             tangents: Optional[int] = None,
+                             tol: Optional[float] = None):
+    """
+    Add the tangent epigraph of the variable cost of every unit.
+
+    Declares ``m.thermal_OA`` (pairs ``(g, k)``), the tangent points
+    ``m.thermal_tangent_points[g]``, their error bounds
+    ``m.thermal_tangent_bound[g]`` ($/h) and
+    ``m.thermal_tangent_constraint[g, k, t]``.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model with thermal parameters and variables, including the cost
+        variable ``m.thermal_Cvar``.
+    tangents : int, optional
+        Tangents per unit (default ``DEFAULT_TANGENTS``).
+    tol : float, optional
+        Maximum cost error ($/h); overrides ``tangents``.
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        The updated model.
+
+    Raises
+    ------
+    ValueError
+        If a unit has a concave cost (``c < 0``).
+    """
+    points: Dict[str, List[float]] = {}
+    bounds: Dict[str, float] = {}
+    coefs = {}
+    for g in m.TG:
+        Pmin, Pmax = value(m.thermal_Pmin[g]), value(m.thermal_Pmax[g])
+        b, c = value(m.thermal_b[g]), value(m.thermal_c[g])
+        if c < 0.0:
+            raise ValueError(f"Thermal unit {g} has a concave cost (c < 0); "
+                             "tangents would cut off feasible costs.")
+        points[g] = tangent_points(Pmin, Pmax, c, tangents, tol)
+        step = (Pmax - Pmin) / (len(points[g]) - 1) if len(points[g]) > 1 else 0.0
+        bounds[g] = c * step ** 2 / 4.0 if c > 0.0 and Pmax > Pmin else 0.0
+        for k, pk in enumerate(points[g], start=1):
+            coefs[g, k] = (2.0 * c * pk + b, -c * pk ** 2)
+
+    m.thermal_tangent_points = points
+    m.thermal_tangent_bound = bounds
+    m.thermal_OA = Set(dimen=2, initialize=sorted(coefs.keys(), key=lambda gk: (str(gk[0]), gk[1])))
+
+    def _tangent(m, g, k, t):
+        slope, intercept = coefs[g, k]
+        return m.thermal_Cvar[g, t] >= slope * m.thermal_p[g, t] + intercept * m.thermal_u[g, t]
+
+    m.thermal_tangent_constraint = Constraint(m.thermal_OA, m.T, rule=_tangent)
+    return m
+
+
+def thermal_tangent_error(m) -> Dict[str, float]:
+    """
+    Cost approximation error of a solved model.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Solved model built with :func:`thermal_add_tangent_cost`.
+
+    Returns
+    -------
+    dict
+        ``max`` (largest ``c p² + b p - Cvar`` over units and periods,
+        $/h), ``total`` (its sum over the horizon, $) and ``bound``
+        (largest a priori error bound, $/h).
+    """
+    errors = [value(m.thermal_c[g] * m.thermal_p[g, t] ** 2
+                    + m.thermal_b[g] * m.thermal_p[g, t]
+                    - m.thermal_Cvar[g, t])
+              for g in m.TG for t in m.T]
+    return {'max': max(errors, default=0.0),
+            'total': sum(errors),
+            'bound': max(m.thermal_tangent_bound.values(), default=0.0)}
@@ -17,9 +17,17 @@ compatible with MILP solvers.
 
 Features
 --------
-- Builds Cvar[g,t] = f(p[g,t]) using Pyomo's *Piecewise* component.
-- Supports convex-combination (SOS2) representation.
-- Enforces equality Cvar[g,t] = C_PWL(p[g,t]).
+- Detects convex curves (non-decreasing segment slopes) and builds them
+  as a pure LP epigraph, one inequality per segment::
+
+      Cvar[g,t] >= s_k p[g,t] + (f(x_k) - s_k x_k) u[g,t]
+
+  with no binaries or SOS2 constraints.
+- Non-convex curves fall back to Pyomo's *Piecewise* component with the
+  incremental ('INC') representation, enforcing Cvar[g,t] = C_PWL(p[g,t]).
+  Its LP relaxation is ideal for one curve and, on the UC test cases, it
+  solved faster than the logarithmic ('LOG') and convex combination
+  ('CC') representations.
 - Allows unit-specific breakpoints (pw_breaks[g]) and cost values
   (pw_costs[g]) for accurate curve fitting.
 
@@ -27,10 +35,11 @@ Requirements
 ------------
 - A Pyomo model with:
 
-    * m.p[g,t]   : generation variable (MW)
-    * m.Cvar[g,t]: PWL cost variable (R$/h)
-    * m.pw_breaks[g], m.pw_costs[g] defined as lists of (x, f(x))
-      points per unit g.
+    * m.thermal_p[g,t]   : generation variable (MW)
+    * m.thermal_u[g,t]   : commitment variable
+    * m.thermal_Cvar[g,t]: PWL cost variable (R$/h)
+    * m.thermal_pw_breaks[g], m.thermal_pw_costs[g] defined as lists of
+      (x, f(x)) points per unit g.
 
 Usage
 -----
@@ -42,64 +51,159 @@ Example
 pw_breaks = [0, 150, 300, 455]
 pw_costs  = [0, 2500, 6000, 10000]
 
-Cvar[g,t] is constrained such that:
+The slopes (16.7, 23.3, 25.8) are non-decreasing, so Cvar[g,t] is bounded
+below by the three segment lines instead of a Piecewise component.
 
-    Cvar[g,t] = Piecewise(p[g,t]; pw_breaks, pw_costs)
+Notes
+-----
+- An offline unit (p = u = 0) has no variable cost: the epigraph
+  intercepts are multiplied by u, and a curve starting at 0 must have
+  zero cost there. The no-load cost belongs in ``a``.
+- The epigraph extends the first and last segments beyond the breakpoints;
+  the breakpoints must cover the output range of the unit.
 
 References
 ----------
 [1] CEPEL, DESSEM. Manual de Metodologia, 2023  
 [2] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+[3] Vielma, J. P.; Ahmed, S.; Nemhauser, G. Mixed-integer models for
+    nonseparable piecewise-linear optimization: unifying framework and
+    extensions. Operations Research, 58(2), 2010.
 """
 
-from pyomo.environ import Piecewise, Constraint
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pyomo.environ import Piecewise, Constraint, Reference, Set, value
+
+# relative tolerance of the slope comparison in the convexity test
+CONVEXITY_TOL = 1e-9
+
+# Pyomo representation of non-convex curves
+PWL_FALLBACK_REPN = 'INC'
+
+
+def pwl_slopes(xpts: Sequence[float], ypts: Sequence[float]) -> List[float]:
+    """
+    Slopes of the segments of a piecewise-linear curve.
+
+    Parameters
+    ----------
+    xpts : sequence of float
+        Strictly increasing breakpoints (MW).
+    ypts : sequence of float
+        Cost at each breakpoint ($/h).
+
+    Returns
+    -------
+    list of float
+        ``(y[k+1] - y[k]) / (x[k+1] - x[k])`` for each segment.
+    """
+    return [(ypts[k + 1] - ypts[k]) / (xpts[k + 1] - xpts[k])
+            for k in range(len(xpts) - 1)]
+
+
+def pwl_is_convex(xpts: Sequence[float],
+                  ypts: Sequence[float],
+                  tol: float = CONVEXITY_TOL) -> bool:
+    """
+    Whether a piecewise-linear curve is convex.
+
+    Parameters
+    ----------
+    xpts : sequence of float
+        Strictly increasing breakpoints (MW).
+    ypts : sequence of float
+        Cost at each breakpoint ($/h).
+    tol : float, optional
+        Relative tolerance on the slope differences.
+
+    Returns
+    -------
+    bool
+        True when the segment slopes are non-decreasing.
+    """
+    slopes = pwl_slopes(xpts, ypts)
+    scale = max((abs(s) for s in slopes), default=0.0)
+    return all(s1 >= s0 - tol * max(scale, 1.0)
+               for s0, s1 in zip(slopes, slopes[1:]))
+
+
+def pwl_segments(xpts: Sequence[float],
+                 ypts: Sequence[float]) -> List[Tuple[float, float]]:
+    """
+    Lines ``(slope, intercept)`` of the segments of a curve.
+
+    Parameters
+    ----------
+    xpts : sequence of float
+        Strictly increasing breakpoints (MW).
+    ypts : sequence of float
+        Cost at each breakpoint ($/h).
+
+    Returns
+    -------
+    list of tuple
+        ``(s_k, f(x_k) - s_k x_k)`` for each segment.
+    """
+    return [(s, ypts[k] - s * xpts[k])
+            for k, s in enumerate(pwl_slopes(xpts, ypts))]
 
 
-def thermal_add_piecewise_cost(m):
+def thermal_add_piecewise_cost(m, pw_repn: Optional[str] = None):
     """
-    Add piecewise-linear generation cost expression Cvar[g,t] = C_PWL_g(p[g,t]).
+    Add piecewise-linear generation cost Cvar[g,t] >= C_PWL_g(p[g,t]).
 
-    For each thermal unit g and time period t, this function constructs a
-    piecewise-linear (PWL) cost expression using predefined breakpoints
-    and cost values. The implementation uses the 'CC' (convex combination)
-    method with equality enforcement.
+    For each thermal unit g and time period t, this function bounds the
+    cost variable by the piecewise-linear (PWL) curve of the unit. Convex
+    curves become an LP epigraph (one inequality per segment); non-convex
+    curves use a Pyomo *Piecewise* component with equality enforcement.
 
-    Requirements
-    ------------
+    Parameters
+    ----------
     m : pyomo.environ.ConcreteModel
         The Pyomo model must include:
 
-            - m.Cvar[g, t] : cost variable
-            - m.p[g, t] : power generation variable
+            - m.thermal_Cvar[g, t] : cost variable
+            - m.thermal_p[g, t] : power generation variable
+            - m.thermal_u[g, t] : commitment variable
+            - m.thermal_Pmax[g] : maximum output
             - m.thermal_pw_breaks[g] : list of breakpoints (strictly increasing)
             - m.thermal_pw_costs[g] : list of corresponding cost values
+    pw_repn : str, optional
+        Pyomo representation ('CC', 'DCC', 'INC', 'LOG', ...) used for
+        every unit, convex or not. By default convex curves use the
+        epigraph and the others ``PWL_FALLBACK_REPN``.
 
     Raises
     ------
     ValueError
-        If a unit g has undefined or mismatched `pw_breaks` and `pw_costs`.
+        If a unit g has undefined or mismatched `pw_breaks` and `pw_costs`,
+        fewer than two points or breakpoints that are not strictly
+        increasing.
 
     Returns
     -------
     ConcreteModel
-        The modified model with one Piecewise component per unit.
+        The modified model.
 
     Notes
     -----
-    - Each unit g must define a consistent pair of lists: `pw_breaks[g]` and
-      `pw_costs[g]`, with identical length.
-    - Internally, the function uses `pyomo.environ.Piecewise` with:
-        - Index set: model.T
-        - Representation: 'CC' (convex combination with SOS2 variables)
-        - Constraint type: 'EQ' (enforces equality between cost and function value)
-    - Each unit g receives a component named 'pw_{g}'.
+    - Convex units are listed in ``m.thermal_PW`` (pairs ``(g, k)``, one
+      per segment) and constrained by ``m.thermal_pw_constraint[g, k, t]``;
+      ``m.thermal_pw_convex[g]`` records the test of each unit.
+    - Every other unit receives a component named 'thermal_pw_{g}'
+      indexed by model.T with constraint type 'EQ'. Its domain must be
+      bounded, so ``p[g, t]`` gets the upper bound ``Pmax`` and the curve
+      gets the point ``(0, 0)`` when it starts above zero.
 
     Examples
     --------
     >>> model = thermal_add_piecewise_cost(model)
-    >>> model.pw_G1.pprint()
-    Piecewise component for thermal unit G1 over time.
+    >>> model.thermal_pw_constraint.pprint()
+    Segment inequalities of the convex units over time.
     """
+    curves: Dict[str, Tuple[List[float], List[float]]] = {}
+    convex: Dict[str, bool] = {}
     for g in m.TG:
         xpts = m.thermal_pw_breaks[g]
         ypts = m.thermal_pw_costs[g]
@@ -108,17 +212,44 @@ def thermal_add_piecewise_cost(m):
         if len(xpts) != len(ypts):
             raise ValueError(
                 f"PWL inconsistente em {g}: len(breaks)!=len(costs).")
-        # Uma Piecewise por (g,t) para permitir curvas distintas por unidade
-        comp_name = f"pw_{g}"
-        setattr(m, comp_name, Piecewise(
+        if len(xpts) < 2 or any(x1 <= x0 for x0, x1 in zip(xpts, xpts[1:])):
+            raise ValueError(
+                f"PWL inválida em {g}: são necessários ao menos dois "
+                "breaks estritamente crescentes.")
+        curves[g] = ([float(x) for x in xpts], [float(y) for y in ypts])
+        convex[g] = pw_repn is None and pwl_is_convex(*curves[g])
+
+    m.thermal_pw_convex = convex
+    coefs = {(g, k): line
+             for g in m.TG if convex[g]
+             for k, line in enumerate(pwl_segments(*curves[g]), start=1)}
+    m.thermal_PW = Set(dimen=2, initialize=sorted(coefs.keys(), key=lambda gk: (str(gk[0]), gk[1])))
+
+    def _segment(m, g, k, t):
+        slope, intercept = coefs[g, k]
+        return m.thermal_Cvar[g, t] >= slope * m.thermal_p[g, t] + intercept * m.thermal_u[g, t]
+
+    m.thermal_pw_constraint = Constraint(m.thermal_PW, m.T, rule=_segment)
+
+    for g in m.TG:
+        if convex[g]:
+            continue
+        xpts, ypts = curves[g]
+        if xpts[0] > 0.0:
+            # p = 0 quando desligada deve estar no domínio
+            xpts, ypts = [0.0] + xpts, [0.0] + ypts
+        for t in m.T:
+            m.thermal_p[g, t].setub(min(value(m.thermal_Pmax[g]), xpts[-1]))
+        # Uma Piecewise por unidade para permitir curvas distintas
+        setattr(m, f"thermal_pw_{g}", Piecewise(
             m.T,  # index set
-            # y_var indexed: Cvar[g,t]
-            vardata={(t): m.Cvar[g, t] for t in m.T},
-            # x_var indexed: p[g,t]
-            input={(t): m.p[g, t] for t in m.T},
+            # y_var indexed by t: Cvar[g,t]
+            Reference(m.thermal_Cvar[g, :]),
+            # x_var indexed by t: p[g,t]
+            Reference(m.thermal_p[g, :]),
             pw_pts=xpts,
             pw_constr_type='EQ',   # igualdade custo = f(p)
             f_rule=ypts,           # valores de custo nos pontos
-            pw_repn='CC'           # convex combination (usa SOS2)
+            pw_repn=pw_repn or PWL_FALLBACK_REPN
         ))
     return m
@@ -0,0 +1,146 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Thermal Unit Commitment — Identical-Unit Symmetry Breaking
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Thermal fleets often contain identical units. Their schedules can be
+swapped without changing the cost, so branch-and-bound explores every
+permutation of them. This module detects identical units in a
+``ThermalData`` (every ``ThermalUnit`` field except the name, including
+the bus and the initial state) and orders the groups period by period::
+
+    u[g_i, t] >= u[g_{i+1}, t]
+
+Only groups without intertemporal coupling are ordered: ``t_up = t_down
+= 1`` and ramps that cannot bind (``RU, RD >= Pmax - Pmin`` and ``SU,
+SD >= Pmax``). For those units, reassigning the on-states and outputs of
+each period to the first units of the group keeps every row feasible and
+never increases the number of start-ups, so the optimum is kept. The
+units keep their own variables, hence the per-unit schedules are
+available for reporting as usual.
+
+Functions
+---------
+identical_unit_groups(data)
+    Groups of identical units of a ``ThermalData``.
+orderable_unit_groups(data)
+    Identical groups that can be ordered period by period.
+thermal_add_symmetry_breaking_constraint(m, groups)
+    Order the units of each group period by period.
+
+Notes
+-----
+- With minimum up/down times or binding ramps a unit's schedule cannot
+  be split between periods, and no ordering rows are added for it. An
+  order of whole schedules by committed periods is valid there, but it
+  slowed HiGHS down on the tested cases.
+- Enabled by ``thermal.symmetry_breaking: true``.
+
+References
+----------
+[1] CEPEL, DESSEM. Manual de Metodologia, 2023
+[2] Ostrowski, J.; Anjos, M. F.; Vannelli, A. Symmetry in scheduling
+    problems. Cahier du GERAD G-2010-69, 2010.
+[3] Unsihuay Vila, C. Introdução aos Sistemas de Energia Elétrica, Lecture Notes, EELT7030/UFPR, 2023.
+"""
+
+from dataclasses import astuple, replace
+from typing import Dict, List
+
+from pyomo.environ import Constraint, Set
+
+from .ThermalDataTypes import ThermalData
+
+
+def identical_unit_groups(data: ThermalData) -> List[List[str]]:
+    """
+    Groups of identical units of a ``ThermalData``.
+
+    Parameters
+    ----------
+    data : ThermalData
+        Thermal system data.
+
+    Returns
+    -------
+    list of list of str
+        Unit names of every group with two or more identical units, in the
+        order of ``data.units``.
+    """
+    groups: Dict[str, List[str]] = {}
+    for name, unit in data.units.items():
+        key = repr(astuple(replace(unit, name="")))
+        groups.setdefault(key, []).append(name)
+    return [names for names in groups.values() if len(names) > 1]
+
+
+def _period_orderable(unit) -> bool:
+    """
+    Whether a unit has no minimum up/down time and no binding ramp.
+    """
+    su = unit.Pmax if unit.SU is None else unit.SU
+    sd = unit.Pmax if unit.SD is None else unit.SD
+    return (unit.t_up <= 1 and unit.t_down <= 1
+            and unit.RU >= unit.Pmax - unit.Pmin
+            and unit.RD >= unit.Pmax - unit.Pmin
+            and su >= unit.Pmax and sd >= unit.Pmax)
+
+
+def orderable_unit_groups(data: ThermalData) -> List[List[str]]:
+    """
+    Identical groups that can be ordered period by period.
+
+    Parameters
+    ----------
+    data : ThermalData
+        Thermal system data.
+
+    Returns
+    -------
+    list of list of str
+        The groups of :func:`identical_unit_groups` whose units have
+        ``t_up = t_down = 1`` and ramps (``RU``, ``RD``, ``SU``, ``SD``)
+        that cannot bind.
+    """
+    return [names for names in identical_unit_groups(data)
+            if _period_orderable(data.units[names[0]])]
+
+
+def thermal_add_symmetry_breaking_constraint(m, groups: List[List[str]]):
+    """
+    Order the units of each identical group period by period.
+
+    Declares ``m.thermal_SYM`` (pairs ``(g_i, g_{i+1})`` of consecutive
+    units of a group), ``m.thermal_identical_groups`` and
+    ``m.thermal_symmetry_constraint[g_i, g_{i+1}, t]``.
+
+    Parameters
+    ----------
+    m : pyomo.environ.ConcreteModel
+        Model with thermal sets and the commitment variable
+        ``m.thermal_u``.
+    groups : list of list of str
+        Groups of identical units without intertemporal coupling, see
+        :func:`orderable_unit_groups`.
+
+    Returns
+    -------
+    pyomo.environ.ConcreteModel
+        The updated model.
+    """
+    m.thermal_identical_groups = [list(names) for names in groups]
+    pairs = [(g, h) for names in groups for g, h in zip(names, names[1:])]
+    m.thermal_SYM = Set(dimen=2, initialize=pairs, ordered=True)
+
+    def _order(m, g, h, t):
+        return m.thermal_u[g, t] >= m.thermal_u[h, t]
+
+    m.thermal_symmetry_constraint = Constraint(m.thermal_SYM, m.T, rule=_order)
+    return m
@@ -25,6 +25,7 @@ Features
     * SC          : start-up (hot) cost
     * t_up, t_dn  : minimum up/down times
     * u0, p0      : initial commitment state and output
+    * SU, SD      : start-up / shut-down ramp limits (default Pmax)
 - Optional system-wide parameters:
     * Rreq[t]     : spinning reserve requirement
     * gamma[g]    : emissions factor
@@ -39,8 +40,8 @@ Variables
 - r[g,t] : reserve (MW, optional)
 - Cvar[g,t] : variable cost in PWL formulations (optional)
 - u[g,t] : on/off state (binary)
-- y[g,t] : start-up indicator (binary)
-- w[g,t] : shut-down indicator (binary)
+- y[g,t] : start-up indicator (binary; continuous in [0, 1] in the tight formulation)
+- w[g,t] : shut-down indicator (binary; continuous in [0, 1] in the tight formulation)
 
 Usage
 -----
@@ -57,7 +58,7 @@ References
 """
 
 from pyomo.environ import (ConcreteModel, RangeSet, Set, Param, Var,
-                           NonNegativeReals, Binary, Reals)
+                           NonNegativeReals, Binary, Reals, UnitInterval)
 from .ThermalDataTypes import ThermalData
 
 def thermal_add_sets_and_params(m: ConcreteModel, 
@@ -140,6 +141,11 @@ def thermal_add_sets_and_params(m: ConcreteModel,
     m.thermal_u0 = Param(m.TG, initialize={g: data.units[g].u0 for g in G})
     m.thermal_p0 = Param(m.TG, initialize={g: data.units[g].p0 for g in G})
     m.thermal_init_status = Param(m.TG, initialize={g: data.units[g].init_status_h for g in G})
+    m.thermal_SU = Param(m.TG, initialize={g: data.units[g].Pmax if data.units[g].SU is None
+                                           else data.units[g].SU for g in G})
+    m.thermal_SD = Param(m.TG, initialize={g: data.units[g].Pmax if data.units[g].SD is None
+                                           else data.units[g].SD for g in G})
+    m.thermal_formulation = data.formulation
     m.thermal_bars = {g: data.units[g].bar for g in G}
     
     if data.Rreq is not None:
@@ -151,7 +157,9 @@ def thermal_add_sets_and_params(m: ConcreteModel,
     return m
 
 
-def thermal_add_variables_uc(m, include_reserve: bool = False, use_pwl: bool = False):
+def thermal_add_variables_uc(m, include_reserve: bool = False, use_pwl: bool = False,
+                             relax_transitions: bool = False,
+                             perspective: bool = False):
     """
     Declares decision variables for the thermal Unit Commitment (UC) model.
 
@@ -168,6 +176,13 @@ def thermal_add_variables_uc(m, include_reserve: bool = False, use_pwl: bool = F
     use_pwl : bool, optional
         If True, piecewise linear cost variables **m.Cvar[g, t]** 
         are created (default False).
+    relax_transitions : bool, optional
+        If True, the start-up and shut-down indicators are continuous in
+        [0, 1] (default False). Only valid with the tight minimum up/down
+        rows, which make them integral whenever **m.u** is.
+    perspective : bool, optional
+        If True, the squared output variables **m.thermal_z[g, t]** of the
+        perspective cost are created (default False).
 
     Returns
     -------
@@ -179,6 +194,7 @@ def thermal_add_variables_uc(m, include_reserve: bool = False, use_pwl: bool = F
           * **m.D[t]** : deficit [MW].
           * **m.r[g, t]** : reserve [MW], optional.
           * **m.Cvar[g, t]** : piecewise cost variable, optional.
+          * **m.thermal_z[g, t]** : squared output [MW²], optional.
 
         - Binary:
 
@@ -212,7 +228,8 @@ def thermal_add_variables_uc(m, include_reserve: bool = False, use_pwl: bool = F
     - **Advantages**: Converts quadratic costs to MILP form; exploits strong
       LP relaxations; often faster and more scalable on large systems.
     - **Trade-offs**: Approximation error unless sufficient breakpoints are
-      used; adds SOS2 or convex-combination variables, increasing model size.
+      used; convex curves add one inequality per segment, non-convex ones
+      add incremental binaries, increasing model size.
     - **Guidance**: Use when quadratic costs cannot be handled efficiently
       by the chosen solver, or when MILP-only solvers are required.
     """
@@ -226,8 +243,13 @@ def thermal_add_variables_uc(m, include_reserve: bool = False, use_pwl: bool = F
         # custo variável PWL por (g,t)
         m.thermal_Cvar = Var(m.TG, m.T, domain=NonNegativeReals)
 
+    if perspective:
+        # z >= p²/u (custo quadrático em perspectiva)
+        m.thermal_z = Var(m.TG, m.T, domain=NonNegativeReals)
+
     # Binárias
     m.thermal_u = Var(m.TG, m.T, domain=Binary)  # ligada
-    m.thermal_y = Var(m.TG, m.T, domain=Binary)  # start
-    m.thermal_w = Var(m.TG, m.T, domain=Binary)  # stop
+    transition = UnitInterval if relax_transitions else Binary
+    m.thermal_y = Var(m.TG, m.T, domain=transition)  # start
+    m.thermal_w = Var(m.TG, m.T, domain=transition)  # stop
     return m
@@ -27,7 +27,11 @@ ThermalConstraints
 ThermalObjectives
     Objective function definitions (quadratic and piecewise-linear).
 ThermalPiecewiseCost
-    Utilities for building piecewise-linear cost functions.
+    Piecewise-linear costs (LP epigraph for convex curves).
+ThermalOuterApproximation
+    Tangent-line (outer approximation) epigraph of quadratic costs.
+ThermalSymmetry
+    Detection of identical units and symmetry-breaking constraints.
 ThermalBuilder
     High-level routines to assemble complete thermal generation models.
 
@@ -49,4 +53,6 @@ from .ThermalEquations import *
 from .ThermalGeneratorBuilder import *
 from .ThermalObjectives import *
 from .ThermalPieceWise import *
+from .ThermalOuterApproximation import *
+from .ThermalSymmetry import *
 from .ThermalVars import *
\ No newline at end of file
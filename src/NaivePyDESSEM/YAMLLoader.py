@@ -32,6 +32,9 @@ pre_process(config_dict, transform_names=True)
 yaml_loader(file, transform_names=True)
     Load a YAML file and return a processed configuration dictionary suitable
     for model building.
+case_fingerprint(config_dict)
+    Stable SHA-256 digest of a configuration dictionary, used to tag files
+    derived from a case (cuts, checkpoints, caches).
 
 Notes
 -----
@@ -55,6 +58,8 @@ References
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 from typing import Any, Dict
 import yaml
 
@@ -296,3 +301,31 @@ def yaml_loader(file: str, *, transform_names: bool = True) -> Dict[str, Any]:
     if data is None:
         raise ValueError("Arquivo YAML vazio ou inválido.")
     return pre_process(data, transform_names=transform_names)
+
+
+def case_fingerprint(config_dict: Dict[str, Any]) -> str:
+    """
+    Compute a stable fingerprint of a configuration dictionary.
+
+    The dictionary is serialized as canonical JSON (sorted keys, no
+    whitespace) and hashed, so two cases share a fingerprint if and only if
+    they hold the same data, regardless of the key order in the file.
+
+    Parameters
+    ----------
+    config_dict : dict
+        Configuration dictionary, typically the output of :func:`yaml_loader`.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest.
+
+    Examples
+    --------
+    >>> case_fingerprint({"meta": {"horizon": 12}})[:8]
+    'f62b2fba'
+    """
+    payload = json.dumps(config_dict, sort_keys=True, separators=(",", ":"),
+                         default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -57,10 +57,18 @@ YAMLLoader
     Provides the interface for loading problem instances from structured YAML or JSON files,
     including validation and conversion into dataclass objects.
 
+TerminalCost
+    Reads Benders cuts written by the PDDD solver of NaivePyDECOMP and adds them
+    as a terminal future cost function over the final volumes and energies.
+
 Builder
     Constructs a complete Pyomo model from the YAML data, invoking the appropriate
     subsystems and assembling the balance constraint and cost-minimizing objective.
 
+SolverSession
+    Shared solver layer: pooled solver handles, cached availability, normalized
+    ``Solver_Options`` and automatic use of in-process solver APIs (e.g. highspy).
+
 Solver
     Handles the selection and execution of solvers (e.g., GLPK, IPOPT, MindtPy),
     with optional reporting and solution validation.
@@ -106,5 +114,7 @@ from .ModelCheck import *
 from .ModelFormatters import *
 from .Reporting import *
 from .YAMLLoader import *
+from .TerminalCost import *
 from .Builder import *
+from .SolverSession import *
 from .Solver import *
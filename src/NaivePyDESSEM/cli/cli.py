@@ -39,6 +39,7 @@ Dependencies
 Usage
 -----
 $ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx
+$ python cli.py case.yaml --out_dir results --out_file dispatch.xlsx --terminal_fcf cuts.npz --fcf_stage 0
 
 References
 ----------
@@ -137,12 +138,20 @@ def main():
                         help="Output directory for results")
     parser.add_argument("--out_file", required=True,
                         help="Output file name with extension (.csv, .xlsx, .parquet)")
+    parser.add_argument("--terminal_fcf", default=None,
+                        help="Cut file (.npz) used as the future cost function at the end of the horizon")
+    parser.add_argument("--fcf_stage", type=int, default=0,
+                        help="Stage of the cut file whose cuts are used (default: 0)")
     args = parser.parse_args()
 
     os.makedirs(args.out_dir, exist_ok=True)
     output_path = os.path.join(args.out_dir, args.out_file)
 
-    model, data = solve(args.yaml)
+    terminal_fcf = None
+    if args.terminal_fcf:
+        terminal_fcf = {'file': args.terminal_fcf, 'stage': args.fcf_stage}
+
+    model, data = solve(args.yaml, terminal_fcf=terminal_fcf)
     df = build_dispatch_dataframe(model)
     df[abs(df) < 1e-3] = 0.0
     save_dataframe(df, output_path)
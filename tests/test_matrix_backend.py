@@ -0,0 +1,49 @@
+"""
+EELT 7030 — Operation and Expansion Planning of Electric Power Systems
+Federal University of Paraná (UFPR)
+
+Tests — Matrix Backend Equivalence
+
+Author
+------
+Augusto Mathias Adams <augusto.adams@ufpr.br>
+
+Description
+-----------
+Checks that the matrix backend of NaivePyDECOMP reproduces the Pyomo model
+on the bundled DECOMP cases: the matrix optimum must be feasible for the
+Pyomo constraints and both objectives must agree. The cases are solved
+with HiGHS (the matrix backend solver), so the tests are skipped when
+``highspy`` is not installed.
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+pytest.importorskip("highspy")
+
+from NaivePyDECOMP.MatrixBuilder import check_matrix_equivalence  # noqa: E402
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+CASES = sorted((EXAMPLES / "DECOMP").glob("*.yaml")) + [
+    EXAMPLES / "TRANSMISSION_LINES" / "decomp.yaml"
+]
+TOL = 1e-6
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda p: f"{p.parent.name}/{p.name}")
+def test_matrix_backend_matches_pyomo(case, tmp_path):
+    with open(case, encoding="utf-8") as f:
+        root = yaml.safe_load(f)
+    root["meta"]["Solver"] = "highs"
+    path = tmp_path / case.name
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(root, f, sort_keys=False, allow_unicode=True)
+
+    report = check_matrix_equivalence(str(path), tol=TOL)
+
+    assert report["equivalent"], report
+    assert report["objective_gap"] <= TOL
+    assert report["max_violation"] <= TOL * max(1.0, abs(report["objective_pyomo"]))